@@ -1,6 +1,6 @@
-from typing import Literal
+from typing import Dict, List, Literal, Optional
 from functools import lru_cache
-from pydantic import field_validator
+from pydantic import field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -8,6 +8,25 @@ class Settings(BaseSettings):
     ENV: Literal["test", "dev", "prod"] = "dev"
     LOG_LEVEL: Literal["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "TRACE"] = "INFO"
     DB_URL: str = ""
+    DB_BACKEND: Literal["sql", "memory"] = "sql"
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = -1
+    DB_POOL_PRE_PING: bool = False
+    DB_STATEMENT_CACHE_SIZE: Optional[int] = None
+    DB_SERVER_SETTINGS: Dict[str, str] = {}
+    DB_TRANSACTION_POOLER: bool = False
+    DB_PIPELINE: bool = False
+    DB_REPLICA_URLS: List[str] = []
+    DB_REPLICA_STRATEGY: Literal["round_robin", "least_connections"] = "round_robin"
+    DB_REPLICA_MAX_LAG_SECONDS: Optional[float] = 5.0
+    DB_REPLICA_CHECK_SECONDS: float = 5.0
+    DB_SHARD_URLS: List[str] = []
+    DB_SQLITE_READERS: int = 4
+    DB_SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    DB_SQLITE_CACHE_SIZE_KB: int = 64 * 1024
+    DB_SQLITE_BUSY_TIMEOUT_MS: int = 5000
     APP_DEBUG: bool = True
     APP_DESCRIPTION: str = "Clean Architecture Python Backend Template"
     APP_TITLE: str = "Python Template"
@@ -18,6 +37,26 @@ class Settings(BaseSettings):
     JWT_SECRET_KEY: str = "unsafe"
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    JWT_CLAIMS_CACHE_SIZE: int = 1024
+    JWT_REFRESH_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7
+    JWT_REVOCATION_FILTER_CAPACITY: int = 100_000
+    JWT_REVOCATION_SYNC_SECONDS: float = 30.0
+    JWT_STATELESS_CURRENT_USER: bool = False
+    HASHER_EXECUTOR: Literal["auto", "process", "thread"] = "auto"
+    HASHER_WORKERS: Optional[int] = None
+    HASHER_MAX_IN_FLIGHT: Optional[int] = None
+    HASHER_MAX_QUEUE: int = 64
+    HASHER_BCRYPT_ROUNDS: Optional[int] = None
+    HASHER_BCRYPT_MIN_ROUNDS: int = 10
+    HASHER_TARGET_VERIFY_MS: Optional[float] = None
+    AUTH_CREDENTIAL_CACHE_ENABLED: bool = False
+    AUTH_CREDENTIAL_CACHE_TTL_SECONDS: float = 5.0
+    AUTH_CREDENTIAL_CACHE_MAX_SIZE: int = 1024
+    API_KEY_CACHE_TTL_SECONDS: float = 60.0
+    API_KEY_CACHE_MAX_SIZE: int = 1024
+    AUTH_INTROSPECT_MAX_TOKENS: int = 100
+    USER_IMPORT_BATCH_SIZE: int = 1000
+    USER_IMPORT_HASH_CONCURRENCY: int = 4
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
     @field_validator("DB_URL")
@@ -27,6 +66,23 @@ class Settings(BaseSettings):
             raise ValueError("Database URL cannot be empty")
         return db_url
 
+    @model_validator(mode="after")
+    def check_transaction_pooler(self):
+        # Transaction poolers only replay these startup parameters on each server connection
+        tracked = {
+            "application_name",
+            "client_encoding",
+            "datestyle",
+            "intervalstyle",
+            "timezone",
+        }
+        untracked = {key for key in self.DB_SERVER_SETTINGS if key.lower() not in tracked}
+        if self.DB_TRANSACTION_POOLER and untracked:
+            raise ValueError(
+                f"Server settings {sorted(untracked)} would not survive a transaction pooler"
+            )
+        return self
+
 
 @lru_cache()
 def get_settings() -> Settings:
@@ -1,4 +1,7 @@
 from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from app.core.dtos.user import UserResponse
 
 
 @dataclass(frozen=True)
@@ -6,3 +9,33 @@ class TokenResponse:
     expire: float
     access_token: str
     token_type: str = "bearer"
+    refresh_token: Optional[str] = None
+
+
+@dataclass(frozen=True, kw_only=True)
+class CreateApiKeyRequest:
+    name: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class ApiKeyResponse:
+    id: str
+    name: str
+    key: str
+
+
+@dataclass(frozen=True)
+class IntrospectRequest:
+    tokens: List[str]
+
+
+@dataclass(frozen=True, kw_only=True)
+class TokenIntrospection:
+    active: bool
+    claims: Optional[Dict[str, Any]] = None
+    user: Optional[UserResponse] = None
+
+
+@dataclass(frozen=True)
+class IntrospectResponse:
+    results: List[TokenIntrospection]
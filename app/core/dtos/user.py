@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -24,3 +24,27 @@ class UpdateUser:
     def __post_init__(self):
         if not self.name and not self.email:
             raise ValueError("At least one field must be provided")
+
+
+@dataclass(frozen=True, kw_only=True)
+class ImportUserRow:
+    line: int
+    name: str
+    email: str
+    password: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class ImportRowError:
+    line: int
+    error: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class ImportProgress:
+    """Running totals of an import, with the errors of its latest batch."""
+
+    rows: int
+    imported: int
+    rejected: int
+    errors: List[ImportRowError]
@@ -29,3 +29,9 @@ class InvalidUserError(DomainException):
     """Raised when user data is invalid."""
 
     pass
+
+
+class HasherOverloadedError(DomainException):
+    """Raised when the password hashing backlog exceeds its budget."""
+
+    pass
@@ -0,0 +1,37 @@
+from typing import Optional, Protocol
+
+from app.core.dtos.user import UserResponse
+
+
+class CredentialCache(Protocol):
+    """Protocol for short-lived caching of successfully verified credentials."""
+
+    def get(self, email: str, password: str) -> Optional[UserResponse]:
+        """Get the user recently authenticated with these credentials.
+
+        Args:
+            email: User email
+            password: Plain text password
+
+        Returns:
+            The authenticated user if cached, None otherwise
+        """
+        ...
+
+    def put(self, email: str, password: str, user: UserResponse) -> None:
+        """Remember credentials that were just verified.
+
+        Args:
+            email: User email
+            password: Plain text password
+            user: The authenticated user
+        """
+        ...
+
+    def invalidate(self, user_id: str) -> None:
+        """Forget every cached credential of a user.
+
+        Args:
+            user_id: User ID
+        """
+        ...
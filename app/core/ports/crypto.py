@@ -26,3 +26,58 @@ class Hasher(Protocol):
             True if the value matches the hash, False otherwise
         """
         ...
+
+    def needs_update(self, hashed: str) -> bool:
+        """Check whether a hash was made with outdated parameters.
+
+        Args:
+            hashed: Hashed value to inspect
+
+        Returns:
+            True if the value should be rehashed with the current parameters
+        """
+        ...
+
+
+class AsyncHasher(Protocol):
+    """Protocol for password hashing operations that run off the event loop."""
+
+    async def hash(self, value: str) -> str:
+        """Hash a plain text value.
+
+        Args:
+            value: Plain text to hash
+
+        Returns:
+            Hashed value
+
+        Raises:
+            HasherOverloadedError: If the hashing backlog is over its budget
+        """
+        ...
+
+    async def verify(self, value: str, hashed: str) -> bool:
+        """Verify a plain text value against a hash.
+
+        Args:
+            value: Plain text to verify
+            hashed: Hashed value to compare against
+
+        Returns:
+            True if the value matches the hash, False otherwise
+
+        Raises:
+            HasherOverloadedError: If the hashing backlog is over its budget
+        """
+        ...
+
+    def needs_update(self, hashed: str) -> bool:
+        """Check whether a hash was made with outdated parameters.
+
+        Args:
+            hashed: Hashed value to inspect
+
+        Returns:
+            True if the value should be rehashed with the current parameters
+        """
+        ...
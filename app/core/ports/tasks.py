@@ -0,0 +1,14 @@
+from typing import Any, Awaitable, Callable, Protocol
+
+
+class TaskScheduler(Protocol):
+    """Protocol for deferring work until after the current request is answered."""
+
+    def schedule(self, func: Callable[..., Awaitable[Any]], *args: Any) -> None:
+        """Schedule a coroutine function to run later.
+
+        Args:
+            func: Coroutine function to run
+            args: Positional arguments passed to func
+        """
+        ...
@@ -1,14 +1,41 @@
-from typing import Optional, Protocol
+from typing import List, Optional, Protocol, Sequence
 
+from app.core.dtos.user import UserResponse
 from app.core.entities.user import User
 from app.core.value_objects.email import Email
 from app.core.ports.unit_of_work import UnitOfWork
 from app.core.value_objects.id import ID
+from app.core.value_objects.password import Password
 
 
 class UserRepo(Protocol):
     """Protocol for user repository operations."""
 
+    async def create(self, user: User) -> UserResponse:
+        """Create a new user, unless its email is taken.
+
+        Args:
+            user: User entity to create
+
+        Returns:
+            The created user's public fields
+
+        Raises:
+            UserAlreadyExistsError: If a user with the same email exists
+        """
+        ...
+
+    async def create_many(self, users: Sequence[User]) -> List[Email]:
+        """Create users in bulk, skipping those whose email is taken.
+
+        Args:
+            users: User entities to create, with distinct emails
+
+        Returns:
+            Emails of the users that were skipped
+        """
+        ...
+
     async def save(self, user: User) -> None:
         """Save a new user.
 
@@ -28,6 +55,39 @@ class UserRepo(Protocol):
         """
         ...
 
+    async def get_many_by_ids(self, ids: Sequence[ID]) -> List[User]:
+        """Get the users with the given IDs in a single query.
+
+        Args:
+            ids: User IDs
+
+        Returns:
+            Users found, in no particular order; missing IDs are skipped
+        """
+        ...
+
+    async def get_response_by_id(self, _id: ID) -> Optional[UserResponse]:
+        """Get a user's public fields by ID, without loading the whole user.
+
+        Args:
+            _id: User ID
+
+        Returns:
+            UserResponse if found, None otherwise
+        """
+        ...
+
+    async def get_many_responses_by_ids(self, ids: Sequence[ID]) -> List[UserResponse]:
+        """Get the public fields of the users with the given IDs in a single query.
+
+        Args:
+            ids: User IDs
+
+        Returns:
+            Users found, in no particular order; missing IDs are skipped
+        """
+        ...
+
     async def get_by_email(self, email: Email) -> Optional[User]:
         """Get a user by email.
 
@@ -61,6 +121,33 @@ class UserRepo(Protocol):
         """
         ...
 
+    async def update_profile(
+        self, _id: ID, name: Optional[str] = None, email: Optional[Email] = None
+    ) -> Optional[UserResponse]:
+        """Update the given fields of a user, leaving the others as they are.
+
+        Args:
+            _id: User ID
+            name: New name, if it changes
+            email: New email, if it changes
+
+        Returns:
+            The updated user's public fields, None if not found
+        """
+        ...
+
+    async def update_password(self, _id: ID, password: Password) -> bool:
+        """Replace a user's password hash.
+
+        Args:
+            _id: User ID
+            password: New hashed password
+
+        Returns:
+            True if updated, False if not found
+        """
+        ...
+
 
 class UserUnitOfWork(UnitOfWork, Protocol):
     """Unit of Work protocol for user operations."""
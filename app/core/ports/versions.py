@@ -0,0 +1,28 @@
+from typing import Protocol
+
+
+class UserVersionStore(Protocol):
+    """Protocol for tracking per-user profile versions.
+
+    Tokens embed the version current at issue time; a newer version marks
+    the claims in older tokens as stale.
+    """
+
+    def current(self, user_id: str) -> int:
+        """Get the current profile version of a user.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            The current version
+        """
+        ...
+
+    def bump(self, user_id: str) -> None:
+        """Mark every previously issued version of a user as stale.
+
+        Args:
+            user_id: User ID
+        """
+        ...
@@ -1,15 +1,21 @@
 from .create_user import CreateUserUsecase, UserAlreadyExistsError
 from .get_user import GetUserUsecase
+from .get_users import GetUsersUsecase
 from .update_user import UpdateUserUsecase
 from .delete_user import DeleteUserUsecase
 from .authenticate_user import AuthenticateUserUsecase
+from .rehash_password import RehashPasswordUsecase
+from .import_users import ImportUsersUsecase
 
 # Export class-based use cases
 __all__ = [
     "CreateUserUsecase",
     "UserAlreadyExistsError",
     "GetUserUsecase",
+    "GetUsersUsecase",
     "UpdateUserUsecase",
     "DeleteUserUsecase",
     "AuthenticateUserUsecase",
+    "RehashPasswordUsecase",
+    "ImportUsersUsecase",
 ]
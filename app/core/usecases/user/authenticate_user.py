@@ -1,10 +1,14 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from app.core.dtos.user import UserResponse
 from app.core.exceptions import AuthenticationFailedError
 from app.core.value_objects.email import Email, InvalidEmailError
-from app.core.ports.crypto import Hasher
+from app.core.ports.cache import CredentialCache
+from app.core.ports.crypto import AsyncHasher
+from app.core.ports.tasks import TaskScheduler
 from app.core.ports.user import UserRepo
+from app.core.usecases.user.rehash_password import RehashPasswordUsecase
 from app.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -13,11 +17,18 @@ logger = setup_logger(__name__)
 @dataclass(frozen=True)
 class AuthenticateUserUsecase:
     user_repo: UserRepo
-    hasher: Hasher
+    hasher: AsyncHasher
+    scheduler: Optional[TaskScheduler] = None
+    rehash_password: Optional[RehashPasswordUsecase] = None
+    credential_cache: Optional[CredentialCache] = None
 
     async def execute(self, email_str: str, password_str: str) -> UserResponse:
         """Authenticates a user.
 
+        When the stored hash was made with outdated parameters, a rehash is
+        scheduled to run after the caller is answered. Credentials verified in
+        the last few seconds are served from the credential cache, if any.
+
         Args:
             email_str: The user's email string.
             password_str: The user's password string.
@@ -27,15 +38,33 @@ class AuthenticateUserUsecase:
 
         Raises:
             AuthenticationFailedError: If authentication fails.
+            HasherOverloadedError: If the password hasher is over its backlog budget.
         """
         try:
             email = Email(email_str)
         except InvalidEmailError:
             raise AuthenticationFailedError("Invalid credentials")
 
+        if self.credential_cache and (
+            cached := self.credential_cache.get(email.value, password_str)
+        ):
+            return cached
+
         user = await self.user_repo.get_by_email(email)
-        if not user or not self.hasher.verify(password_str, user.password.value):
+        if not user or not await self.hasher.verify(password_str, user.password.value):
             raise AuthenticationFailedError("Invalid credentials")
 
+        if (
+            self.scheduler
+            and self.rehash_password
+            and self.hasher.needs_update(user.password.value)
+        ):
+            self.scheduler.schedule(
+                self.rehash_password.execute, str(user.id), password_str, user.password.value
+            )
+
         logger.info(f"User {email_str} authenticated successfully")
-        return UserResponse(id=str(user.id), name=user.name, email=user.email.value)
+        response = UserResponse(id=str(user.id), name=user.name, email=user.email.value)
+        if self.credential_cache:
+            self.credential_cache.put(email.value, password_str, response)
+        return response
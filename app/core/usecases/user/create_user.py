@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from app.core.dtos.user import CreateUserRequest, UserResponse
 from app.core.entities.user import User
 from app.core.exceptions import InvalidUserError, UserAlreadyExistsError
-from app.core.ports.crypto import Hasher
+from app.core.ports.crypto import AsyncHasher
 from app.core.ports.user import UserUnitOfWork
 from app.core.value_objects.email import Email, InvalidEmailError
 from app.core.value_objects.id import ID
@@ -16,7 +16,7 @@ logger = setup_logger(__name__)
 @dataclass(frozen=True)
 class CreateUserUsecase:
     uow: UserUnitOfWork
-    hasher: Hasher
+    hasher: AsyncHasher
 
     async def execute(self, dto: CreateUserRequest) -> UserResponse:
         """Creates a new user if the email doesn't already exist.
@@ -30,6 +30,7 @@ class CreateUserUsecase:
         Raises:
             InvalidUserError: If the input data to create the user is invalid.
             UserAlreadyExistsError: If a user with the same email already exists.
+            HasherOverloadedError: If the password hasher is over its backlog budget.
         """
         try:
             email, password = Email(dto.email), Password(dto.password)
@@ -37,18 +38,18 @@ class CreateUserUsecase:
             logger.warning(f"Invalid user: {e}")
             raise InvalidUserError(str(e))
 
-        async with self.uow:
-            if await self.uow.user_repo.get_by_email(email):
-                logger.warning(f"User with email {email.value} already exists")
-                raise UserAlreadyExistsError(f"User with email {email.value} already exists")
-
-            hashed_password = self.hasher.hash(password.value)
-            user = User(
-                id=ID.generate(),
-                name=dto.name,
-                email=email,
-                password=Password(hashed_password),
-            )
-
-            await self.uow.user_repo.save(user)
-            return UserResponse(id=str(user.id), name=user.name, email=user.email.value)
+        # Hashed up front, so the transaction only spans the insert
+        hashed_password = await self.hasher.hash(password.value)
+        user = User(
+            id=ID.generate(),
+            name=dto.name,
+            email=email,
+            password=Password(hashed_password),
+        )
+
+        try:
+            async with self.uow:
+                return await self.uow.user_repo.create(user)
+        except UserAlreadyExistsError:
+            logger.warning(f"User with email {email.value} already exists")
+            raise
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
+from typing import Optional
 
-from app.core.ports.user import UserRepo
+from app.core.ports.cache import CredentialCache
+from app.core.ports.user import UserUnitOfWork
+from app.core.ports.versions import UserVersionStore
 from app.core.value_objects.id import ID
 from app.logger import setup_logger
 
@@ -9,7 +12,9 @@ logger = setup_logger(__name__)
 
 @dataclass(frozen=True)
 class DeleteUserUsecase:
-    user_repo: UserRepo
+    uow: UserUnitOfWork
+    credential_cache: Optional[CredentialCache] = None
+    user_versions: Optional[UserVersionStore] = None
 
     async def execute(self, user_id: str) -> bool:
         """Deletes a user.
@@ -25,7 +30,14 @@ class DeleteUserUsecase:
         """
         id_value = ID.from_string(user_id)
 
-        result = await self.user_repo.delete(id_value)
+        async with self.uow:
+            result = await self.uow.user_repo.delete(id_value)
+
+        # Invalidate once committed, so a concurrent login cannot pick up stale data
         if result:
+            if self.credential_cache:
+                self.credential_cache.invalidate(user_id)
+            if self.user_versions:
+                self.user_versions.bump(user_id)
             logger.info(f"User {user_id} deleted successfully")
         return result
@@ -28,8 +28,8 @@ class GetUserUsecase:
         """
         id_value = ID.from_string(user_id)
 
-        user = await self.user_repo.get_by_id(id_value)
+        user = await self.user_repo.get_response_by_id(id_value)
         if not user:
             raise UserNotFoundError(f"User with ID {user_id} not found")
 
-        return UserResponse(id=str(user.id), name=user.name, email=user.email.value)
+        return user
@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+from app.core.dtos.user import UserResponse
+from app.core.ports.user import UserRepo
+from app.core.value_objects.id import ID
+
+
+@dataclass(frozen=True)
+class GetUsersUsecase:
+    user_repo: UserRepo
+
+    async def execute(self, user_ids: Sequence[str]) -> Dict[str, UserResponse]:
+        """Gets several users by ID with a single lookup.
+
+        Args:
+            user_ids: The IDs of the users to get; duplicates are allowed.
+
+        Returns:
+            Dict[str, UserResponse]: The users found, keyed by canonical ID
+            string. Users that do not exist are left out.
+
+        Raises:
+            InvalidIDError: If any user ID format is invalid.
+        """
+        ids: List[ID] = list(dict.fromkeys(ID.from_string(user_id) for user_id in user_ids))
+
+        users = await self.user_repo.get_many_responses_by_ids(ids)
+        return {user.id: user for user in users}
@@ -0,0 +1,111 @@
+import asyncio
+from dataclasses import dataclass, replace
+from typing import AsyncIterable, AsyncIterator, Callable, Dict, List, Sequence, Tuple, Union
+
+from app.core.dtos.user import ImportProgress, ImportRowError, ImportUserRow
+from app.core.entities.user import User
+from app.core.exceptions import InvalidUserError
+from app.core.ports.crypto import AsyncHasher
+from app.core.ports.user import UserUnitOfWork
+from app.core.value_objects.email import Email, InvalidEmailError
+from app.core.value_objects.id import ID
+from app.core.value_objects.password import InvalidPasswordError, Password
+from app.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+ImportRow = Union[ImportUserRow, ImportRowError]
+
+
+@dataclass(frozen=True)
+class ImportUsersUsecase:
+    uow_factory: Callable[[], UserUnitOfWork]
+    hasher: AsyncHasher
+    batch_size: int = 1000
+    hash_concurrency: int = 4
+
+    async def execute(self, rows: AsyncIterable[ImportRow]) -> AsyncIterator[ImportProgress]:
+        """Imports users in batches, as the rows stream in.
+
+        Each batch is validated, deduplicated by email and written in a
+        transaction of its own, so a failure only loses the batch in flight.
+        Rows whose email is already taken are rejected, not updated.
+
+        Args:
+            rows: The rows to import, or the errors of rows that could not be read.
+
+        Yields:
+            ImportProgress: Totals so far, after each batch.
+
+        Raises:
+            HasherOverloadedError: If the password hasher is over its backlog budget.
+        """
+        total = imported = rejected = 0
+        batch: List[ImportRow] = []
+
+        async def flush() -> ImportProgress:
+            nonlocal total, imported, rejected
+            created, errors = await self._import_batch(batch)
+            total += len(batch)
+            imported += created
+            rejected += len(errors)
+            batch.clear()
+            logger.info(f"Imported {imported} of {total} users")
+            return ImportProgress(
+                rows=total, imported=imported, rejected=rejected, errors=errors
+            )
+
+        async for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                yield await flush()
+        if batch or not total:
+            yield await flush()
+
+    async def _import_batch(
+        self, batch: Sequence[ImportRow]
+    ) -> Tuple[int, List[ImportRowError]]:
+        errors: List[ImportRowError] = []
+        users: Dict[str, User] = {}
+        lines: Dict[str, int] = {}
+        for row in batch:
+            if isinstance(row, ImportRowError):
+                errors.append(row)
+                continue
+            try:
+                user = User(
+                    id=ID.generate(),
+                    name=row.name,
+                    email=Email(row.email),
+                    password=Password(row.password),
+                )
+            except (InvalidUserError, InvalidEmailError, InvalidPasswordError) as e:
+                errors.append(ImportRowError(line=row.line, error=str(e)))
+                continue
+            if user.email.value in lines:
+                error = f"Duplicate of line {lines[user.email.value]}"
+                errors.append(ImportRowError(line=row.line, error=error))
+                continue
+            users[user.email.value] = user
+            lines[user.email.value] = row.line
+
+        # Bounded, so an import leaves hasher capacity for logins
+        semaphore = asyncio.Semaphore(self.hash_concurrency)
+
+        async def hashed(user: User) -> User:
+            async with semaphore:
+                hashed_password = await self.hasher.hash(user.password.value)
+            return replace(user, password=Password(hashed_password))
+
+        to_create = await asyncio.gather(*(hashed(user) for user in users.values()))
+        skipped: List[Email] = []
+        if to_create:
+            async with self.uow_factory() as uow:
+                skipped = await uow.user_repo.create_many(to_create)
+
+        errors.extend(
+            ImportRowError(line=lines[email.value], error="User already exists")
+            for email in skipped
+        )
+        errors.sort(key=lambda error: error.line)
+        return len(to_create) - len(skipped), errors
@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+
+from app.core.exceptions import HasherOverloadedError
+from app.core.ports.crypto import AsyncHasher
+from app.core.ports.user import UserUnitOfWork
+from app.core.value_objects.id import ID
+from app.core.value_objects.password import Password
+from app.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+@dataclass(frozen=True)
+class RehashPasswordUsecase:
+    uow: UserUnitOfWork
+    hasher: AsyncHasher
+
+    async def execute(self, user_id: str, password_str: str, current_hash: str) -> bool:
+        """Rehashes a user's password with the current hashing parameters.
+
+        Args:
+            user_id: The ID of the user whose password is rehashed.
+            password_str: The verified plain text password.
+            current_hash: The hash the password was verified against.
+
+        Returns:
+            True if the password was rehashed, False if it was skipped.
+        """
+        try:
+            new_hash = await self.hasher.hash(password_str)
+        except HasherOverloadedError:
+            logger.warning(f"Skipping password rehash for user {user_id}: hasher overloaded")
+            return False
+
+        async with self.uow:
+            user = await self.uow.user_repo.get_by_id(ID.from_string(user_id))
+            # The password changed since it was verified, keep the newer one
+            if not user or user.password.value != current_hash:
+                return False
+
+            updated = await self.uow.user_repo.update_password(user.id, Password(new_hash))
+
+        if updated:
+            logger.info(f"User {user_id} password rehashed")
+        return updated
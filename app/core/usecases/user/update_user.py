@@ -1,9 +1,11 @@
 from dataclasses import dataclass
+from typing import Optional
 
 from app.core.dtos.user import UpdateUser, UserResponse
-from app.core.entities.user import User
-from app.core.exceptions import UserNotFoundError
+from app.core.exceptions import InvalidUserError, UserNotFoundError
+from app.core.ports.cache import CredentialCache
 from app.core.ports.user import UserUnitOfWork
+from app.core.ports.versions import UserVersionStore
 from app.core.value_objects.email import Email
 from app.core.value_objects.id import ID
 from app.logger import setup_logger
@@ -14,6 +16,8 @@ logger = setup_logger(__name__)
 @dataclass(frozen=True)
 class UpdateUserUsecase:
     uow: UserUnitOfWork
+    credential_cache: Optional[CredentialCache] = None
+    user_versions: Optional[UserVersionStore] = None
 
     async def execute(self, user_id: str, dto: UpdateUser) -> UserResponse:
         """Updates a user.
@@ -28,30 +32,28 @@ class UpdateUserUsecase:
         Raises:
             InvalidIDError: If the user ID format is invalid.
             InvalidEmailError: If the email format is invalid.
+            InvalidUserError: If the name is blank.
             UserNotFoundError: If the user is not found.
         """
         id_value = ID.from_string(user_id)
+        name = dto.name or None
+        if name is not None and not name.strip():
+            raise InvalidUserError("Name cannot be empty")
+        email = Email(dto.email) if dto.email else None
 
         async with self.uow:
-            existing_user = await self.uow.user_repo.get_by_id(id_value)
-            if not existing_user:
-                raise UserNotFoundError(f"User with ID {user_id} not found")
-
-            updated_user = await self.uow.user_repo.update(
-                User(
-                    id=existing_user.id,
-                    name=dto.name or existing_user.name,
-                    email=Email(dto.email) if dto.email else existing_user.email,
-                    password=existing_user.password,
-                )
+            # Only the provided fields are written, without reading the user first
+            updated_user = await self.uow.user_repo.update_profile(
+                id_value, name=name, email=email
             )
-
             if not updated_user:
                 raise UserNotFoundError(f"User with ID {user_id} not found")
 
-            logger.info(f"User {user_id} updated successfully")
-            return UserResponse(
-                id=str(updated_user.id),
-                name=updated_user.name,
-                email=updated_user.email.value,
-            )
+        # Invalidate once committed, so a concurrent login cannot pick up stale data
+        if self.credential_cache:
+            self.credential_cache.invalidate(user_id)
+        if self.user_versions:
+            self.user_versions.bump(user_id)
+
+        logger.info(f"User {user_id} updated successfully")
+        return updated_user
@@ -2,7 +2,11 @@ from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 
 from app.config import Settings
-from app.infra.api.extensions import validation_exception_handler
+from app.core.exceptions import HasherOverloadedError
+from app.infra.api.extensions import (
+    hasher_overloaded_exception_handler,
+    validation_exception_handler,
+)
 from app.infra.api.lifespan import lifespan
 from app.infra.api.routers import root, v1
 
@@ -25,6 +29,7 @@ def register_routers(app: FastAPI) -> FastAPI:
 
 def register_extensions(app: FastAPI) -> FastAPI:
     app.add_exception_handler(RequestValidationError, validation_exception_handler)  # type: ignore[arg-type]
+    app.add_exception_handler(HasherOverloadedError, hasher_overloaded_exception_handler)  # type: ignore[arg-type]
     return app
 
 
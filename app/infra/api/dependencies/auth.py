@@ -1,12 +1,18 @@
-from typing import Annotated
+from typing import Annotated, Any, Dict, Optional, Tuple
 
 from fastapi import Depends, HTTPException
-from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from fastapi.security import APIKeyHeader, OAuth2PasswordBearer, OAuth2PasswordRequestForm
 
-from app.config import get_settings
 from app.core.dtos.user import UserResponse
+from app.core.exceptions import UserNotFoundError
+from app.core.ports.versions import UserVersionStore
+from app.core.value_objects.id import InvalidIDError
+from app.infra.api.dependencies.container import AppContainer
 from app.infra.api.dependencies.usecases.user import GetUser as GetUserUsecase
+from app.infra.api.dependencies.versions import UserVersions
+from app.infra.auth.api_keys import ApiKeyAuthenticator
 from app.infra.auth.jwt import InvalidToken, JWTProvider
+from app.infra.auth.revocation import RevocationList
 
 CredentialsException = HTTPException(
     status_code=401,
@@ -15,33 +21,91 @@ CredentialsException = HTTPException(
 )
 
 
-def get_token_provider() -> JWTProvider:
-    settings = get_settings()
-    return JWTProvider(
-        settings.JWT_SECRET_KEY,
-        settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES,
-        settings.JWT_ALGORITHM,
-    )
+def get_token_provider(container: AppContainer) -> JWTProvider:
+    return container.token_provider
+
+
+def get_api_keys(container: AppContainer) -> ApiKeyAuthenticator:
+    return container.api_keys
+
+
+def get_revocations(container: AppContainer) -> Optional[RevocationList]:
+    return container.revocations
 
 
 TokenProvider = Annotated[JWTProvider, Depends(get_token_provider)]
-Oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token")
-Oauth2Token = Annotated[str, Depends(Oauth2_scheme)]
+Revocations = Annotated[Optional[RevocationList], Depends(get_revocations)]
+ApiKeys = Annotated[ApiKeyAuthenticator, Depends(get_api_keys)]
+# Either credential may be presented, so neither scheme rejects the request on its own
+Oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token", auto_error=False)
+Oauth2Token = Annotated[Optional[str], Depends(Oauth2_scheme)]
+ApiKey_scheme = APIKeyHeader(name="X-API-Key", auto_error=False)
+ApiKeyHeaderValue = Annotated[Optional[str], Depends(ApiKey_scheme)]
 Oauth2Form = Annotated[OAuth2PasswordRequestForm, Depends()]
 
 
+def access_token_claims(
+    user: UserResponse, user_versions: Optional[UserVersionStore]
+) -> Dict[str, Any]:
+    """Claims for a user's access token, with its profile when resolved statelessly."""
+    claims: Dict[str, Any] = {"sub": f"user_id:{user.id}"}
+    if user_versions:
+        claims.update(name=user.name, email=user.email, ver=user_versions.current(user.id))
+    return claims
+
+
+def user_from_claims(
+    user_id: str, claims: Dict[str, Any], user_versions: Optional[UserVersionStore]
+) -> Optional[UserResponse]:
+    """Build the user from token claims, unless its profile version is stale."""
+    if not user_versions or "ver" not in claims:
+        return None
+    if claims["ver"] != user_versions.current(user_id):
+        return None
+    return UserResponse(id=user_id, name=claims["name"], email=claims["email"])
+
+
+def verify_access_token(token_provider: JWTProvider, token: str) -> Tuple[str, Dict[str, Any]]:
+    """Verify an access token, returning its user ID and claims.
+
+    Raises:
+        InvalidToken: If the token is invalid, expired or a refresh token.
+    """
+    claims = token_provider.decode(token)
+    if token_provider.is_refresh_token(claims):
+        raise InvalidToken
+    return token_provider.sub_from_claims(claims), claims
+
+
 async def get_current_user(
-    usecase: GetUserUsecase, token: Oauth2Token, token_provider: TokenProvider
+    usecase: GetUserUsecase,
+    token: Oauth2Token,
+    api_key: ApiKeyHeaderValue,
+    token_provider: TokenProvider,
+    user_versions: UserVersions,
+    api_keys: ApiKeys,
 ) -> UserResponse:
+    if api_key:
+        api_key_user = await api_keys.authenticate(api_key)
+        if api_key_user is None:
+            raise CredentialsException
+        return api_key_user
+
+    if not token:
+        raise CredentialsException
     try:
-        _id = token_provider.get_sub(token)
+        _id, claims = verify_access_token(token_provider, token)
     except InvalidToken:
         raise CredentialsException
 
-    user = await usecase.execute(_id)
-    if user is None:
+    user = user_from_claims(_id, claims, user_versions)
+    if user is not None:
+        return user
+
+    try:
+        return await usecase.execute(_id)
+    except (InvalidIDError, UserNotFoundError):
         raise CredentialsException
-    return user
 
 
 CurrentUser = Annotated[UserResponse, Depends(get_current_user)]
@@ -0,0 +1,13 @@
+from typing import Annotated, Optional
+
+from fastapi import Depends
+
+from app.core.ports.cache import CredentialCache as CredentialCacheProtocol
+from app.infra.api.dependencies.container import AppContainer
+
+
+def get_credential_cache(container: AppContainer) -> Optional[CredentialCacheProtocol]:
+    return container.credential_cache
+
+
+CredentialCache = Annotated[Optional[CredentialCacheProtocol], Depends(get_credential_cache)]
@@ -0,0 +1,13 @@
+from typing import Annotated
+
+from fastapi import Depends, Request
+
+from app.infra.container import Container
+
+
+def get_container(request: Request) -> Container:
+    container: Container = request.app.state.container
+    return container
+
+
+AppContainer = Annotated[Container, Depends(get_container)]
@@ -2,12 +2,12 @@ from typing import Annotated
 
 from fastapi import Depends
 
-from app.core.ports.crypto import Hasher as HasherProtocol
-from app.infra.security import crypto
+from app.core.ports.crypto import AsyncHasher as AsyncHasherProtocol
+from app.infra.api.dependencies.container import AppContainer
 
 
-def get_hasher() -> crypto.Hasher:
-    return crypto.Hasher()
+def get_hasher(container: AppContainer) -> AsyncHasherProtocol:
+    return container.hasher
 
 
-Hasher = Annotated[HasherProtocol, Depends(get_hasher)]
+Hasher = Annotated[AsyncHasherProtocol, Depends(get_hasher)]
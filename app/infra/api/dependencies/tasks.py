@@ -0,0 +1,22 @@
+from typing import Annotated, Any, Awaitable, Callable
+
+from fastapi import BackgroundTasks, Depends
+
+from app.core.ports.tasks import TaskScheduler
+
+
+class BackgroundTaskScheduler:
+    """Runs scheduled tasks once the response has been sent."""
+
+    def __init__(self, background_tasks: BackgroundTasks) -> None:
+        self.background_tasks = background_tasks
+
+    def schedule(self, func: Callable[..., Awaitable[Any]], *args: Any) -> None:
+        self.background_tasks.add_task(func, *args)
+
+
+def get_task_scheduler(background_tasks: BackgroundTasks) -> TaskScheduler:
+    return BackgroundTaskScheduler(background_tasks)
+
+
+Scheduler = Annotated[TaskScheduler, Depends(get_task_scheduler)]
@@ -7,34 +7,74 @@ from app.core.usecases.user import (
     CreateUserUsecase,
     DeleteUserUsecase,
     GetUserUsecase,
+    GetUsersUsecase,
+    ImportUsersUsecase,
+    RehashPasswordUsecase,
     UpdateUserUsecase,
 )
+from app.infra.api.dependencies.cache import CredentialCache
 from app.infra.api.dependencies.crypto import Hasher
-from app.infra.api.dependencies.user import UnitOfWork, Repo
+from app.infra.api.dependencies.tasks import Scheduler
+from app.infra.api.dependencies.container import AppContainer
+from app.infra.api.dependencies.user import ReadRepo, UnitOfWork, new_user_uow
+from app.infra.api.dependencies.versions import UserVersions
 
 
 def get_create_user_usecase(uow: UnitOfWork, hasher: Hasher) -> CreateUserUsecase:
     return CreateUserUsecase(uow, hasher)
 
 
-def get_get_user_usecase(repo: Repo) -> GetUserUsecase:
+def get_get_user_usecase(repo: ReadRepo) -> GetUserUsecase:
     return GetUserUsecase(repo)
 
 
-def get_update_user_usecase(uow: UnitOfWork) -> UpdateUserUsecase:
-    return UpdateUserUsecase(uow)
+def get_get_users_usecase(repo: ReadRepo) -> GetUsersUsecase:
+    return GetUsersUsecase(repo)
 
 
-def get_delete_user_usecase(repo: Repo) -> DeleteUserUsecase:
-    return DeleteUserUsecase(repo)
+def get_update_user_usecase(
+    uow: UnitOfWork, credential_cache: CredentialCache, user_versions: UserVersions
+) -> UpdateUserUsecase:
+    return UpdateUserUsecase(uow, credential_cache, user_versions)
 
 
-def get_authenticate_user_usecase(repo: Repo, hasher: Hasher) -> AuthenticateUserUsecase:
-    return AuthenticateUserUsecase(repo, hasher)
+def get_delete_user_usecase(
+    uow: UnitOfWork, credential_cache: CredentialCache, user_versions: UserVersions
+) -> DeleteUserUsecase:
+    return DeleteUserUsecase(uow, credential_cache, user_versions)
+
+
+def get_rehash_password_usecase(
+    hasher: Hasher, container: AppContainer
+) -> RehashPasswordUsecase:
+    # Runs as a background task, after request-scoped sessions are closed
+    return RehashPasswordUsecase(new_user_uow(container), hasher)
+
+
+def get_import_users_usecase(hasher: Hasher, container: AppContainer) -> ImportUsersUsecase:
+    settings = container.settings
+    return ImportUsersUsecase(
+        lambda: new_user_uow(container),
+        hasher,
+        batch_size=settings.USER_IMPORT_BATCH_SIZE,
+        hash_concurrency=settings.USER_IMPORT_HASH_CONCURRENCY,
+    )
+
+
+def get_authenticate_user_usecase(
+    repo: ReadRepo,
+    hasher: Hasher,
+    scheduler: Scheduler,
+    rehash_password: Annotated[RehashPasswordUsecase, Depends(get_rehash_password_usecase)],
+    credential_cache: CredentialCache,
+) -> AuthenticateUserUsecase:
+    return AuthenticateUserUsecase(repo, hasher, scheduler, rehash_password, credential_cache)
 
 
 CreateUser = Annotated[CreateUserUsecase, Depends(get_create_user_usecase)]
 GetUser = Annotated[GetUserUsecase, Depends(get_get_user_usecase)]
+GetUsers = Annotated[GetUsersUsecase, Depends(get_get_users_usecase)]
 UpdateUser = Annotated[UpdateUserUsecase, Depends(get_update_user_usecase)]
 DeleteUser = Annotated[DeleteUserUsecase, Depends(get_delete_user_usecase)]
 AuthenticateUser = Annotated[AuthenticateUserUsecase, Depends(get_authenticate_user_usecase)]
+ImportUsers = Annotated[ImportUsersUsecase, Depends(get_import_users_usecase)]
@@ -3,20 +3,65 @@ from typing import Annotated, AsyncGenerator
 from fastapi import Depends
 
 from app.core.ports import user
-from app.infra.db import async_session
+from app.infra.api.dependencies.container import AppContainer
+from app.infra.container import Container
+from app.infra.db import async_read_session, async_session
+from app.infra.db.repositories.sharded_user import ShardedUserRepo
 from app.infra.db.repositories.user import UserRepo
+from app.infra.db.sharding import ShardSessions
+from app.infra.db.unit_of_work.sharded_user import sharded_user_uow_factory
 from app.infra.db.unit_of_work.user import user_uow_factory
+from app.infra.memory.user import InMemoryUserRepo, memory_user_uow_factory
 
 
-async def get_user_repo() -> AsyncGenerator[user.UserRepo, None]:
+def new_user_uow(container: Container) -> user.UserUnitOfWork:
+    """A unit of work with sessions of its own, closed when it exits."""
+    if container.users is not None:
+        return memory_user_uow_factory(container.users)  # type: ignore[return-value]
+    if container.shards:
+        return sharded_user_uow_factory(container.shards)  # type: ignore[return-value]
+    return user_uow_factory(async_session())  # type: ignore[return-value]
+
+
+async def get_user_repo(container: AppContainer) -> AsyncGenerator[user.UserRepo, None]:
+    if container.users is not None:
+        # Nothing is committed outside a unit of work, so writes here are dropped
+        yield InMemoryUserRepo(container.users)
+        return
+    if container.shards:
+        async with ShardSessions(container.shards) as shard_sessions:
+            yield ShardedUserRepo(shard_sessions)
+        return
     async with async_session() as session:
         yield UserRepo(session)
 
 
-async def get_user_uow() -> AsyncGenerator[user.UserUnitOfWork, None]:
+async def get_read_user_repo(container: AppContainer) -> AsyncGenerator[user.UserRepo, None]:
+    if container.users is not None:
+        yield InMemoryUserRepo(container.users)
+        return
+    if container.shards:
+        # Shards have no replicas of their own
+        async with ShardSessions(container.shards) as shard_sessions:
+            yield ShardedUserRepo(shard_sessions)
+        return
+    # Replicas may lag behind, so only for repos that never write
+    sessions = container.replicas.session() if container.replicas else async_read_session()
+    async with sessions as session:
+        yield UserRepo(session)
+
+
+async def get_user_uow(container: AppContainer) -> AsyncGenerator[user.UserUnitOfWork, None]:
+    if container.users is not None:
+        yield memory_user_uow_factory(container.users)  # type: ignore[misc]
+        return
+    if container.shards:
+        yield sharded_user_uow_factory(container.shards)  # type: ignore[misc]
+        return
     async with async_session() as session:
         yield user_uow_factory(session)  # type: ignore[misc]
 
 
 Repo = Annotated[user.UserRepo, Depends(get_user_repo)]
+ReadRepo = Annotated[user.UserRepo, Depends(get_read_user_repo)]
 UnitOfWork = Annotated[user.UserUnitOfWork, Depends(get_user_uow)]
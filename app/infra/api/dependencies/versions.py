@@ -0,0 +1,13 @@
+from typing import Annotated, Optional
+
+from fastapi import Depends
+
+from app.core.ports.versions import UserVersionStore
+from app.infra.api.dependencies.container import AppContainer
+
+
+def get_user_versions(container: AppContainer) -> Optional[UserVersionStore]:
+    return container.user_versions
+
+
+UserVersions = Annotated[Optional[UserVersionStore], Depends(get_user_versions)]
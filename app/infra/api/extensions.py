@@ -4,6 +4,8 @@ from fastapi import Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
+from app.core.exceptions import HasherOverloadedError
+
 
 def adapt_type_error(message: str) -> str:
     return message[message.index("missing") :].replace("positional argument", "field")
@@ -24,3 +26,13 @@ async def validation_exception_handler(
         error.update({"msg": adapt_message(error)})
         errors.append(error)
     return JSONResponse({"detail": errors}, status_code=422)
+
+
+async def hasher_overloaded_exception_handler(
+    _: Request, exc: HasherOverloadedError
+) -> JSONResponse:
+    return JSONResponse(
+        {"detail": "Service temporarily overloaded, try again later"},
+        status_code=503,
+        headers={"Retry-After": "1"},
+    )
@@ -4,7 +4,8 @@ from typing import AsyncGenerator
 from fastapi import FastAPI
 
 from app.config import get_settings
-from app.infra.db import engine
+from app.infra.container import Container
+from app.infra.db import engine, read_engine
 from app.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -18,10 +19,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     app.state.db_engine = engine
     logger.info("Database connection initialized")
 
+    app.state.container = Container.build(settings)
+    await app.state.container.start()
+    logger.info("Service container initialized")
+
     try:
         yield
     finally:
         # Clean up resources on shutdown
         if hasattr(app.state, "db_engine") and app.state.db_engine:
             await app.state.db_engine.dispose()
+            await read_engine.dispose()
             logger.info("Database connection closed")
+
+        if hasattr(app.state, "container") and app.state.container:
+            await app.state.container.stop()
+            logger.info("Service container closed")
@@ -1,8 +1,14 @@
 from dataclasses import dataclass
+from typing import List, Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 
 from app.config import get_settings
+from app.infra.api.dependencies.container import AppContainer
+from app.infra.cache import CacheStats
+from app.infra.db.pool import PoolStats, pool_stats
+from app.infra.db.replicas import ReplicaStats
+from app.infra.security.crypto import HasherStats
 
 router = APIRouter()
 
@@ -26,3 +32,28 @@ def health_check() -> HealthCheck:
     return HealthCheck(
         settings.APP_TITLE, settings.APP_DESCRIPTION, settings.APP_VERSION, "I'm ok!"
     )
+
+
+@dataclass
+class Stats:
+    db_pool: Optional[PoolStats]
+    db_replicas: List[ReplicaStats]
+    hasher: HasherStats
+    jwt_claims_cache: Optional[CacheStats]
+    api_key_cache: CacheStats
+
+
+@router.get(
+    "/stats",
+    status_code=200,
+    tags=["Health Check"],
+    summary="Reports connection pool and cache statistics",
+)
+def stats(request: Request, container: AppContainer) -> Stats:
+    return Stats(
+        db_pool=pool_stats(request.app.state.db_engine),
+        db_replicas=container.replicas.stats() if container.replicas else [],
+        hasher=container.hasher.stats(),
+        jwt_claims_cache=container.token_provider.cache_stats(),
+        api_key_cache=container.api_keys.cache_stats(),
+    )
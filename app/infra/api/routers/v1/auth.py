@@ -1,12 +1,39 @@
-from fastapi import APIRouter, HTTPException
+from typing import Annotated, Any, Dict, List, Optional, Tuple
+from uuid import UUID
 
-from app.core.dtos.auth import TokenResponse
+from fastapi import APIRouter, Form, HTTPException
+
+from app.core.dtos.auth import (
+    ApiKeyResponse,
+    CreateApiKeyRequest,
+    IntrospectRequest,
+    IntrospectResponse,
+    TokenIntrospection,
+    TokenResponse,
+)
 from app.core.dtos.user import UserResponse
+from app.core.exceptions import UserNotFoundError
 from app.core.usecases.user.authenticate_user import AuthenticationFailedError
-from app.infra.api.dependencies.auth import CurrentUser, Oauth2Form, TokenProvider
+from app.core.value_objects.id import ID, InvalidIDError
+from app.infra.api.dependencies.auth import (
+    ApiKeys,
+    CredentialsException,
+    CurrentUser,
+    Oauth2Form,
+    Revocations,
+    TokenProvider,
+    access_token_claims,
+    user_from_claims,
+    verify_access_token,
+)
+from app.infra.api.dependencies.container import AppContainer
 from app.infra.api.dependencies.usecases.user import (
     AuthenticateUser as AuthenticateUserUsecase,
 )
+from app.infra.api.dependencies.usecases.user import GetUser as GetUserUsecase
+from app.infra.api.dependencies.usecases.user import GetUsers as GetUsersUsecase
+from app.infra.api.dependencies.versions import UserVersions
+from app.infra.auth.jwt import InvalidToken
 
 router = APIRouter()
 
@@ -21,11 +48,14 @@ router = APIRouter()
     operation_id="Credentials",
 )
 async def token(
-    usecase: AuthenticateUserUsecase, form_data: Oauth2Form, token_provider: TokenProvider
+    usecase: AuthenticateUserUsecase,
+    form_data: Oauth2Form,
+    token_provider: TokenProvider,
+    user_versions: UserVersions,
+    revocations: Revocations,
 ) -> TokenResponse:
     try:
         user = await usecase.execute(form_data.username, form_data.password)
-        return token_provider.create_access_token({"sub": f"user_id:{user.id}"})
     except AuthenticationFailedError:
         raise HTTPException(
             status_code=401,
@@ -33,6 +63,149 @@ async def token(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    refresh_token = token_provider.create_refresh_token(user.id) if revocations else None
+    return token_provider.create_access_token(
+        access_token_claims(user, user_versions), refresh_token=refresh_token
+    )
+
+
+@router.post(
+    "/refresh",
+    summary="Exchanges a refresh Token for a new access Token",
+    responses={
+        200: {"description": "Access token refreshed"},
+        401: {"description": "Refresh token invalid, expired or revoked"},
+    },
+)
+async def refresh(
+    usecase: GetUserUsecase,
+    refresh_token: Annotated[str, Form()],
+    token_provider: TokenProvider,
+    user_versions: UserVersions,
+    revocations: Revocations,
+) -> TokenResponse:
+    if revocations is None:
+        raise CredentialsException
+    try:
+        claims = token_provider.decode_refresh_token(refresh_token)
+    except InvalidToken:
+        raise CredentialsException
+    if await revocations.is_revoked(claims.jti):
+        raise CredentialsException
+
+    # No password check, but still reject users deleted since the token was issued
+    try:
+        user = await usecase.execute(claims.user_id)
+    except (InvalidIDError, UserNotFoundError):
+        raise CredentialsException
+
+    return token_provider.create_access_token(
+        access_token_claims(user, user_versions), refresh_token=refresh_token
+    )
+
+
+@router.post(
+    "/revoke",
+    summary="Revokes a refresh Token",
+    status_code=204,
+    responses={204: {"description": "Token revoked, or was not a valid refresh token"}},
+)
+async def revoke(
+    token: Annotated[str, Form()],
+    token_provider: TokenProvider,
+    revocations: Revocations,
+) -> None:
+    if revocations is None:
+        return
+    try:
+        claims = token_provider.decode_refresh_token(token)
+    except InvalidToken:
+        # As in RFC 7009, an invalid token needs no revoking and is not an error
+        return
+    await revocations.revoke(claims.jti, claims.expires_at)
+
+
+@router.post(
+    "/introspect",
+    summary="Introspects a batch of access Tokens",
+    responses={
+        200: {"description": "Per-token introspection results, in request order"},
+        401: {"description": "Caller unauthorized"},
+        422: {"description": "Too many tokens"},
+    },
+)
+async def introspect(
+    dto: IntrospectRequest,
+    _: CurrentUser,
+    usecase: GetUsersUsecase,
+    token_provider: TokenProvider,
+    user_versions: UserVersions,
+    container: AppContainer,
+) -> IntrospectResponse:
+    max_tokens = container.settings.AUTH_INTROSPECT_MAX_TOKENS
+    if len(dto.tokens) > max_tokens:
+        raise HTTPException(status_code=422, detail=f"At most {max_tokens} tokens per request")
+
+    verified: List[Optional[Tuple[str, Dict[str, Any]]]] = []
+    for token in dto.tokens:
+        try:
+            user_id, claims = verify_access_token(token_provider, token)
+            verified.append((str(ID.from_string(user_id)), claims))
+        except (InvalidToken, InvalidIDError):
+            verified.append(None)
+
+    users: Dict[str, UserResponse] = {}
+    for entry in verified:
+        if entry and entry[0] not in users:
+            user = user_from_claims(*entry, user_versions)
+            if user is not None:
+                users[entry[0]] = user
+
+    # Everyone the claims could not vouch for is resolved in one query
+    missing = {entry[0] for entry in verified if entry and entry[0] not in users}
+    if missing:
+        users.update(await usecase.execute(list(missing)))
+
+    return IntrospectResponse(
+        results=[
+            TokenIntrospection(active=True, claims=entry[1], user=users[entry[0]])
+            if entry and entry[0] in users
+            else TokenIntrospection(active=False)
+            for entry in verified
+        ]
+    )
+
+
+@router.post(
+    "/api-keys",
+    status_code=201,
+    summary="Creates an API key for the authenticated User",
+    responses={
+        201: {"description": "API key created; the key is only shown once"},
+        401: {"description": "User unauthorized"},
+    },
+)
+async def create_api_key(
+    dto: CreateApiKeyRequest, current_user: CurrentUser, api_keys: ApiKeys
+) -> ApiKeyResponse:
+    key_id, key = await api_keys.create(current_user.id, dto.name)
+    return ApiKeyResponse(id=str(key_id), name=dto.name, key=key)
+
+
+@router.delete(
+    "/api-keys/{key_id}",
+    status_code=204,
+    summary="Deletes an API key of the authenticated User",
+    responses={
+        204: {"description": "API key deleted"},
+        401: {"description": "User unauthorized"},
+        404: {"description": "API key not found"},
+    },
+)
+async def delete_api_key(key_id: UUID, current_user: CurrentUser, api_keys: ApiKeys) -> None:
+    if not await api_keys.revoke(current_user.id, key_id):
+        raise HTTPException(status_code=404, detail="API key not found")
+
 
 @router.get(
     "/me",
@@ -1,17 +1,29 @@
+import json
+from dataclasses import asdict
+from typing import AsyncIterator
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
 
 from app.core.dtos.user import CreateUserRequest, UpdateUser, UserResponse
-from app.core.exceptions import InvalidUserError, UserAlreadyExistsError, UserNotFoundError
+from app.core.exceptions import (
+    HasherOverloadedError,
+    InvalidUserError,
+    UserAlreadyExistsError,
+    UserNotFoundError,
+)
 from app.core.value_objects.id import InvalidIDError
 from app.core.value_objects.email import InvalidEmailError
+from app.infra.api.dependencies.auth import CurrentUser
 from app.infra.api.dependencies.usecases.user import (
     CreateUser as CreateUserUsecase,
     DeleteUser as DeleteUserUsecase,
     GetUser as GetUserUsecase,
+    ImportUsers as ImportUsersUsecase,
     UpdateUser as UpdateUserUsecase,
 )
+from app.infra.formats.users import CONTENT_TYPES, read_user_rows
 
 router = APIRouter()
 
@@ -35,6 +47,44 @@ async def create(dto: CreateUserRequest, usecase: CreateUserUsecase) -> UserResp
         raise HTTPException(409, detail="User already exists")
 
 
+@router.post(
+    "/import",
+    summary="Imports Users in bulk",
+    responses={
+        200: {
+            "description": "Import progress, one JSON object per batch",
+            "content": {"application/x-ndjson": {}},
+        },
+        401: {"description": "Caller unauthorized"},
+        415: {"description": "Body is neither NDJSON nor CSV"},
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {content_type: {} for content_type in CONTENT_TYPES},
+        }
+    },
+)
+async def import_users(
+    request: Request, _: CurrentUser, usecase: ImportUsersUsecase
+) -> StreamingResponse:
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if content_type not in CONTENT_TYPES:
+        raise HTTPException(415, detail=f"Expected one of {', '.join(CONTENT_TYPES)}")
+
+    # The body is parsed as it arrives, and progress sent as each batch is written
+    rows = read_user_rows(request.stream(), CONTENT_TYPES[content_type])
+
+    async def progress() -> AsyncIterator[str]:
+        try:
+            async for report in usecase.execute(rows):
+                yield json.dumps(asdict(report)) + "\n"
+        except HasherOverloadedError:
+            yield json.dumps({"error": "Password hasher overloaded, import stopped"}) + "\n"
+
+    return StreamingResponse(progress(), media_type="application/x-ndjson")
+
+
 @router.get(
     "/{user_id}",
     summary="Gets User information",
@@ -0,0 +1,71 @@
+import hashlib
+import secrets
+from typing import Optional, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.dtos.user import UserResponse
+from app.infra.cache import CacheStats, TTLCache
+from app.infra.db import DBSession
+from app.infra.db.repositories.api_key import ApiKeyRepo
+
+
+class ApiKeyAuthenticator:
+    """Issues API keys and resolves them to their owner.
+
+    Keys are 256 random bits, so a single SHA-256 is enough to store them:
+    unlike passwords they cannot be guessed, and the digest is looked up
+    through a unique index instead of verified with a slow hash. Resolved
+    owners are cached per process for `ttl_seconds`, which also bounds how
+    long another process may keep accepting a deleted key.
+    """
+
+    PREFIX = "pca_"
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[DBSession],
+        ttl_seconds: float = 60.0,
+        max_size: int = 1024,
+    ) -> None:
+        self._session_factory = session_factory
+        self._cache: TTLCache[str, UserResponse] = TTLCache(max_size, ttl_seconds)
+
+    @staticmethod
+    def digest(key: str) -> str:
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    async def create(self, user_id: str, name: str) -> Tuple[UUID, str]:
+        """Issue a new key for the user; the plaintext is only ever returned here."""
+        _id = uuid4()
+        key = self.PREFIX + secrets.token_urlsafe(32)
+        async with self._session_factory() as session:
+            await ApiKeyRepo(session).create(_id, UUID(user_id), name, self.digest(key))
+        return _id, key
+
+    async def authenticate(self, key: str) -> Optional[UserResponse]:
+        if not key.startswith(self.PREFIX):
+            return None
+
+        key_digest = self.digest(key)
+        user = self._cache.get(key_digest)
+        if user is not None:
+            return user
+
+        async with self._session_factory() as session:
+            user = await ApiKeyRepo(session).get_user_by_digest(key_digest)
+        if user is not None:
+            self._cache.set(key_digest, user)
+        return user
+
+    async def revoke(self, user_id: str, key_id: UUID) -> bool:
+        async with self._session_factory() as session:
+            key_digest = await ApiKeyRepo(session).delete(key_id, UUID(user_id))
+        if key_digest is None:
+            return False
+        self._cache.pop(key_digest)
+        return True
+
+    def cache_stats(self) -> CacheStats:
+        return self._cache.stats()
@@ -1,23 +1,136 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
+from uuid import UUID, uuid4
 
 from jose import JWTError, jwt
 
 from app.core.dtos.auth import TokenResponse
+from app.infra.cache import CacheStats, TTLCache
 
 
 class InvalidToken(Exception):
     pass
 
 
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+class HSTokenCodec:
+    """Specialised encoder/decoder for symmetric HMAC (HS*) JWTs.
+
+    Wire-compatible with python-jose, but the HMAC key state and the header
+    segment are prepared once, and only `exp` and `sub` are validated.
+    """
+
+    ALGORITHMS: Dict[str, Callable[..., Any]] = {
+        "HS256": hashlib.sha256,
+        "HS384": hashlib.sha384,
+        "HS512": hashlib.sha512,
+    }
+
+    def __init__(self, secret_key: str, algorithm: str) -> None:
+        self.algorithm = algorithm
+        self._mac = hmac.new(secret_key.encode(), digestmod=self.ALGORITHMS[algorithm])
+        header = json.dumps(
+            {"alg": algorithm, "typ": "JWT"}, separators=(",", ":"), sort_keys=True
+        )
+        self._header = _b64encode(header.encode())
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+    def encode(self, claims: Dict[str, Any]) -> str:
+        payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode())
+        signing_input = self._header + b"." + payload
+        return (signing_input + b"." + _b64encode(self._sign(signing_input))).decode()
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        try:
+            signing_input, signature = token.encode().rsplit(b".", 1)
+            header, payload = signing_input.split(b".")
+            if header != self._header:
+                # Same header serialised differently (e.g. by another library)
+                if json.loads(_b64decode(header)).get("alg") != self.algorithm:
+                    raise InvalidToken
+            if not hmac.compare_digest(self._sign(signing_input), _b64decode(signature)):
+                raise InvalidToken
+            claims = json.loads(_b64decode(payload))
+        except (ValueError, binascii.Error, AttributeError):
+            raise InvalidToken
+
+        if not isinstance(claims, dict):
+            raise InvalidToken
+        exp = claims.get("exp")
+        if not isinstance(exp, (int, float)) or exp <= time.time():
+            raise InvalidToken
+        if "sub" in claims and not isinstance(claims["sub"], str):
+            raise InvalidToken
+        return claims
+
+
+@dataclass(frozen=True)
+class RefreshClaims:
+    user_id: str
+    jti: UUID
+    expires_at: datetime
+
+
 class JWTProvider:
-    def __init__(self, secret_key: str, expire_minutes: int, algorithm: str) -> None:
+    REFRESH_TOKEN_TYPE = "refresh"
+
+    def __init__(
+        self,
+        secret_key: str,
+        expire_minutes: int,
+        algorithm: str,
+        cache_size: int = 0,
+        refresh_expire_minutes: int = 0,
+    ) -> None:
         self._jwt = jwt
         self.secret_key = secret_key
         self.expire_minutes = expire_minutes
+        self.refresh_expire_minutes = refresh_expire_minutes
         self.algorithm = algorithm
+        self._codec: Optional[HSTokenCodec] = None
+        if algorithm in HSTokenCodec.ALGORITHMS:
+            self._codec = HSTokenCodec(secret_key, algorithm)
+        # Verified claims keyed by token digest; entries never outlive the token's exp
+        self._claims_cache: Optional[TTLCache[bytes, Dict[str, Any]]] = None
+        if cache_size > 0:
+            self._claims_cache = TTLCache(cache_size, ttl_seconds=expire_minutes * 60)
 
     def decode(self, token: str) -> Dict[str, Any]:
+        if self._claims_cache is None:
+            return self._decode(token)
+
+        key = hashlib.sha256(token.encode()).digest()
+        cached = self._claims_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+
+        claims = self._decode(token)
+        exp = claims.get("exp")
+        if isinstance(exp, (int, float)):
+            self._claims_cache.set(key, dict(claims), ttl_seconds=exp - time.time())
+        return claims
+
+    def _decode(self, token: str) -> Dict[str, Any]:
+        if self._codec:
+            return self._codec.decode(token)
         try:
             claims: Dict[str, Any] = self._jwt.decode(
                 token, self.secret_key, algorithms=[self.algorithm]
@@ -26,14 +139,60 @@ class JWTProvider:
         except JWTError:
             raise InvalidToken
 
-    def create_access_token(self, data: Dict[str, Any]) -> TokenResponse:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=self.expire_minutes)
+    def cache_stats(self) -> Optional[CacheStats]:
+        return self._claims_cache.stats() if self._claims_cache is not None else None
+
+    def _encode(self, data: Dict[str, Any], expire: datetime) -> str:
+        if self._codec:
+            return self._codec.encode({**data, "exp": int(expire.timestamp())})
         to_encode = {**data.copy(), "exp": expire}
-        access_token = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
-        return TokenResponse(expire.timestamp(), access_token)
+        token: str = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
+        return token
+
+    def create_access_token(
+        self, data: Dict[str, Any], refresh_token: Optional[str] = None
+    ) -> TokenResponse:
+        expire = datetime.now(timezone.utc) + timedelta(minutes=self.expire_minutes)
+        access_token = self._encode(data, expire)
+        return TokenResponse(expire.timestamp(), access_token, refresh_token=refresh_token)
+
+    def create_refresh_token(self, user_id: str) -> str:
+        expire = datetime.now(timezone.utc) + timedelta(minutes=self.refresh_expire_minutes)
+        claims = {
+            "sub": f"user_id:{user_id}",
+            "jti": str(uuid4()),
+            "typ": self.REFRESH_TOKEN_TYPE,
+        }
+        return self._encode(claims, expire)
+
+    def decode_refresh_token(self, token: str) -> RefreshClaims:
+        # Bypasses the claims cache: refresh tokens are long-lived and rarely presented
+        claims = self._decode(token)
+        if not self.is_refresh_token(claims):
+            raise InvalidToken
+        try:
+            jti = UUID(claims["jti"])
+        except (KeyError, TypeError, ValueError):
+            raise InvalidToken
+        return RefreshClaims(
+            user_id=self.sub_from_claims(claims),
+            jti=jti,
+            expires_at=datetime.fromtimestamp(claims["exp"], timezone.utc),
+        )
+
+    @classmethod
+    def is_refresh_token(cls, claims: Dict[str, Any]) -> bool:
+        return bool(claims.get("typ") == cls.REFRESH_TOKEN_TYPE)
 
     def get_sub(self, token: str) -> str:
-        _, sub = self.decode(token).get("sub", "").split(":")
+        return self.sub_from_claims(self.decode(token))
+
+    @staticmethod
+    def sub_from_claims(claims: Dict[str, Any]) -> str:
+        try:
+            _, sub = str(claims.get("sub", "")).split(":")
+        except ValueError:
+            raise InvalidToken
         if not sub:
             raise InvalidToken
-        return str(sub)
+        return sub
@@ -0,0 +1,110 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.infra.auth.bloom import BloomFilter
+from app.infra.db import DBSession
+from app.infra.db.repositories.revoked_token import RevokedTokenRepo
+from app.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class RevocationList:
+    """Revoked refresh token ids, screened by an in-process bloom filter.
+
+    A token id missing from the filter is definitely not revoked, so the
+    common case costs a few hashes and no query. Filter hits, revoked or
+    false positive, are confirmed against the database. Revocations made by
+    other processes are picked up by `sync`, so they can be missed for at
+    most one sync interval.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[DBSession],
+        capacity: int = 100_000,
+        error_rate: float = 0.001,
+    ) -> None:
+        self._session_factory = session_factory
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._filter = BloomFilter(capacity, error_rate)
+        self._synced_at: Optional[datetime] = None
+        self._sync_task: Optional[asyncio.Task[None]] = None
+
+    async def load(self) -> None:
+        """Rebuild the filter from every unexpired revocation in the database."""
+        now = _utcnow()
+        async with self._session_factory() as session:
+            repo = RevokedTokenRepo(session)
+            await repo.delete_expired(now)
+            revoked = await repo.list_since(datetime.min.replace(tzinfo=timezone.utc), now)
+
+        # Leave headroom, so the error rate holds as revocations accumulate
+        bloom = BloomFilter(max(self.capacity, 2 * len(revoked)), self.error_rate)
+        for token in revoked:
+            bloom.add(token.jti.bytes)
+        self._filter = bloom
+        self._synced_at = now
+        logger.info(f"Loaded {len(revoked)} revoked tokens")
+
+    async def sync(self, overlap: timedelta = timedelta(seconds=5)) -> None:
+        """Add revocations made since the last sync, e.g. by other processes."""
+        if self._synced_at is None or self._filter.count >= self._filter.capacity:
+            await self.load()
+            return
+
+        now = _utcnow()
+        async with self._session_factory() as session:
+            # The overlap absorbs clock skew and commits landing during the last sync
+            revoked = await RevokedTokenRepo(session).list_since(
+                self._synced_at - overlap, now
+            )
+        for token in revoked:
+            self._filter.add(token.jti.bytes)
+        self._synced_at = now
+
+    async def start(self, sync_interval_seconds: float) -> None:
+        """Load the filter and keep syncing it in the background."""
+        await self.load()
+        if sync_interval_seconds > 0:
+            self._sync_task = asyncio.create_task(self._sync_forever(sync_interval_seconds))
+
+    async def stop(self) -> None:
+        if self._sync_task is None:
+            return
+        self._sync_task.cancel()
+        try:
+            await self._sync_task
+        except asyncio.CancelledError:
+            pass
+        self._sync_task = None
+
+    async def _sync_forever(self, interval_seconds: float) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.sync()
+            except Exception:
+                logger.exception("Failed to sync revoked tokens")
+
+    async def is_revoked(self, jti: UUID) -> bool:
+        if jti.bytes not in self._filter:
+            return False
+        async with self._session_factory() as session:
+            return await RevokedTokenRepo(session).exists(jti)
+
+    async def revoke(self, jti: UUID, expires_at: datetime) -> bool:
+        """Revoke a token until it expires, returning False if it already was."""
+        async with self._session_factory() as session:
+            revoked = await RevokedTokenRepo(session).add(jti, _utcnow(), expires_at)
+        self._filter.add(jti.bytes)
+        return revoked
@@ -0,0 +1,50 @@
+import itertools
+import secrets
+import time
+from typing import Callable, Dict, Tuple
+
+
+class InMemoryUserVersionStore:
+    """Per-process user versions, forgotten once no token can still carry them.
+
+    Users never bumped are at version 0. Each bump draws a fresh number from a
+    randomly seeded counter, so versions are never reused, even across restarts.
+    A bump is kept for `retention_seconds`, which must be at least the access
+    token lifetime: afterwards, tokens issued before it have expired and tokens
+    issued after it fall back to the database. Bumps are not shared between
+    worker processes nor kept across restarts, so stale claims there are
+    bounded by the token lifetime.
+    """
+
+    def __init__(
+        self, retention_seconds: float, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.retention_seconds = retention_seconds
+        self._clock = clock
+        self._counter = itertools.count(secrets.randbits(48) + 1)
+        self._versions: Dict[str, Tuple[int, float]] = {}
+
+    def current(self, user_id: str) -> int:
+        entry = self._versions.get(user_id)
+        if entry is None:
+            return 0
+
+        version, bumped_at = entry
+        if bumped_at + self.retention_seconds <= self._clock():
+            del self._versions[user_id]
+            return 0
+        return version
+
+    def bump(self, user_id: str) -> None:
+        now = self._clock()
+        self._prune(now)
+        self._versions[user_id] = (next(self._counter), now)
+
+    def _prune(self, now: float) -> None:
+        expired = [
+            user_id
+            for user_id, (_, bumped_at) in self._versions.items()
+            if bumped_at + self.retention_seconds <= now
+        ]
+        for user_id in expired:
+            del self._versions[user_id]
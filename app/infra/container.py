@@ -0,0 +1,119 @@
+from dataclasses import dataclass
+from typing import Optional, Self
+
+from app.config import Settings
+from app.infra.auth.api_keys import ApiKeyAuthenticator
+from app.infra.auth.jwt import JWTProvider
+from app.infra.auth.revocation import RevocationList
+from app.infra.auth.versions import InMemoryUserVersionStore
+from app.infra.db import async_read_session, async_session
+from app.infra.db.replicas import ReplicaRouter
+from app.infra.db.sharding import ShardSet
+from app.infra.memory.user import InMemoryUserStore
+from app.infra.security.credential_cache import HMACCredentialCache
+from app.infra.security.crypto import PooledHasher, calibrate_bcrypt_rounds
+from app.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+@dataclass(frozen=True)
+class Container:
+    """Application-scoped singletons for stateless services.
+
+    Built once at startup and shared by every request, so dependencies
+    resolve to a lookup instead of constructing services per request.
+    """
+
+    settings: Settings
+    hasher: PooledHasher
+    token_provider: JWTProvider
+    api_keys: ApiKeyAuthenticator
+    credential_cache: Optional[HMACCredentialCache] = None
+    user_versions: Optional[InMemoryUserVersionStore] = None
+    revocations: Optional[RevocationList] = None
+    replicas: Optional[ReplicaRouter] = None
+    shards: Optional[ShardSet] = None
+    users: Optional[InMemoryUserStore] = None
+
+    @classmethod
+    def build(cls, settings: Settings) -> Self:
+        rounds = settings.HASHER_BCRYPT_ROUNDS
+        if rounds is None and settings.HASHER_TARGET_VERIFY_MS:
+            rounds = calibrate_bcrypt_rounds(
+                settings.HASHER_TARGET_VERIFY_MS, min_rounds=settings.HASHER_BCRYPT_MIN_ROUNDS
+            )
+            logger.info(f"Calibrated bcrypt cost to {rounds} rounds")
+
+        hasher = PooledHasher(
+            rounds=rounds,
+            executor=settings.HASHER_EXECUTOR,
+            workers=settings.HASHER_WORKERS,
+            max_in_flight=settings.HASHER_MAX_IN_FLIGHT,
+            max_queue=settings.HASHER_MAX_QUEUE,
+        )
+        token_provider = JWTProvider(
+            settings.JWT_SECRET_KEY,
+            settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES,
+            settings.JWT_ALGORITHM,
+            cache_size=settings.JWT_CLAIMS_CACHE_SIZE,
+            refresh_expire_minutes=settings.JWT_REFRESH_TOKEN_EXPIRE_MINUTES,
+        )
+        api_keys = ApiKeyAuthenticator(
+            async_session,
+            ttl_seconds=settings.API_KEY_CACHE_TTL_SECONDS,
+            max_size=settings.API_KEY_CACHE_MAX_SIZE,
+        )
+        revocations = None
+        if settings.JWT_REFRESH_TOKEN_EXPIRE_MINUTES > 0:
+            revocations = RevocationList(
+                async_session, capacity=settings.JWT_REVOCATION_FILTER_CAPACITY
+            )
+        credential_cache = None
+        if settings.AUTH_CREDENTIAL_CACHE_ENABLED:
+            credential_cache = HMACCredentialCache(
+                settings.AUTH_CREDENTIAL_CACHE_TTL_SECONDS,
+                settings.AUTH_CREDENTIAL_CACHE_MAX_SIZE,
+            )
+        user_versions = None
+        if settings.JWT_STATELESS_CURRENT_USER:
+            user_versions = InMemoryUserVersionStore(
+                retention_seconds=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60
+            )
+        replicas = None
+        if settings.DB_REPLICA_URLS:
+            replicas = ReplicaRouter.from_settings(settings, async_read_session)
+        shards = None
+        if settings.DB_SHARD_URLS:
+            shards = ShardSet.from_settings(settings, async_session)
+        users = None
+        if settings.DB_BACKEND == "memory":
+            users = InMemoryUserStore()
+        return cls(
+            settings=settings,
+            hasher=hasher,
+            token_provider=token_provider,
+            api_keys=api_keys,
+            credential_cache=credential_cache,
+            user_versions=user_versions,
+            revocations=revocations,
+            replicas=replicas,
+            shards=shards,
+            users=users,
+        )
+
+    async def start(self) -> None:
+        """Warm up services that need I/O before the first request."""
+        if self.revocations:
+            await self.revocations.start(self.settings.JWT_REVOCATION_SYNC_SECONDS)
+        if self.replicas:
+            await self.replicas.start(self.settings.DB_REPLICA_CHECK_SECONDS)
+
+    async def stop(self) -> None:
+        if self.revocations:
+            await self.revocations.stop()
+        if self.replicas:
+            await self.replicas.stop()
+        if self.shards:
+            await self.shards.dispose()
+        self.hasher.shutdown()
@@ -1,8 +1,108 @@
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from typing import Any, Dict
+from uuid import uuid4
+
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool, QueuePool
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.config import get_settings
+from app.config import Settings, get_settings
+from app.infra.db.pipeline import PipelineCursor
+from app.infra.db.pool import InstrumentedAsyncPool
+from app.infra.db.sqlite import apply_pragmas, is_sqlite_file
+
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid4()}__"
+
+
+def engine_options(settings: Settings, read_only: bool = False) -> Dict[str, Any]:
+    """Keyword arguments for create_async_engine built from the DB_* settings.
+
+    On a SQLite file, `read_only` selects the reader pool instead of the
+    single writer connection.
+    """
+    url = make_url(settings.DB_URL)
+    options: Dict[str, Any] = {
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
+    default_pool = url.get_dialect(_is_async=True).get_pool_class(url)  # type: ignore[attr-defined]
+    if settings.DB_TRANSACTION_POOLER:
+        # The pooler multiplexes server connections itself; idle ones held here are wasted
+        options["poolclass"] = NullPool
+    elif issubclass(default_pool, QueuePool):
+        # Not for in-memory SQLite, whose single static connection cannot be sized
+        pool_size, max_overflow = settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW
+        if is_sqlite_file(url):
+            # SQLite takes one writer at a time, so writers queue here instead of
+            # spinning on SQLITE_BUSY, while WAL lets readers run alongside
+            pool_size, max_overflow = (settings.DB_SQLITE_READERS, 0) if read_only else (1, 0)
+        options.update(
+            poolclass=InstrumentedAsyncPool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+        )
+
+    if url.get_driver_name() == "asyncpg":
+        connect_args: Dict[str, Any] = {}
+        if settings.DB_STATEMENT_CACHE_SIZE is not None:
+            connect_args["statement_cache_size"] = settings.DB_STATEMENT_CACHE_SIZE
+        if settings.DB_SERVER_SETTINGS:
+            connect_args["server_settings"] = dict(settings.DB_SERVER_SETTINGS)
+        if settings.DB_TRANSACTION_POOLER:
+            # Consecutive transactions may land on different server connections, so
+            # statements must not be cached across them and names must never collide
+            connect_args.update(
+                statement_cache_size=0,
+                prepared_statement_cache_size=0,
+                prepared_statement_name_func=_unique_statement_name,
+            )
+        options["connect_args"] = connect_args
+
+    if url.get_driver_name() == "psycopg":
+        connect_args = {}
+        if settings.DB_PIPELINE:
+            connect_args["cursor_factory"] = PipelineCursor
+        if settings.DB_TRANSACTION_POOLER:
+            # Server-side prepared statements do not outlive a pooled transaction
+            connect_args["prepare_threshold"] = None
+        options["connect_args"] = connect_args
+
+    return options
+
+
+def create_engine(settings: Settings, read_only: bool = False) -> AsyncEngine:
+    """Engine for DB_URL, with SQLite connections tuned as they are opened."""
+    engine = create_async_engine(settings.DB_URL, **engine_options(settings, read_only))
+    if engine.dialect.name == "sqlite":
+        apply_pragmas(engine, settings, read_only)
+    return engine
+
+
+def create_read_engine(settings: Settings, engine: AsyncEngine) -> AsyncEngine:
+    """Separate reader pool on a SQLite file; every other database reads through `engine`."""
+    if is_sqlite_file(engine.url):
+        return create_engine(settings, read_only=True)
+    return engine
+
+
+def dialect_insert(session: AsyncSession, entity: Any) -> Any:
+    """INSERT for the session's dialect, which takes ON CONFLICT clauses."""
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql_insert(entity)
+    if dialect == "sqlite":
+        return sqlite_insert(entity)
+    raise NotImplementedError(f"INSERT ... ON CONFLICT is not supported on {dialect}")
+
 
 DBSession = AsyncSession
-engine = create_async_engine(get_settings().DB_URL)
+engine = create_engine(get_settings())
 async_session = async_sessionmaker(engine, class_=DBSession, expire_on_commit=False)
+read_engine = create_read_engine(get_settings(), engine)
+async_read_session = async_sessionmaker(read_engine, class_=DBSession, expire_on_commit=False)
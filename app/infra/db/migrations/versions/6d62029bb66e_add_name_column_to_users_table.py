@@ -27,12 +27,14 @@ def upgrade() -> None:
         ),
     )
 
-    # Remove the server default after adding the column
-    op.alter_column("users", "name", server_default=None)
+    # Batched, so SQLite recreates the table for changes it cannot ALTER
+    with op.batch_alter_table("users") as batch_op:
+        # Remove the server default after adding the column
+        batch_op.alter_column("name", server_default=None)
 
-    # Drop the created_at and updated_at columns that aren't in the model
-    op.drop_column("users", "created_at")
-    op.drop_column("users", "updated_at")
+        # Drop the created_at and updated_at columns that aren't in the model
+        batch_op.drop_column("created_at")
+        batch_op.drop_column("updated_at")
 
 
 def downgrade() -> None:
@@ -44,4 +46,5 @@ def downgrade() -> None:
     op.add_column("users", sa.Column("updated_at", sa.DateTime(), nullable=True))
 
     # Remove the name column
-    op.drop_column("users", "name")
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_column("name")
@@ -0,0 +1,43 @@
+"""Add revoked_tokens table
+
+Revision ID: a3c9e1f4b2d7
+Revises: 6d62029bb66e
+Create Date: 2026-10-17 09:12:44.318205
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.infra.db.types import UUIDType
+
+
+# revision identifiers, used by Alembic.
+revision = "a3c9e1f4b2d7"
+down_revision = "6d62029bb66e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Create revoked_tokens table
+    op.create_table(
+        "revoked_tokens",
+        sa.Column("jti", UUIDType(), nullable=False),
+        sa.Column("revoked_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("jti"),
+    )
+    op.create_index(
+        op.f("ix_revoked_tokens_revoked_at"), "revoked_tokens", ["revoked_at"], unique=False
+    )
+    op.create_index(
+        op.f("ix_revoked_tokens_expires_at"), "revoked_tokens", ["expires_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    # Drop revoked_tokens table
+    op.drop_index(op.f("ix_revoked_tokens_expires_at"), table_name="revoked_tokens")
+    op.drop_index(op.f("ix_revoked_tokens_revoked_at"), table_name="revoked_tokens")
+    op.drop_table("revoked_tokens")
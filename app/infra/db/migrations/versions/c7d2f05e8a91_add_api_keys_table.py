@@ -0,0 +1,42 @@
+"""Add api_keys table
+
+Revision ID: c7d2f05e8a91
+Revises: a3c9e1f4b2d7
+Create Date: 2026-10-17 11:03:27.540118
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+from app.infra.db.types import UUIDType
+
+
+# revision identifiers, used by Alembic.
+revision = "c7d2f05e8a91"
+down_revision = "a3c9e1f4b2d7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Create api_keys table
+    op.create_table(
+        "api_keys",
+        sa.Column("id", UUIDType(), nullable=False),
+        sa.Column("user_id", UUIDType(), nullable=False),
+        sa.Column("name", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("key_digest", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_api_keys_user_id"), "api_keys", ["user_id"], unique=False)
+    op.create_index(op.f("ix_api_keys_key_digest"), "api_keys", ["key_digest"], unique=True)
+
+
+def downgrade() -> None:
+    # Drop api_keys table
+    op.drop_index(op.f("ix_api_keys_key_digest"), table_name="api_keys")
+    op.drop_index(op.f("ix_api_keys_user_id"), table_name="api_keys")
+    op.drop_table("api_keys")
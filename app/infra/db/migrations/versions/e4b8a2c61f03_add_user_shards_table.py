@@ -0,0 +1,33 @@
+"""Add user_shards table
+
+Revision ID: e4b8a2c61f03
+Revises: c7d2f05e8a91
+Create Date: 2026-10-17 15:42:08.311524
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision = "e4b8a2c61f03"
+down_revision = "c7d2f05e8a91"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Create user_shards table, the email directory of sharded users
+    op.create_table(
+        "user_shards",
+        sa.Column("email", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("shard", sa.SmallInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("email"),
+    )
+
+
+def downgrade() -> None:
+    # Drop user_shards table
+    op.drop_table("user_shards")
@@ -0,0 +1,16 @@
+from uuid import UUID
+
+from sqlmodel import Field, SQLModel
+
+from app.infra.db.types import UUIDType
+
+
+class ApiKey(SQLModel, table=True):
+    __tablename__ = "api_keys"
+
+    id: UUID = Field(primary_key=True, sa_type=UUIDType)
+    user_id: UUID = Field(
+        foreign_key="users.id", index=True, ondelete="CASCADE", sa_type=UUIDType
+    )
+    name: str
+    key_digest: str = Field(unique=True, index=True)
@@ -0,0 +1,15 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import DateTime
+from sqlmodel import Field, SQLModel
+
+from app.infra.db.types import UUIDType
+
+
+class RevokedToken(SQLModel, table=True):
+    __tablename__ = "revoked_tokens"
+
+    jti: UUID = Field(primary_key=True, sa_type=UUIDType)
+    revoked_at: datetime = Field(sa_type=DateTime(timezone=True), index=True)
+    expires_at: datetime = Field(sa_type=DateTime(timezone=True), index=True)
@@ -2,11 +2,13 @@ from uuid import UUID
 
 from sqlmodel import Field, SQLModel
 
+from app.infra.db.types import UUIDType
+
 
 class User(SQLModel, table=True):
     __tablename__ = "users"
 
-    id: UUID = Field(primary_key=True)
+    id: UUID = Field(primary_key=True, sa_type=UUIDType)
     name: str
     email: str = Field(unique=True)
     password_hash: str
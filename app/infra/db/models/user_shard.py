@@ -0,0 +1,9 @@
+from sqlalchemy import SmallInteger
+from sqlmodel import Field, SQLModel
+
+
+class UserShard(SQLModel, table=True):
+    __tablename__ = "user_shards"
+
+    email: str = Field(primary_key=True)
+    shard: int = Field(sa_type=SmallInteger)
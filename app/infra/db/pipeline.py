@@ -0,0 +1,96 @@
+import re
+from contextlib import AsyncExitStack, contextmanager, suppress
+from typing import Any, Iterator, Optional, Self
+from weakref import WeakKeyDictionary
+
+from psycopg import AsyncConnection, AsyncCursor, AsyncPipeline
+from psycopg import Error as PsycopgError
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Statements whose results SQLAlchemy never reads, so they can wait for the next sync
+_DEFERRABLE = re.compile(r"\s*(?:INSERT\b(?!.*\bRETURNING\b)|COMMIT\b)", re.I | re.S)
+
+_pipelines: "WeakKeyDictionary[AsyncConnection[Any], AsyncPipeline]" = WeakKeyDictionary()
+
+
+@contextmanager
+def _wrap_errors() -> Iterator[None]:
+    # Deferred statements fail on a later execute or sync, outside SQLAlchemy's reach
+    try:
+        yield
+    except PsycopgError as e:
+        raise DBAPIError.instance(None, None, e, PsycopgError) from e
+
+
+class PipelineCursor(AsyncCursor[Any]):
+    """psycopg cursor that keeps SQLAlchemy working in pipeline mode.
+
+    SQLAlchemy reads rows and rowcounts right after executing, but in
+    pipeline mode those only arrive on sync. So statements are synced as
+    they run, except the deferrable ones, which share the next round trip.
+    """
+
+    async def execute(self, query: Any, params: Any = None, **kwargs: Any) -> Self:
+        await super().execute(query, params, **kwargs)
+        pipeline = _pipelines.get(self.connection)
+        if pipeline is not None and not (isinstance(query, str) and _DEFERRABLE.match(query)):
+            await pipeline.sync()
+        return self
+
+
+class SessionPipeline:
+    """Runs a session's transaction in psycopg pipeline mode.
+
+    BEGIN goes out with the first statement, and pending inserts go out
+    with COMMIT, so a typical unit of work needs two round trips. The
+    pipeline is left before SQLAlchemy gets the connection back, so the
+    pool only ever holds connections in normal mode.
+    """
+
+    def __init__(self, session: AsyncSession, connection: AsyncConnection[Any]) -> None:
+        self.session = session
+        self._connection = connection
+        self._stack = AsyncExitStack()
+
+    @classmethod
+    async def start(cls, session: AsyncSession) -> Optional[Self]:
+        """Enter pipeline mode, if the session runs on a pipeline-capable connection."""
+        if session.bind is None or session.bind.dialect.driver != "psycopg":
+            return None
+        raw = await (await session.connection()).get_raw_connection()
+        driver_connection = raw.driver_connection
+        if not isinstance(driver_connection, AsyncConnection):
+            return None
+        if driver_connection.cursor_factory is not PipelineCursor:
+            return None
+
+        self = cls(session, driver_connection)
+        pipeline = await self._stack.enter_async_context(driver_connection.pipeline())
+        _pipelines[driver_connection] = pipeline
+        return self
+
+    async def commit(self) -> None:
+        """Flush pending changes and commit them in the same round trip."""
+        with _wrap_errors():
+            await self._commit()
+
+    async def close(self) -> None:
+        """Leave pipeline mode, sending whatever is still queued."""
+        with _wrap_errors():
+            await self._exit()
+
+    async def _commit(self) -> None:
+        try:
+            await self.session.flush()
+            async with self._connection.cursor() as cursor:
+                await cursor.execute("COMMIT")
+        except BaseException:
+            with suppress(PsycopgError):
+                await self._exit()
+            raise
+        await self._exit()
+
+    async def _exit(self) -> None:
+        _pipelines.pop(self._connection, None)
+        await self._stack.aclose()
@@ -0,0 +1,71 @@
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    max_overflow: int
+    acquired: int
+    timeouts: int
+    wait_total_ms: float
+    wait_max_ms: float
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """Queue pool that also records how long checkouts wait for a connection."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._acquired = 0
+        self._timeouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except exc.TimeoutError:
+            self._timeouts += 1
+            raise
+        waited = time.perf_counter() - start
+        self._acquired += 1
+        self._wait_total += waited
+        self._wait_max = max(self._wait_max, waited)
+        return entry
+
+    def recreate(self) -> "InstrumentedAsyncPool":
+        # Keep the counters across engine.dispose(), which swaps in a fresh pool
+        pool = super().recreate()
+        assert isinstance(pool, InstrumentedAsyncPool)
+        pool._acquired, pool._timeouts = self._acquired, self._timeouts
+        pool._wait_total, pool._wait_max = self._wait_total, self._wait_max
+        return pool
+
+    def stats(self) -> PoolStats:
+        return PoolStats(
+            size=self.size(),
+            checked_in=self.checkedin(),
+            checked_out=self.checkedout(),
+            overflow=self.overflow(),
+            max_overflow=self._max_overflow,
+            acquired=self._acquired,
+            timeouts=self._timeouts,
+            wait_total_ms=self._wait_total * 1000,
+            wait_max_ms=self._wait_max * 1000,
+        )
+
+
+def pool_stats(engine: AsyncEngine) -> Optional[PoolStats]:
+    """Stats of the engine's pool, if it is an instrumented queue pool."""
+    pool = engine.pool
+    return pool.stats() if isinstance(pool, InstrumentedAsyncPool) else None
@@ -0,0 +1,171 @@
+import asyncio
+import itertools
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Literal, Optional, Self, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from app.config import Settings
+from app.infra.db import DBSession, create_engine
+from app.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+ReplicaStrategy = Literal["round_robin", "least_connections"]
+
+# Zero while the standby has replayed everything it received, so an idle primary
+# does not make it look more and more behind
+_POSTGRES_LAG = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+    " END"
+)
+
+
+@dataclass(frozen=True)
+class ReplicaStats:
+    url: str
+    in_use: int
+    lag_seconds: Optional[float]
+    healthy: bool
+
+
+class Replica:
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.engine = engine
+        self.sessions = async_sessionmaker(engine, class_=DBSession, expire_on_commit=False)
+        self.in_use = 0
+        self.lag_seconds: Optional[float] = None
+        self.healthy = True
+
+    def stats(self) -> ReplicaStats:
+        return ReplicaStats(
+            url=self.engine.url.render_as_string(hide_password=True),
+            in_use=self.in_use,
+            lag_seconds=self.lag_seconds,
+            healthy=self.healthy,
+        )
+
+
+class ReplicaRouter:
+    """Hands out read-only sessions on replicas, falling back to the primary.
+
+    Replicas are picked round-robin or by fewest sessions in use. `check`
+    measures each replica's replication lag; those that failed the check, or
+    lag more than `max_lag_seconds` behind, are skipped until a later check
+    clears them. When no replica qualifies, reads go to the primary.
+    """
+
+    def __init__(
+        self,
+        primary: async_sessionmaker[DBSession],
+        engines: Sequence[AsyncEngine],
+        strategy: ReplicaStrategy = "round_robin",
+        max_lag_seconds: Optional[float] = None,
+    ) -> None:
+        self._primary = primary
+        self.replicas = [Replica(engine) for engine in engines]
+        self.strategy = strategy
+        self.max_lag_seconds = max_lag_seconds
+        self._turn = itertools.count()
+        self._check_task: Optional[asyncio.Task[None]] = None
+
+    @classmethod
+    def from_settings(cls, settings: Settings, primary: async_sessionmaker[DBSession]) -> Self:
+        """One engine per DB_REPLICA_URLS entry, pooled like the primary."""
+        engines = [
+            create_engine(settings.model_copy(update={"DB_URL": url}))
+            for url in settings.DB_REPLICA_URLS
+        ]
+        return cls(
+            primary,
+            engines,
+            strategy=settings.DB_REPLICA_STRATEGY,
+            max_lag_seconds=settings.DB_REPLICA_MAX_LAG_SECONDS,
+        )
+
+    def available(self) -> List[Replica]:
+        """Replicas that passed their last check and are within the lag budget."""
+        return [
+            replica
+            for replica in self.replicas
+            if replica.healthy
+            and (
+                self.max_lag_seconds is None
+                or (
+                    replica.lag_seconds is not None
+                    and replica.lag_seconds <= self.max_lag_seconds
+                )
+            )
+        ]
+
+    def pick(self) -> Optional[Replica]:
+        available = self.available()
+        if not available:
+            return None
+        if self.strategy == "least_connections":
+            return min(available, key=lambda replica: replica.in_use)
+        return available[next(self._turn) % len(available)]
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[DBSession]:
+        """A session for read-only work, on a replica whenever one qualifies."""
+        replica = self.pick()
+        if replica is None:
+            async with self._primary() as session:
+                yield session
+            return
+
+        replica.in_use += 1
+        try:
+            async with replica.sessions() as session:
+                yield session
+        finally:
+            replica.in_use -= 1
+
+    async def check(self) -> None:
+        """Refresh the lag and health of every replica."""
+        for replica in self.replicas:
+            try:
+                replica.lag_seconds = await self._measure_lag(replica)
+                replica.healthy = True
+            except Exception:
+                if replica.healthy:
+                    logger.exception(f"Replica {replica.stats().url} failed its check")
+                replica.healthy = False
+
+    async def _measure_lag(self, replica: Replica) -> float:
+        async with replica.engine.connect() as conn:
+            if replica.engine.dialect.name != "postgresql":
+                # No replication to measure, only whether it answers
+                await conn.execute(text("SELECT 1"))
+                return 0.0
+            lag = await conn.scalar(_POSTGRES_LAG)
+            return float(lag or 0)
+
+    async def start(self, check_interval_seconds: float) -> None:
+        """Check every replica and keep checking them in the background."""
+        await self.check()
+        if check_interval_seconds > 0:
+            self._check_task = asyncio.create_task(self._check_forever(check_interval_seconds))
+
+    async def stop(self) -> None:
+        if self._check_task is not None:
+            self._check_task.cancel()
+            try:
+                await self._check_task
+            except asyncio.CancelledError:
+                pass
+            self._check_task = None
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    async def _check_forever(self, interval_seconds: float) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            await self.check()
+
+    def stats(self) -> List[ReplicaStats]:
+        return [replica.stats() for replica in self.replicas]
@@ -0,0 +1,41 @@
+from typing import Optional
+from uuid import UUID
+
+from sqlmodel import col, select
+
+from app.core.dtos.user import UserResponse
+from app.infra.db import DBSession
+from app.infra.db.models.api_key import ApiKey
+from app.infra.db.models.user import User as DBUser
+
+
+class ApiKeyRepo:
+    def __init__(self, session: DBSession) -> None:
+        self.session = session
+
+    async def create(self, _id: UUID, user_id: UUID, name: str, key_digest: str) -> None:
+        """Store a new API key by its digest."""
+        self.session.add(ApiKey(id=_id, user_id=user_id, name=name, key_digest=key_digest))
+        await self.session.commit()
+
+    async def get_user_by_digest(self, key_digest: str) -> Optional[UserResponse]:
+        """Get the user owning the API key with the given digest."""
+        result = await self.session.exec(
+            select(DBUser.id, DBUser.name, DBUser.email)
+            .join(ApiKey, col(ApiKey.user_id) == col(DBUser.id))
+            .where(ApiKey.key_digest == key_digest)
+        )
+        row = result.first()
+        if not row:
+            return None
+        _id, name, email = row
+        return UserResponse(id=str(_id), name=name, email=email)
+
+    async def delete(self, _id: UUID, user_id: UUID) -> Optional[str]:
+        """Delete a user's API key, returning its digest if it existed."""
+        api_key = await self.session.get(ApiKey, _id)
+        if not api_key or api_key.user_id != user_id:
+            return None
+        await self.session.delete(api_key)
+        await self.session.commit()
+        return api_key.key_digest
@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import col, select
+
+from app.infra.db import DBSession
+from app.infra.db.models.revoked_token import RevokedToken
+
+
+class RevokedTokenRepo:
+    def __init__(self, session: DBSession) -> None:
+        self.session = session
+
+    async def add(self, jti: UUID, revoked_at: datetime, expires_at: datetime) -> bool:
+        """Record a revoked token, returning False if it was already revoked."""
+        self.session.add(RevokedToken(jti=jti, revoked_at=revoked_at, expires_at=expires_at))
+        try:
+            await self.session.commit()
+        except IntegrityError:
+            await self.session.rollback()
+            return False
+        return True
+
+    async def exists(self, jti: UUID) -> bool:
+        """Check whether a token was revoked."""
+        return await self.session.get(RevokedToken, jti) is not None
+
+    async def list_since(self, revoked_since: datetime, now: datetime) -> List[RevokedToken]:
+        """List unexpired revocations made at or after revoked_since."""
+        result = await self.session.exec(
+            select(RevokedToken).where(
+                RevokedToken.revoked_at >= revoked_since, RevokedToken.expires_at > now
+            )
+        )
+        return list(result.all())
+
+    async def delete_expired(self, now: datetime) -> None:
+        """Delete revocations of tokens that expired anyway."""
+        await self.session.execute(
+            delete(RevokedToken).where(col(RevokedToken.expires_at) <= now)
+        )
+        await self.session.commit()
@@ -0,0 +1,126 @@
+import asyncio
+from typing import Dict, List, Optional, Sequence
+from uuid import uuid4
+
+from app.core.dtos.user import UserResponse
+from app.core.entities.user import User
+from app.core.value_objects.email import Email
+from app.core.value_objects.id import ID
+from app.core.value_objects.password import Password
+from app.infra.db.repositories.user import UserRepo
+from app.infra.db.sharding import CrossShardWriteError, ShardSessions
+
+
+class ShardedUserRepo:
+    """UserRepo over users hash-partitioned by ID, found by email through the directory."""
+
+    def __init__(self, sessions: ShardSessions) -> None:
+        self.sessions = sessions
+
+    def _shard(self, _id: ID) -> int:
+        return self.sessions.shards.shard_for(_id.value)
+
+    def _reader(self, _id: ID) -> UserRepo:
+        return UserRepo(self.sessions.get(self._shard(_id)))
+
+    def _writer(self, _id: ID) -> UserRepo:
+        return UserRepo(self.sessions.bind(self._shard(_id)))
+
+    def new_id(self) -> str:
+        """Generate a new UUID string for user ID."""
+        return str(uuid4())
+
+    async def create(self, user: User) -> UserResponse:
+        """Create a new user on its shard and claim its email in the directory."""
+        repo = self._writer(user.id)
+        await self.sessions.claim(user.email.value, self._shard(user.id))
+        return await repo.create(user)
+
+    async def create_many(self, users: Sequence[User]) -> List[Email]:
+        """Not supported: a batch would span shards, and a unit of work writes to one."""
+        raise CrossShardWriteError("Bulk creation is not supported on sharded storage")
+
+    async def save(self, user: User) -> None:
+        """Save user (for backward compatibility)."""
+        repo = self._writer(user.id)
+        await self.sessions.claim(user.email.value, self._shard(user.id))
+        await repo.save(user)
+
+    async def get_by_email(self, email: Email) -> Optional[User]:
+        """Get user by email address, from the shard the directory points to."""
+        index = await self.sessions.locate(email.value)
+        if index is None:
+            return None
+        return await UserRepo(self.sessions.get(index)).get_by_email(email)
+
+    async def get_by_id(self, _id: ID) -> Optional[User]:
+        """Get user by ID."""
+        return await self._reader(_id).get_by_id(_id)
+
+    async def get_many_by_ids(self, ids: Sequence[ID]) -> List[User]:
+        """Get users by IDs, with one query per shard run concurrently."""
+        by_shard: Dict[int, List[ID]] = {}
+        for _id in ids:
+            by_shard.setdefault(self._shard(_id), []).append(_id)
+        found = await asyncio.gather(
+            *(
+                UserRepo(self.sessions.get(index)).get_many_by_ids(group)
+                for index, group in by_shard.items()
+            )
+        )
+        return [user for users in found for user in users]
+
+    async def get_response_by_id(self, _id: ID) -> Optional[UserResponse]:
+        """Get the public fields of a user by ID."""
+        return await self._reader(_id).get_response_by_id(_id)
+
+    async def get_many_responses_by_ids(self, ids: Sequence[ID]) -> List[UserResponse]:
+        """Get the public fields of users by IDs, with one query per shard run concurrently."""
+        by_shard: Dict[int, List[ID]] = {}
+        for _id in ids:
+            by_shard.setdefault(self._shard(_id), []).append(_id)
+        found = await asyncio.gather(
+            *(
+                UserRepo(self.sessions.get(index)).get_many_responses_by_ids(group)
+                for index, group in by_shard.items()
+            )
+        )
+        return [user for users in found for user in users]
+
+    async def delete(self, _id: ID) -> bool:
+        """Delete user by ID, releasing its email."""
+        deleted = await self._writer(_id).delete_returning(_id)
+        if not deleted:
+            return False
+        await self.sessions.release(deleted.email)
+        return True
+
+    async def update(self, user: User) -> Optional[User]:
+        """Update existing user, moving its directory entry if the email changed."""
+        repo = self._writer(user.id)
+        existing = await repo.get_by_id(user.id)
+        if not existing:
+            return None
+        if existing.email != user.email:
+            await self.sessions.release(existing.email.value)
+            await self.sessions.claim(user.email.value, self._shard(user.id))
+        return await repo.update(user)
+
+    async def update_profile(
+        self, _id: ID, name: Optional[str] = None, email: Optional[Email] = None
+    ) -> Optional[UserResponse]:
+        """Update the given fields of a user, moving its directory entry on email change."""
+        repo = self._writer(_id)
+        if email is not None:
+            # The directory needs the old email, which RETURNING cannot give
+            existing = await repo.get_response_by_id(_id)
+            if not existing:
+                return None
+            if existing.email != email.value:
+                await self.sessions.release(existing.email)
+                await self.sessions.claim(email.value, self._shard(_id))
+        return await repo.update_profile(_id, name=name, email=email)
+
+    async def update_password(self, _id: ID, password: Password) -> bool:
+        """Replace user password hash."""
+        return await self._writer(_id).update_password(_id, password)
@@ -1,16 +1,30 @@
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence, Set
 from uuid import uuid4
 
-from sqlmodel import select
+from sqlalchemy import Row, delete, text, update
+from sqlmodel import col, select
 
 from app.core.dtos.user import UserResponse
 from app.core.entities.user import User
+from app.core.exceptions import UserAlreadyExistsError
 from app.core.value_objects.email import Email
 from app.core.value_objects.id import ID
 from app.core.value_objects.password import Password
-from app.infra.db import DBSession
+from app.infra.db import DBSession, dialect_insert
 from app.infra.db.models.user import User as DBUser
 
+# Keeps multi-row INSERTs well under the bind parameter limits of every dialect
+INSERT_CHUNK_SIZE = 500
+
+
+# Public fields only: reads that end in a UserResponse skip the password hash
+# and the identity map
+RESPONSE_COLUMNS = (col(DBUser.id), col(DBUser.name), col(DBUser.email))
+
+
+def to_response(row: Row) -> UserResponse:
+    return UserResponse(id=str(row.id), name=row.name, email=row.email)
+
 
 class UserRepo:
     def __init__(self, session: DBSession) -> None:
@@ -21,14 +35,25 @@ class UserRepo:
         return str(uuid4())
 
     async def create(self, user: User) -> UserResponse:
-        """Create a new user and return the response."""
-        db_user = DBUser(
-            id=user.id.value,
-            name=user.name,
-            email=user.email.value,
-            password_hash=user.password.value,
+        """Create a new user in a single statement and return the response.
+
+        Raises:
+            UserAlreadyExistsError: If the email is taken, even by a concurrent
+                transaction that committed first.
+        """
+        result = await self.session.execute(
+            dialect_insert(self.session, DBUser)
+            .values(
+                id=user.id.value,
+                name=user.name,
+                email=user.email.value,
+                password_hash=user.password.value,
+            )
+            .on_conflict_do_nothing(index_elements=[col(DBUser.email)])
+            .returning(col(DBUser.id))
         )
-        self.session.add(db_user)
+        if result.first() is None:
+            raise UserAlreadyExistsError(f"User with email {user.email.value} already exists")
         return UserResponse(id=str(user.id), name=user.name, email=user.email.value)
 
     async def get_by_email(self, email: Email) -> Optional[User]:
@@ -45,6 +70,62 @@ class UserRepo:
             password=Password(db_user.password_hash),
         )
 
+    async def create_many(self, users: Sequence[User]) -> List[Email]:
+        """Create users in bulk, returning the emails skipped because they are taken.
+
+        On asyncpg the rows are copied into a staging table and merged from
+        there; other drivers send multi-row INSERTs.
+        """
+        rows = [
+            {
+                "id": user.id.value,
+                "name": user.name,
+                "email": user.email.value,
+                "password_hash": user.password.value,
+            }
+            for user in users
+        ]
+        if not rows:
+            return []
+        if self.session.get_bind().dialect.driver == "asyncpg":
+            created = await self._copy_and_merge(rows)
+        else:
+            created = set()
+            for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+                result = await self.session.execute(
+                    dialect_insert(self.session, DBUser)
+                    .values(rows[start : start + INSERT_CHUNK_SIZE])
+                    .on_conflict_do_nothing(index_elements=[col(DBUser.email)])
+                    .returning(col(DBUser.email))
+                )
+                created.update(result.scalars())
+        return [user.email for user in users if user.email.value not in created]
+
+    async def _copy_and_merge(self, rows: List[Dict[str, Any]]) -> Set[str]:
+        columns = list(rows[0])
+        names = ", ".join(columns)
+        # Dropped with the transaction at the latest, so it also works behind a pooler
+        await self.session.execute(
+            text(
+                f"CREATE TEMP TABLE users_import (LIKE {DBUser.__tablename__}) ON COMMIT DROP"
+            )
+        )
+        connection = await self.session.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            "users_import", records=[tuple(row.values()) for row in rows], columns=columns
+        )
+        result = await self.session.execute(
+            text(
+                f"INSERT INTO {DBUser.__tablename__} ({names}) "
+                f"SELECT {names} FROM users_import "
+                "ON CONFLICT (email) DO NOTHING RETURNING email"
+            )
+        )
+        created = set(result.scalars())
+        await self.session.execute(text("DROP TABLE users_import"))
+        return created
+
     async def save(self, user: User) -> None:
         """Save user (for backward compatibility)."""
         db_user = DBUser(
@@ -68,21 +149,89 @@ class UserRepo:
             password=Password(db_user.password_hash),
         )
 
+    async def get_many_by_ids(self, ids: Sequence[ID]) -> List[User]:
+        """Get users by IDs in a single query."""
+        if not ids:
+            return []
+        result = await self.session.exec(
+            select(DBUser).where(col(DBUser.id).in_([_id.value for _id in ids]))
+        )
+        return [
+            User(
+                id=ID.from_string(str(db_user.id)),
+                name=db_user.name,
+                email=Email(db_user.email),
+                password=Password(db_user.password_hash),
+            )
+            for db_user in result.all()
+        ]
+
+    async def get_response_by_id(self, _id: ID) -> Optional[UserResponse]:
+        """Get the public fields of a user by ID."""
+        result = await self.session.execute(
+            select(*RESPONSE_COLUMNS).where(col(DBUser.id) == _id.value).limit(1)
+        )
+        row = result.first()
+        return to_response(row) if row else None
+
+    async def get_many_responses_by_ids(self, ids: Sequence[ID]) -> List[UserResponse]:
+        """Get the public fields of users by IDs in a single query."""
+        if not ids:
+            return []
+        result = await self.session.execute(
+            select(*RESPONSE_COLUMNS).where(col(DBUser.id).in_([_id.value for _id in ids]))
+        )
+        return [to_response(row) for row in result]
+
     async def delete(self, _id: ID) -> bool:
         """Delete user by ID."""
-        db_user = await self.session.get(DBUser, _id.value)
-        if not db_user:
-            return False
-        await self.session.delete(db_user)
-        return True
+        return await self.delete_returning(_id) is not None
+
+    async def delete_returning(self, _id: ID) -> Optional[UserResponse]:
+        """Delete user by ID in a single statement, returning its public fields."""
+        result = await self.session.execute(
+            delete(DBUser).where(col(DBUser.id) == _id.value).returning(*RESPONSE_COLUMNS)
+        )
+        row = result.first()
+        return to_response(row) if row else None
 
     async def update(self, user: User) -> Optional[User]:
         """Update existing user."""
-        to_update = await self.session.get(DBUser, user.id.value)
-        if not to_update:
-            return None
+        result = await self.session.execute(
+            update(DBUser)
+            .where(col(DBUser.id) == user.id.value)
+            .values(name=user.name, email=user.email.value)
+            .returning(col(DBUser.id))
+        )
+        return user if result.first() else None
 
-        to_update.name = user.name
-        to_update.email = user.email.value
-        self.session.add(to_update)
-        return user
+    async def update_profile(
+        self, _id: ID, name: Optional[str] = None, email: Optional[Email] = None
+    ) -> Optional[UserResponse]:
+        """Update the given fields of a user in a single statement."""
+        values = {}
+        if name is not None:
+            values["name"] = name
+        if email is not None:
+            values["email"] = email.value
+        if not values:
+            return await self.get_response_by_id(_id)
+
+        result = await self.session.execute(
+            update(DBUser)
+            .where(col(DBUser.id) == _id.value)
+            .values(**values)
+            .returning(*RESPONSE_COLUMNS)
+        )
+        row = result.first()
+        return to_response(row) if row else None
+
+    async def update_password(self, _id: ID, password: Password) -> bool:
+        """Replace user password hash."""
+        result = await self.session.execute(
+            update(DBUser)
+            .where(col(DBUser.id) == _id.value)
+            .values(password_hash=password.value)
+            .returning(col(DBUser.id))
+        )
+        return result.first() is not None
@@ -0,0 +1,219 @@
+import hashlib
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Self, Sequence
+from uuid import UUID
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlmodel import col, select
+
+from app.config import Settings
+from app.core.exceptions import UserAlreadyExistsError
+from app.infra.db import DBSession, create_engine, dialect_insert
+from app.infra.db.models.user import User as DBUser
+from app.infra.db.models.user_shard import UserShard
+from app.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def shard_for(_id: UUID, count: int) -> int:
+    """Shard index of a user ID, by jump consistent hashing.
+
+    Growing from n to n + 1 shards only moves about 1 / (n + 1) of the users,
+    all of them onto the new shard.
+    """
+    key = int.from_bytes(hashlib.blake2b(_id.bytes, digest_size=8).digest(), "little")
+    bucket, jump = -1, 0
+    while jump < count:
+        bucket = jump
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        jump = int((bucket + 1) * (1 << 31) / ((key >> 33) + 1))
+    return bucket
+
+
+class CrossShardWriteError(Exception):
+    pass
+
+
+class ShardSet:
+    """Engines of the user shards, plus the database holding the email directory."""
+
+    def __init__(
+        self, directory: async_sessionmaker[DBSession], engines: Sequence[AsyncEngine]
+    ) -> None:
+        self.directory = directory
+        self.engines = list(engines)
+        self._sessions = [
+            async_sessionmaker(engine, class_=DBSession, expire_on_commit=False)
+            for engine in self.engines
+        ]
+
+    @classmethod
+    def from_settings(
+        cls, settings: Settings, directory: async_sessionmaker[DBSession]
+    ) -> Self:
+        """One engine per DB_SHARD_URLS entry, pooled like the primary."""
+        engines = [
+            create_engine(settings.model_copy(update={"DB_URL": url}))
+            for url in settings.DB_SHARD_URLS
+        ]
+        return cls(directory, engines)
+
+    def __len__(self) -> int:
+        return len(self.engines)
+
+    def shard_for(self, _id: UUID) -> int:
+        return shard_for(_id, len(self))
+
+    def session(self, index: int) -> DBSession:
+        return self._sessions[index]()
+
+    async def dispose(self) -> None:
+        for engine in self.engines:
+            await engine.dispose()
+
+
+class ShardSessions:
+    """Sessions of one unit of work: the directory, and shards opened on first use.
+
+    Writes may only touch a single shard, which the unit of work is then bound
+    to. Directory entries claimed or released along the way are remembered, so
+    they can be undone if the shard fails to commit after the directory did.
+    """
+
+    def __init__(self, shards: ShardSet) -> None:
+        self.shards = shards
+        self.directory = shards.directory()
+        self.shard: Optional[int] = None
+        self.claimed: List[str] = []
+        self.released: Dict[str, int] = {}
+        self._opened: Dict[int, DBSession] = {}
+
+    def get(self, index: int) -> DBSession:
+        if index not in self._opened:
+            self._opened[index] = self.shards.session(index)
+        return self._opened[index]
+
+    def bind(self, index: int) -> DBSession:
+        """The session of the shard to write to; only one shard per unit of work."""
+        if self.shard is not None and self.shard != index:
+            raise CrossShardWriteError(f"Already writing to shard {self.shard}, not {index}")
+        self.shard = index
+        return self.get(index)
+
+    async def locate(self, email: str) -> Optional[int]:
+        entry = await self.directory.get(UserShard, email)
+        return entry.shard if entry else None
+
+    async def claim(self, email: str, index: int) -> None:
+        """Record the email in the directory, which keeps emails unique across shards.
+
+        Raises:
+            UserAlreadyExistsError: If the email is taken.
+        """
+        result = await self.directory.execute(
+            dialect_insert(self.directory, UserShard)
+            .values(email=email, shard=index)
+            .on_conflict_do_nothing(index_elements=[col(UserShard.email)])
+            .returning(col(UserShard.email))
+        )
+        if result.first() is None:
+            raise UserAlreadyExistsError(f"User with email {email} already exists")
+        self.claimed.append(email)
+
+    async def release(self, email: str) -> None:
+        entry = await self.directory.get(UserShard, email)
+        if entry:
+            await self.directory.delete(entry)
+            self.released[email] = entry.shard
+
+    async def undo_directory(self) -> None:
+        """Revert committed directory changes whose shard write did not commit."""
+        async with self.shards.directory() as session:
+            if self.claimed:
+                await session.execute(
+                    delete(UserShard).where(col(UserShard.email).in_(self.claimed))
+                )
+            for email, index in self.released.items():
+                await session.merge(UserShard(email=email, shard=index))
+            await session.commit()
+        logger.warning(f"Reverted directory entries {self.claimed + list(self.released)}")
+
+    async def close(self) -> None:
+        for session in self._opened.values():
+            await session.close()
+        await self.directory.close()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
+
+
+@dataclass(frozen=True)
+class ReshardReport:
+    scanned: int
+    moved: int
+
+
+async def reshard(
+    sources: Sequence[AsyncEngine], target: ShardSet, batch_size: int = 1000
+) -> ReshardReport:
+    """Move users from the source databases onto the shards they hash to in `target`.
+
+    Each batch is copied to its target shard and recorded in the directory
+    before being deleted from its source, so an interrupted run can simply be
+    started again. Also backfills the directory for users already in place,
+    e.g. when sharding a single database for the first time. Writes to users
+    should be paused while it runs.
+    """
+    targets = {
+        engine.url.render_as_string(hide_password=False): index
+        for index, engine in enumerate(target.engines)
+    }
+    scanned = moved = 0
+
+    for source in sources:
+        here = targets.get(source.url.render_as_string(hide_password=False))
+        after: Optional[UUID] = None
+        while True:
+            async with DBSession(source, expire_on_commit=False) as session:
+                query = select(DBUser).order_by(col(DBUser.id)).limit(batch_size)
+                if after is not None:
+                    query = query.where(col(DBUser.id) > after)
+                users = list((await session.exec(query)).all())
+            if not users:
+                break
+            after = users[-1].id
+            scanned += len(users)
+
+            by_shard: Dict[int, List[DBUser]] = {}
+            for user in users:
+                by_shard.setdefault(target.shard_for(user.id), []).append(user)
+
+            leaving: List[UUID] = []
+            for index, group in by_shard.items():
+                if index == here:
+                    continue
+                async with target.session(index) as session:
+                    for user in group:
+                        await session.merge(DBUser(**user.model_dump()))
+                    await session.commit()
+                leaving.extend(user.id for user in group)
+
+            async with target.directory() as session:
+                for index, group in by_shard.items():
+                    for user in group:
+                        await session.merge(UserShard(email=user.email, shard=index))
+                await session.commit()
+
+            if leaving:
+                async with DBSession(source) as session:
+                    await session.execute(delete(DBUser).where(col(DBUser.id).in_(leaving)))
+                    await session.commit()
+                moved += len(leaving)
+            logger.info(f"Resharded {scanned} users, moved {moved}")
+
+    return ReshardReport(scanned=scanned, moved=moved)
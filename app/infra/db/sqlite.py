@@ -0,0 +1,46 @@
+from typing import Any, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import Settings
+
+
+def is_sqlite_file(url: URL) -> bool:
+    """Whether the URL is a SQLite database on disk, which other connections can share."""
+    database = url.database or ""
+    return (
+        url.get_backend_name() == "sqlite"
+        and database not in ("", ":memory:")
+        and url.query.get("mode") != "memory"
+    )
+
+
+def pragmas(settings: Settings, read_only: bool = False) -> List[str]:
+    statements = [
+        # Readers no longer block the writer, nor it them
+        "PRAGMA journal_mode=WAL",
+        # Durable across application crashes; only a power loss may drop the last commits
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA foreign_keys=ON",
+        f"PRAGMA busy_timeout={settings.DB_SQLITE_BUSY_TIMEOUT_MS}",
+        f"PRAGMA mmap_size={settings.DB_SQLITE_MMAP_SIZE}",
+        # Negative sizes are in KiB rather than pages
+        f"PRAGMA cache_size=-{settings.DB_SQLITE_CACHE_SIZE_KB}",
+    ]
+    if read_only:
+        statements.append("PRAGMA query_only=ON")
+    return statements
+
+
+def apply_pragmas(engine: AsyncEngine, settings: Settings, read_only: bool = False) -> None:
+    """Run the connection pragmas on every connection the engine opens."""
+    statements = pragmas(settings, read_only)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        for statement in statements:
+            cursor.execute(statement)
+        cursor.close()
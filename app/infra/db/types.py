@@ -0,0 +1,32 @@
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import LargeBinary, Uuid
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator, TypeEngine
+
+
+class UUIDType(TypeDecorator[UUID]):
+    """UUID column, native where supported and 16 raw bytes on SQLite.
+
+    SQLAlchemy's own fallback stores 32 hex characters, twice the size of the
+    value and of every index on it.
+    """
+
+    impl = Uuid
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if dialect.name == "sqlite":
+            return dialect.type_descriptor(LargeBinary(16))
+        return dialect.type_descriptor(Uuid())
+
+    def process_bind_param(self, value: Optional[Any], dialect: Dialect) -> Any:
+        if value is None or dialect.name != "sqlite":
+            return value
+        return (value if isinstance(value, UUID) else UUID(str(value))).bytes
+
+    def process_result_value(self, value: Optional[Any], dialect: Dialect) -> Optional[UUID]:
+        if value is None or dialect.name != "sqlite":
+            return value
+        return UUID(bytes=value)
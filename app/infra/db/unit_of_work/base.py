@@ -1,17 +1,43 @@
+from contextlib import suppress
+from typing import Optional
+
+from sqlalchemy.exc import DBAPIError
+
 from app.core.ports.unit_of_work import UnitOfWork
 from app.infra.db import DBSession
+from app.infra.db.pipeline import SessionPipeline
 
 
 class BaseUnitOfWork(UnitOfWork):
     def __init__(self, session: DBSession) -> None:
         self.session = session
+        self._pipeline: Optional[SessionPipeline] = None
+
+    @property
+    def shard(self) -> Optional[int]:
+        """Index of the user shard written to, or None when storage is not sharded."""
+        return None
+
+    async def __aenter__(self):
+        self._pipeline = await SessionPipeline.start(self.session)
+        return self
 
     async def __aexit__(self, *args):
-        await super().__aexit__(*args)
-        await self.session.close()
+        try:
+            await super().__aexit__(*args)
+        finally:
+            await self.session.close()
 
     async def commit(self):
+        if self._pipeline:
+            pipeline, self._pipeline = self._pipeline, None
+            await pipeline.commit()
         await self.session.commit()
 
     async def rollback(self):
+        if self._pipeline:
+            pipeline, self._pipeline = self._pipeline, None
+            # Whatever was deferred in the pipeline is being discarded anyway
+            with suppress(DBAPIError):
+                await pipeline.close()
         await self.session.rollback()
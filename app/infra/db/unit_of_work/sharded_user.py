@@ -0,0 +1,44 @@
+from typing import Optional
+
+from app.infra.db.repositories.sharded_user import ShardedUserRepo
+from app.infra.db.sharding import ShardSessions, ShardSet
+from app.infra.db.unit_of_work.base import BaseUnitOfWork
+
+
+class ShardedUserUnitOfWork(BaseUnitOfWork):
+    """Unit of work on the email directory and the one user shard it writes to."""
+
+    def __init__(self, sessions: ShardSessions) -> None:
+        super().__init__(sessions.directory)
+        self.sessions = sessions
+        self.user_repo = ShardedUserRepo(sessions)
+
+    @property
+    def shard(self) -> Optional[int]:
+        return self.sessions.shard
+
+    async def __aexit__(self, *args):
+        try:
+            await super().__aexit__(*args)
+        finally:
+            await self.sessions.close()
+
+    async def commit(self):
+        # The directory arbitrates email uniqueness across shards, so it goes first
+        await super().commit()
+        if self.shard is None:
+            return
+        try:
+            await self.sessions.get(self.shard).commit()
+        except Exception:
+            await self.sessions.undo_directory()
+            raise
+
+    async def rollback(self):
+        await super().rollback()
+        if self.shard is not None:
+            await self.sessions.get(self.shard).rollback()
+
+
+def sharded_user_uow_factory(shards: ShardSet) -> ShardedUserUnitOfWork:
+    return ShardedUserUnitOfWork(ShardSessions(shards))
@@ -0,0 +1,102 @@
+import csv
+import json
+from typing import AsyncIterable, AsyncIterator, Dict, List, Literal, Optional, Tuple
+
+from app.core.dtos.user import ImportRowError, ImportUserRow
+from app.core.usecases.user.import_users import ImportRow
+
+RowFormat = Literal["ndjson", "csv"]
+
+CONTENT_TYPES: Dict[str, RowFormat] = {
+    "application/x-ndjson": "ndjson",
+    "text/csv": "csv",
+}
+
+FIELDS = ("name", "email", "password")
+
+# Longer lines are rejected without being buffered whole
+MAX_LINE_BYTES = 64 * 1024
+
+
+async def _lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[Tuple[int, Optional[str]]]:
+    """Numbered lines of a byte stream, None for lines over MAX_LINE_BYTES."""
+    buffer, number, oversized = b"", 0, False
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            number += 1
+            yield number, None if oversized else line.decode(errors="replace").rstrip("\r")
+            oversized = False
+        if len(buffer) > MAX_LINE_BYTES:
+            buffer, oversized = b"", True
+    if buffer or oversized:
+        yield number + 1, None if oversized else buffer.decode(errors="replace").rstrip("\r")
+
+
+def _row(line: int, values: Dict[str, object]) -> ImportRow:
+    fields = {field: values.get(field) for field in FIELDS}
+    invalid = [field for field, value in fields.items() if not isinstance(value, str)]
+    if invalid:
+        return ImportRowError(
+            line=line, error=f"Missing or invalid fields: {', '.join(invalid)}"
+        )
+    return ImportUserRow(line=line, **fields)  # type: ignore[arg-type]
+
+
+async def read_user_rows(
+    chunks: AsyncIterable[bytes], row_format: RowFormat
+) -> AsyncIterator[ImportRow]:
+    """Parse users to import from a stream of NDJSON or CSV, one line at a time.
+
+    CSV needs a header naming at least the name, email and password columns,
+    and quoted fields may span lines. Blank lines are skipped. Rows that
+    cannot be read become ImportRowErrors, numbered by their first line.
+    """
+    header: Optional[List[str]] = None
+    pending: List[str] = []
+    start = 0
+    async for number, line in _lines(chunks):
+        if line is None:
+            pending = []
+            yield ImportRowError(line=number, error=f"Line longer than {MAX_LINE_BYTES} bytes")
+            continue
+        if not pending and not line.strip():
+            continue
+
+        if row_format == "ndjson":
+            try:
+                values = json.loads(line)
+            except ValueError:
+                yield ImportRowError(line=number, error="Invalid JSON")
+                continue
+            if not isinstance(values, dict):
+                yield ImportRowError(line=number, error="Expected a JSON object")
+                continue
+            yield _row(number, values)
+            continue
+
+        if not pending:
+            start = number
+        pending.append(line)
+        # An odd number of quotes means a quoted field goes on to the next line
+        if sum(part.count('"') for part in pending) % 2:
+            continue
+        record = next(csv.reader(["\n".join(pending)]), [])
+        pending = []
+        if header is None:
+            header = [column.strip().lower() for column in record]
+            missing = [field for field in FIELDS if field not in header]
+            if missing:
+                yield ImportRowError(
+                    line=start, error=f"Missing columns: {', '.join(missing)}"
+                )
+                return
+            continue
+        if len(record) != len(header):
+            yield ImportRowError(line=start, error=f"Expected {len(header)} columns")
+            continue
+        yield _row(start, dict(zip(header, record)))
+
+    if pending:
+        yield ImportRowError(line=start, error="Unterminated quoted field")
@@ -0,0 +1,197 @@
+from dataclasses import replace
+from typing import Dict, List, Optional, Sequence, Set
+from uuid import UUID, uuid4
+
+from app.core.dtos.user import UserResponse
+from app.core.entities.user import User
+from app.core.exceptions import UserAlreadyExistsError, UserNotFoundError
+from app.core.ports.unit_of_work import UnitOfWork
+from app.core.value_objects.email import Email
+from app.core.value_objects.id import ID
+from app.core.value_objects.password import Password
+
+
+def to_response(user: User) -> UserResponse:
+    return UserResponse(id=str(user.id), name=user.name, email=user.email.value)
+
+
+class InMemoryUserStore:
+    """Committed users of this process, indexed by ID and by email.
+
+    Nothing is shared between worker processes nor kept across restarts.
+    """
+
+    def __init__(self) -> None:
+        self.by_id: Dict[UUID, User] = {}
+        self.by_email: Dict[str, UUID] = {}
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def apply(self, changes: Dict[UUID, Optional[User]], created: Set[UUID]) -> None:
+        """Apply a transaction's changes all at once, or none of them.
+
+        `changes` maps IDs to their new user, or None once deleted. Runs without
+        awaiting, so no other transaction can interleave on the event loop.
+
+        Raises:
+            UserAlreadyExistsError: If an email would belong to two users.
+            UserNotFoundError: If a user changed here was deleted meanwhile.
+        """
+        claimed: Dict[str, UUID] = {}
+        for _id, user in changes.items():
+            if _id not in created and _id not in self.by_id:
+                raise UserNotFoundError(f"User with ID {_id} not found")
+            if user is None:
+                continue
+            email = user.email.value
+            owner = self.by_email.get(email)
+            if claimed.setdefault(email, _id) != _id or (
+                owner is not None and owner != _id and owner not in changes
+            ):
+                raise UserAlreadyExistsError(f"User with email {email} already exists")
+
+        # Unindex before reindexing, so users may swap emails
+        for _id in changes:
+            previous = self.by_id.pop(_id, None)
+            if previous and self.by_email.get(previous.email.value) == _id:
+                del self.by_email[previous.email.value]
+        for _id, user in changes.items():
+            if user is not None:
+                self.by_id[_id] = user
+                self.by_email[user.email.value] = _id
+
+
+class InMemoryUserRepo:
+    """UserRepo over an InMemoryUserStore, staging writes until they are applied.
+
+    Reads see the staged writes first, then whatever is committed at the time,
+    like a read committed transaction.
+    """
+
+    def __init__(self, store: InMemoryUserStore) -> None:
+        self.store = store
+        self.changes: Dict[UUID, Optional[User]] = {}
+        self.created: Set[UUID] = set()
+
+    def _get(self, _id: UUID) -> Optional[User]:
+        if _id in self.changes:
+            return self.changes[_id]
+        return self.store.by_id.get(_id)
+
+    def apply_changes(self) -> None:
+        try:
+            self.store.apply(self.changes, self.created)
+        finally:
+            self.discard_changes()
+
+    def discard_changes(self) -> None:
+        self.changes = {}
+        self.created = set()
+
+    def new_id(self) -> str:
+        """Generate a new UUID string for user ID."""
+        return str(uuid4())
+
+    async def create(self, user: User) -> UserResponse:
+        """Create a new user and return the response.
+
+        Raises:
+            UserAlreadyExistsError: If the email is taken; a concurrent
+                transaction may still take it first, which commit then rejects.
+        """
+        if await self.get_by_email(user.email):
+            raise UserAlreadyExistsError(f"User with email {user.email.value} already exists")
+        await self.save(user)
+        return to_response(user)
+
+    async def create_many(self, users: Sequence[User]) -> List[Email]:
+        """Create users in bulk, returning the emails skipped because they are taken."""
+        skipped: List[Email] = []
+        for user in users:
+            try:
+                await self.create(user)
+            except UserAlreadyExistsError:
+                skipped.append(user.email)
+        return skipped
+
+    async def save(self, user: User) -> None:
+        """Save user (for backward compatibility)."""
+        self.changes[user.id.value] = user
+        self.created.add(user.id.value)
+
+    async def get_by_email(self, email: Email) -> Optional[User]:
+        """Get user by email address."""
+        for user in self.changes.values():
+            if user is not None and user.email == email:
+                return user
+        _id = self.store.by_email.get(email.value)
+        if _id is None or _id in self.changes:
+            return None
+        return self.store.by_id.get(_id)
+
+    async def get_by_id(self, _id: ID) -> Optional[User]:
+        """Get user by ID."""
+        return self._get(_id.value)
+
+    async def get_many_by_ids(self, ids: Sequence[ID]) -> List[User]:
+        """Get users by IDs."""
+        found = (self._get(_id) for _id in dict.fromkeys(_id.value for _id in ids))
+        return [user for user in found if user is not None]
+
+    async def get_response_by_id(self, _id: ID) -> Optional[UserResponse]:
+        """Get the public fields of a user by ID."""
+        user = self._get(_id.value)
+        return to_response(user) if user else None
+
+    async def get_many_responses_by_ids(self, ids: Sequence[ID]) -> List[UserResponse]:
+        """Get the public fields of users by IDs."""
+        return [to_response(user) for user in await self.get_many_by_ids(ids)]
+
+    async def delete(self, _id: ID) -> bool:
+        """Delete user by ID."""
+        if self._get(_id.value) is None:
+            return False
+        self.changes[_id.value] = None
+        return True
+
+    async def update(self, user: User) -> Optional[User]:
+        """Update existing user."""
+        if self._get(user.id.value) is None:
+            return None
+        self.changes[user.id.value] = user
+        return user
+
+    async def update_profile(
+        self, _id: ID, name: Optional[str] = None, email: Optional[Email] = None
+    ) -> Optional[UserResponse]:
+        """Update the given fields of a user."""
+        existing = self._get(_id.value)
+        if existing is None:
+            return None
+        user = replace(existing, name=name or existing.name, email=email or existing.email)
+        self.changes[_id.value] = user
+        return to_response(user)
+
+    async def update_password(self, _id: ID, password: Password) -> bool:
+        """Replace user password hash."""
+        existing = self._get(_id.value)
+        if existing is None:
+            return False
+        self.changes[_id.value] = replace(existing, password=password)
+        return True
+
+
+class InMemoryUserUnitOfWork(UnitOfWork):
+    def __init__(self, store: InMemoryUserStore) -> None:
+        self.user_repo = InMemoryUserRepo(store)
+
+    async def commit(self):
+        self.user_repo.apply_changes()
+
+    async def rollback(self):
+        self.user_repo.discard_changes()
+
+
+def memory_user_uow_factory(store: InMemoryUserStore) -> InMemoryUserUnitOfWork:
+    return InMemoryUserUnitOfWork(store)
@@ -0,0 +1,51 @@
+import hashlib
+import hmac
+import os
+from typing import Dict, Optional, Set
+
+from app.core.dtos.user import UserResponse
+from app.infra.cache import CacheStats, TTLCache
+
+
+class HMACCredentialCache:
+    """Caches verified credentials under a keyed HMAC, never the plain text.
+
+    The HMAC key is random per process, so cache keys are useless outside it.
+    Each worker process keeps its own cache, which means invalidation is local
+    and the TTL bounds how long another worker may serve stale credentials.
+    """
+
+    def __init__(
+        self, ttl_seconds: float, max_size: int, secret: Optional[bytes] = None
+    ) -> None:
+        self._secret = secret or os.urandom(32)
+        self._cache: TTLCache[bytes, UserResponse] = TTLCache(
+            max_size, ttl_seconds, on_evict=self._forget
+        )
+        self._keys_by_user: Dict[str, Set[bytes]] = {}
+
+    def _key(self, email: str, password: str) -> bytes:
+        message = email.encode() + b"\x00" + password.encode()
+        return hmac.new(self._secret, message, hashlib.sha256).digest()
+
+    def _forget(self, key: bytes, user: UserResponse) -> None:
+        keys = self._keys_by_user.get(user.id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[user.id]
+
+    def get(self, email: str, password: str) -> Optional[UserResponse]:
+        return self._cache.get(self._key(email, password))
+
+    def put(self, email: str, password: str, user: UserResponse) -> None:
+        key = self._key(email, password)
+        self._keys_by_user.setdefault(user.id, set()).add(key)
+        self._cache.set(key, user)
+
+    def invalidate(self, user_id: str) -> None:
+        for key in self._keys_by_user.pop(user_id, set()):
+            self._cache.pop(key)
+
+    def stats(self) -> CacheStats:
+        return self._cache.stats()
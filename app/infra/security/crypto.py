@@ -1,13 +1,37 @@
-from typing import List, Optional
+import asyncio
+import math
+import os
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Literal, Optional, TypeVar
 
 from passlib.context import CryptContext
+from passlib.hash import bcrypt
+
+from app.core.exceptions import HasherOverloadedError
+
+T = TypeVar("T")
+
+ExecutorKind = Literal["auto", "process", "thread"]
 
 
 class Hasher:
-    def __init__(self, schemes: Optional[List[str]] = None) -> None:
+    def __init__(
+        self, schemes: Optional[List[str]] = None, rounds: Optional[int] = None
+    ) -> None:
         if not schemes:
             schemes = ["bcrypt"]
-        self.context = CryptContext(schemes=schemes, deprecated=["auto"])
+        options: Dict[str, Any] = {}
+        if rounds and "bcrypt" in schemes:
+            # Pinning both desired bounds makes needs_update flag hashes of any other cost
+            options = {
+                "bcrypt__default_rounds": rounds,
+                "bcrypt__min_desired_rounds": rounds,
+                "bcrypt__max_desired_rounds": rounds,
+            }
+        self.context = CryptContext(schemes=schemes, deprecated=["auto"], **options)
 
     def hash(self, value: str) -> str:
         hashed: str = self.context.hash(value)
@@ -16,3 +40,138 @@ class Hasher:
     def verify(self, value: str, hashed: str) -> bool:
         result: bool = self.context.verify(value, hashed)
         return result
+
+    def needs_update(self, hashed: str) -> bool:
+        result: bool = self.context.needs_update(hashed)
+        return result
+
+
+def calibrate_bcrypt_rounds(
+    target_ms: float, min_rounds: int = 10, max_rounds: int = 16, probe_rounds: int = 8
+) -> int:
+    """Pick the bcrypt cost whose verify time is closest to, without exceeding, target_ms.
+
+    Times a cheap probe hash and extrapolates, since each extra round doubles the cost.
+    """
+    probe = bcrypt.using(rounds=probe_rounds)
+    elapsed = []
+    for _ in range(3):
+        start = time.perf_counter()
+        probe.hash("calibration")
+        elapsed.append(time.perf_counter() - start)
+
+    probe_ms = max(min(elapsed) * 1000, 1e-3)
+    rounds = probe_rounds + math.floor(math.log2(target_ms / probe_ms))
+    return max(min_rounds, min(rounds, max_rounds))
+
+
+# Each pool worker builds its own Hasher once, so CryptContext is never pickled.
+_worker_hasher: Optional[Hasher] = None
+
+
+def _init_worker(schemes: Optional[List[str]], rounds: Optional[int]) -> None:
+    global _worker_hasher
+    _worker_hasher = Hasher(schemes, rounds)
+
+
+def _hash(value: str) -> str:
+    assert _worker_hasher is not None
+    return _worker_hasher.hash(value)
+
+
+def _verify(value: str, hashed: str) -> bool:
+    assert _worker_hasher is not None
+    return _worker_hasher.verify(value, hashed)
+
+
+def is_free_threaded() -> bool:
+    """Whether the interpreter runs without the GIL."""
+    is_gil_enabled: Callable[[], bool] = getattr(sys, "_is_gil_enabled", lambda: True)
+    return not is_gil_enabled()
+
+
+@dataclass(frozen=True)
+class HasherStats:
+    in_flight: int
+    queued: int
+    max_in_flight: int
+    max_queue: int
+
+
+class PooledHasher:
+    """Async hasher that runs hash/verify in a bounded executor.
+
+    At most `max_in_flight` operations run at once and up to `max_queue` more
+    may wait for a slot; anything beyond that fails fast with
+    HasherOverloadedError instead of piling up on the event loop.
+    """
+
+    def __init__(
+        self,
+        schemes: Optional[List[str]] = None,
+        rounds: Optional[int] = None,
+        executor: ExecutorKind = "auto",
+        workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        max_queue: int = 64,
+    ) -> None:
+        if executor == "auto":
+            executor = "thread" if is_free_threaded() else "process"
+        workers = workers or os.cpu_count() or 1
+
+        self._executor: Executor
+        if executor == "process":
+            self._executor = ProcessPoolExecutor(
+                workers, initializer=_init_worker, initargs=(schemes, rounds)
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                workers, initializer=_init_worker, initargs=(schemes, rounds)
+            )
+
+        self._hasher = Hasher(schemes, rounds)
+        self.max_in_flight = max_in_flight or workers
+        self.max_queue = max_queue
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+        self._pending = 0
+        self._in_flight = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return self._pending - self._in_flight
+
+    def stats(self) -> HasherStats:
+        return HasherStats(
+            in_flight=self._in_flight,
+            queued=self.queue_depth,
+            max_in_flight=self.max_in_flight,
+            max_queue=self.max_queue,
+        )
+
+    async def _run(self, fn: Callable[..., T], *args: str) -> T:
+        if self.queue_depth >= self.max_queue:
+            raise HasherOverloadedError(f"Hashing backlog is full ({self.queue_depth} queued)")
+
+        self._pending += 1
+        try:
+            async with self._slots:
+                self._in_flight += 1
+                try:
+                    loop = asyncio.get_running_loop()
+                    return await loop.run_in_executor(self._executor, fn, *args)
+                finally:
+                    self._in_flight -= 1
+        finally:
+            self._pending -= 1
+
+    async def hash(self, value: str) -> str:
+        return await self._run(_hash, value)
+
+    async def verify(self, value: str, hashed: str) -> bool:
+        return await self._run(_verify, value, hashed)
+
+    def needs_update(self, hashed: str) -> bool:
+        return self._hasher.needs_update(hashed)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,78 @@
+"""Compares per-request service construction with container lookups.
+
+Usage:
+    python -m scripts.benchmarks.dependencies
+"""
+
+import asyncio
+import os
+import timeit
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any, Callable
+
+os.environ.setdefault("DB_URL", "sqlite+aiosqlite://")
+
+from app.config import get_settings  # noqa: E402
+from app.infra.api.dependencies.auth import get_token_provider  # noqa: E402
+from app.infra.api.dependencies.container import get_container  # noqa: E402
+from app.infra.api.dependencies.crypto import get_hasher  # noqa: E402
+from app.infra.auth.jwt import JWTProvider  # noqa: E402
+from app.infra.container import Container  # noqa: E402
+from app.infra.security.crypto import Hasher  # noqa: E402
+
+ITERATIONS = 20_000
+
+
+def per_request() -> Any:
+    settings = get_settings()
+    token_provider = JWTProvider(
+        settings.JWT_SECRET_KEY,
+        settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES,
+        settings.JWT_ALGORITHM,
+    )
+    return Hasher(), token_provider
+
+
+def from_container(request: Any) -> Callable[[], Any]:
+    def resolve() -> Any:
+        container = get_container(request)
+        return get_hasher(container), get_token_provider(container)
+
+    return resolve
+
+
+def allocated_bytes(fn: Callable[[], Any], iterations: int) -> float:
+    """Average peak bytes allocated by a single call."""
+    tracemalloc.start()
+    total = 0
+    for _ in range(iterations):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        total += max(peak - before, 0)
+    tracemalloc.stop()
+    return total / iterations
+
+
+def report(name: str, fn: Callable[[], Any]) -> None:
+    seconds = min(timeit.repeat(fn, number=ITERATIONS, repeat=3))
+    per_call_us = seconds / ITERATIONS * 1_000_000
+    print(f"{name:<16} {per_call_us:>10.2f} us/req {allocated_bytes(fn, 1_000):>12.0f} B/req")
+
+
+def main() -> None:
+    container = Container.build(
+        get_settings().model_copy(update={"HASHER_EXECUTOR": "thread", "HASHER_WORKERS": 1})
+    )
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(container=container)))
+    try:
+        report("per-request", per_request)
+        report("container", from_container(request))
+    finally:
+        asyncio.run(container.stop())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Compares reading a user as a full entity with reading projected columns.
+
+The entity path loads the ORM object, password hash included, builds the
+domain User and then the UserResponse, as GetUserUsecase used to. The
+projection path selects id, name and email and builds the UserResponse from
+the row. Each read runs in a fresh session, as a request would. Uses a
+temporary SQLite file unless PROJECTION_DB_URL points at a scratch database;
+the users table is dropped and recreated.
+
+Usage:
+    python -m scripts.benchmarks.projection
+"""
+
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+from typing import Awaitable, Callable, List, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+
+os.environ.setdefault("DB_URL", "sqlite+aiosqlite://")
+
+from app.core.dtos.user import UserResponse  # noqa: E402
+from app.core.entities.user import User  # noqa: E402
+from app.core.value_objects.email import Email  # noqa: E402
+from app.core.value_objects.id import ID  # noqa: E402
+from app.core.value_objects.password import Password  # noqa: E402
+from app.infra.db import DBSession  # noqa: E402
+from app.infra.db.repositories.user import UserRepo  # noqa: E402
+
+ITERATIONS = 2_000
+USERS = 1_000
+
+
+async def setup(engine: AsyncEngine) -> List[ID]:
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+    ids = [ID.generate() for _ in range(USERS)]
+    async with DBSession(engine) as session:
+        repo = UserRepo(session)
+        for i, _id in enumerate(ids):
+            await repo.save(
+                User(
+                    id=_id,
+                    name=f"User {i}",
+                    email=Email(f"user{i}@bench.example.com"),
+                    password=Password("$2b$12$" + "x" * 53),
+                )
+            )
+        await session.commit()
+    return ids
+
+
+def entity(engine: AsyncEngine) -> Callable[[ID], Awaitable[UserResponse]]:
+    async def read(_id: ID) -> UserResponse:
+        async with DBSession(engine) as session:
+            user = await UserRepo(session).get_by_id(_id)
+        assert user is not None
+        return UserResponse(id=str(user.id), name=user.name, email=user.email.value)
+
+    return read
+
+
+def projection(engine: AsyncEngine) -> Callable[[ID], Awaitable[UserResponse]]:
+    async def read(_id: ID) -> UserResponse:
+        async with DBSession(engine) as session:
+            user = await UserRepo(session).get_response_by_id(_id)
+        assert user is not None
+        return user
+
+    return read
+
+
+async def measure(
+    read: Callable[[ID], Awaitable[UserResponse]], ids: List[ID]
+) -> Tuple[List[float], float]:
+    """Latencies in milliseconds, and average peak bytes allocated per read."""
+    for _id in ids[:100]:
+        await read(_id)
+
+    latencies: List[float] = []
+    for i in range(ITERATIONS):
+        start = time.perf_counter()
+        await read(ids[i % len(ids)])
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    allocated = 0
+    for i in range(ITERATIONS // 10):
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        await read(ids[i % len(ids)])
+        _, peak = tracemalloc.get_traced_memory()
+        allocated += max(peak - before, 0)
+    tracemalloc.stop()
+    return latencies, allocated / (ITERATIONS // 10)
+
+
+async def run(url: str) -> None:
+    engine = create_async_engine(url)
+    ids = await setup(engine)
+    for name, read in (("entity", entity(engine)), ("projection", projection(engine))):
+        latencies, allocated = await measure(read, ids)
+        print(
+            f"{name:<10} p50={statistics.median(latencies):.3f}ms "
+            f"p95={statistics.quantiles(latencies, n=20)[-1]:.3f}ms "
+            f"allocated={allocated / 1024:.1f}KiB/read"
+        )
+    await engine.dispose()
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        url = os.environ.get("PROJECTION_DB_URL", f"sqlite+aiosqlite:///{tmp}/bench.db")
+        asyncio.run(run(url))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Moves users onto the shards they hash to and backfills the email directory.
+
+The target layout comes from the settings: DB_URL holds the directory and
+DB_SHARD_URLS lists the shards. Users are read from every SOURCE_URL, which
+may be a target shard itself. Pause writes to users while it runs; an
+interrupted run can be started again.
+
+Usage:
+    # Shard a single database for the first time
+    DB_SHARD_URLS='["postgresql+asyncpg://.../users_0", "postgresql+asyncpg://.../users_1"]' \\
+        python -m scripts.reshard "$DB_URL"
+
+    # Grow from two shards to three
+    DB_SHARD_URLS='[".../users_0", ".../users_1", ".../users_2"]' \\
+        python -m scripts.reshard .../users_0 .../users_1
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config import get_settings
+from app.infra.db import async_session
+from app.infra.db.sharding import ShardSet, reshard
+
+
+async def main(source_urls: list[str], batch_size: int) -> None:
+    settings = get_settings()
+    if not settings.DB_SHARD_URLS:
+        raise SystemExit("DB_SHARD_URLS must list the target shards")
+
+    target = ShardSet.from_settings(settings, async_session)
+    # Reuse the target engine when a source is also a shard, so its rows are left in place
+    by_url = {
+        str(engine.url.render_as_string(hide_password=False)): engine
+        for engine in target.engines
+    }
+    sources = [
+        by_url.get(make_url(url).render_as_string(hide_password=False))
+        or create_async_engine(url)
+        for url in source_urls
+    ]
+    try:
+        report = await reshard(sources, target, batch_size=batch_size)
+    finally:
+        await target.dispose()
+        for engine in sources:
+            await engine.dispose()
+    print(f"Scanned {report.scanned} users, moved {report.moved}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source_urls", nargs="+", metavar="SOURCE_URL")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(main(args.source_urls, args.batch_size))
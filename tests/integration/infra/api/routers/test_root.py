@@ -1,5 +1,19 @@
+from app.infra.db import engine_options
+
+
 async def test_health_check(client):
     response = await client.get("/health-check")
     data, status_code = response.json(), response.status_code
     assert status_code == 200
     assert data["status"] == "I'm ok!"
+
+
+async def test_stats(client, settings):
+    await client.get("/health-check")
+    response = await client.get("/stats")
+    data, status_code = response.json(), response.status_code
+    assert status_code == 200
+    if not settings.DB_TRANSACTION_POOLER:
+        assert data["db_pool"]["size"] == engine_options(settings)["pool_size"]
+    assert data["hasher"]["in_flight"] == 0
+    assert "hits" in data["api_key_cache"]
@@ -1,5 +1,13 @@
+from dataclasses import replace
+from unittest.mock import patch
+
 import pytest
 
+from app.core.exceptions import UserNotFoundError
+from app.core.usecases.user import GetUserUsecase
+from app.infra.auth.versions import InMemoryUserVersionStore
+from app.infra.db.repositories.user import UserRepo
+
 
 @pytest.fixture
 def auth_route():
@@ -112,3 +120,215 @@ async def test_if_get_authenticated_user_with_valid_token(
     assert response.status_code == 200
     assert response.json()["name"] == create_user_payload["name"]
     assert response.json()["email"] == create_user_payload["email"]
+
+
+@pytest.fixture
+def stateless_client(client, app):
+    app.state.container = replace(
+        app.state.container, user_versions=InMemoryUserVersionStore(retention_seconds=1800)
+    )
+    return client
+
+
+async def test_if_resolves_authenticated_user_from_token_claims(
+    stateless_client, app, user_route, auth_route, create_user_payload, token_payload
+):
+    await stateless_client.post(user_route, json=create_user_payload)
+    token_response = await stateless_client.post(f"{auth_route}/token", data=token_payload)
+    token = token_response.json()["access_token"]
+
+    claims = app.state.container.token_provider.decode(token)
+    assert claims["name"] == create_user_payload["name"]
+    assert claims["email"] == create_user_payload["email"]
+
+    headers = {"Authorization": f"Bearer {token}"}
+    with patch.object(GetUserUsecase, "execute") as get_user:
+        response = await stateless_client.get(f"{auth_route}/me", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["name"] == create_user_payload["name"]
+    get_user.assert_not_called()
+
+
+async def test_if_refreshes_authenticated_user_when_token_claims_are_stale(
+    stateless_client, user_route, auth_route, create_user_payload, token_payload
+):
+    create_response = await stateless_client.post(user_route, json=create_user_payload)
+    token_response = await stateless_client.post(f"{auth_route}/token", data=token_payload)
+    headers = {"Authorization": f"Bearer {token_response.json()['access_token']}"}
+
+    _id = create_response.json()["id"]
+    await stateless_client.patch(f"{user_route}/{_id}", json={"name": "Updated"})
+    response = await stateless_client.get(f"{auth_route}/me", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["name"] == "Updated"
+
+
+async def test_if_refreshes_access_token_with_refresh_token(
+    client, user_route, auth_route, create_user_payload, token_payload
+):
+    await client.post(user_route, json=create_user_payload)
+    token_response = await client.post(f"{auth_route}/token", data=token_payload)
+    refresh_token = token_response.json()["refresh_token"]
+
+    assert refresh_token is not None
+
+    response = await client.post(
+        f"{auth_route}/refresh", data={"refresh_token": refresh_token}
+    )
+    assert response.status_code == 200
+    assert response.json()["refresh_token"] == refresh_token
+
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    response = await client.get(f"{auth_route}/me", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["email"] == create_user_payload["email"]
+
+
+async def test_if_fails_to_refresh_with_revoked_refresh_token(
+    client, user_route, auth_route, create_user_payload, token_payload
+):
+    await client.post(user_route, json=create_user_payload)
+    token_response = await client.post(f"{auth_route}/token", data=token_payload)
+    refresh_token = token_response.json()["refresh_token"]
+
+    response = await client.post(f"{auth_route}/revoke", data={"token": refresh_token})
+    assert response.status_code == 204
+
+    response = await client.post(
+        f"{auth_route}/refresh", data={"refresh_token": refresh_token}
+    )
+    assert response.status_code == 401
+
+
+async def test_if_fails_to_refresh_with_access_token(
+    client, user_route, auth_route, create_user_payload, token_payload
+):
+    await client.post(user_route, json=create_user_payload)
+    token_response = await client.post(f"{auth_route}/token", data=token_payload)
+    access_token = token_response.json()["access_token"]
+
+    response = await client.post(f"{auth_route}/refresh", data={"refresh_token": access_token})
+    assert response.status_code == 401
+
+
+async def test_if_fails_to_authenticate_with_refresh_token(
+    client, user_route, auth_route, create_user_payload, token_payload
+):
+    await client.post(user_route, json=create_user_payload)
+    token_response = await client.post(f"{auth_route}/token", data=token_payload)
+    headers = {"Authorization": f"Bearer {token_response.json()['refresh_token']}"}
+
+    response = await client.get(f"{auth_route}/me", headers=headers)
+    assert response.status_code == 401
+
+
+async def test_if_fails_to_refresh_for_deleted_user(
+    client, user_route, auth_route, create_user_payload, token_payload
+):
+    create_response = await client.post(user_route, json=create_user_payload)
+    token_response = await client.post(f"{auth_route}/token", data=token_payload)
+    refresh_token = token_response.json()["refresh_token"]
+
+    with patch.object(GetUserUsecase, "execute", side_effect=UserNotFoundError("gone")):
+        response = await client.post(
+            f"{auth_route}/refresh", data={"refresh_token": refresh_token}
+        )
+
+    assert create_response.status_code == 201
+    assert response.status_code == 401
+
+
+@pytest.fixture
+async def api_key(client, user_route, auth_route, create_user_payload, token_payload):
+    await client.post(user_route, json=create_user_payload)
+    token_response = await client.post(f"{auth_route}/token", data=token_payload)
+    headers = {"Authorization": f"Bearer {token_response.json()['access_token']}"}
+
+    response = await client.post(
+        f"{auth_route}/api-keys", json={"name": "ci"}, headers=headers
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+async def test_if_get_authenticated_user_with_api_key(
+    client, auth_route, create_user_payload, api_key
+):
+    headers = {"X-API-Key": api_key["key"]}
+    with patch.object(GetUserUsecase, "execute") as get_user:
+        response = await client.get(f"{auth_route}/me", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["email"] == create_user_payload["email"]
+    get_user.assert_not_called()
+
+
+async def test_if_fails_to_get_authenticated_user_with_unknown_api_key(client, auth_route):
+    response = await client.get(f"{auth_route}/me", headers={"X-API-Key": "pca_unknown"})
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Invalid Token"
+
+
+async def test_if_fails_to_get_authenticated_user_without_credentials(client, auth_route):
+    response = await client.get(f"{auth_route}/me")
+
+    assert response.status_code == 401
+
+
+async def test_if_deleted_api_key_is_rejected(client, auth_route, api_key):
+    headers = {"X-API-Key": api_key["key"]}
+    assert (await client.get(f"{auth_route}/me", headers=headers)).status_code == 200
+
+    response = await client.delete(f"{auth_route}/api-keys/{api_key['id']}", headers=headers)
+    assert response.status_code == 204
+
+    response = await client.get(f"{auth_route}/me", headers=headers)
+    assert response.status_code == 401
+
+    response = await client.delete(f"{auth_route}/api-keys/{api_key['id']}", headers=headers)
+    assert response.status_code == 401
+
+
+async def test_if_introspects_batch_of_tokens_with_one_user_lookup(
+    client, user_route, auth_route, create_user_payload, token_payload, api_key
+):
+    token_response = await client.post(f"{auth_route}/token", data=token_payload)
+    access_token = token_response.json()["access_token"]
+    refresh_token = token_response.json()["refresh_token"]
+
+    payload = {"tokens": [access_token, "invalid", refresh_token, access_token]}
+    headers = {"X-API-Key": api_key["key"]}
+    spy = patch.object(
+        UserRepo,
+        "get_many_responses_by_ids",
+        autospec=True,
+        side_effect=UserRepo.get_many_responses_by_ids,
+    )
+    with spy as get_many_responses_by_ids:
+        response = await client.post(f"{auth_route}/introspect", json=payload, headers=headers)
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["active"] for result in results] == [True, False, False, True]
+    assert results[0]["user"]["email"] == create_user_payload["email"]
+    assert results[0]["claims"]["sub"].startswith("user_id:")
+    get_many_responses_by_ids.assert_called_once()
+
+
+async def test_if_introspection_requires_authentication(client, auth_route):
+    response = await client.post(f"{auth_route}/introspect", json={"tokens": []})
+
+    assert response.status_code == 401
+
+
+async def test_if_rejects_too_many_tokens_to_introspect(client, app, auth_route, api_key):
+    max_tokens = app.state.container.settings.AUTH_INTROSPECT_MAX_TOKENS
+    payload = {"tokens": ["token"] * (max_tokens + 1)}
+    headers = {"X-API-Key": api_key["key"]}
+
+    response = await client.post(f"{auth_route}/introspect", json=payload, headers=headers)
+
+    assert response.status_code == 422
@@ -1,3 +1,5 @@
+import asyncio
+import json
 from uuid import uuid4
 
 import pytest
@@ -66,6 +68,16 @@ async def test_create_user_conflict(client, user_route, create_user_payload):
     assert data == {"detail": "User already exists"}
 
 
+async def test_concurrent_duplicate_signups_create_one_user(client, user_route):
+    payload = {"name": "Racer", "email": f"{uuid4().hex}@gmail.com", "password": "password"}
+
+    responses = await asyncio.gather(
+        *(client.post(user_route, json=payload) for _ in range(8))
+    )
+
+    assert sorted(response.status_code for response in responses) == [201] + [409] * 7
+
+
 async def test_delete_user_not_found(client, user_route):
     response = await client.delete(f"{user_route}/{uuid4()}")
     data, status_code = response.json(), response.status_code
@@ -80,6 +92,7 @@ async def test_delete_user_successfully(client, user_route, create_user_payload)
     delete_response = await client.delete(f"{user_route}/{_id}")
 
     assert delete_response.status_code == 204
+    assert (await client.get(f"{user_route}/{_id}")).status_code == 404
 
 
 async def test_patch_user_not_found(client, user_route, update_user_payload):
@@ -122,3 +135,88 @@ async def test_patch_partial_user_data_successfully(
     assert patch_response.status_code == 200
     assert patch_response.json()["name"] == update_user_payload["name"]
     assert patch_response.json()["email"] == create_user_payload["email"]
+
+
+@pytest.fixture
+async def auth_headers(client, user_route, create_user_payload):
+    await client.post(user_route, json=create_user_payload)
+    token_response = await client.post(
+        "/api/v1/auth/token",
+        data={
+            "username": create_user_payload["email"],
+            "password": create_user_payload["password"],
+        },
+    )
+    return {"Authorization": f"Bearer {token_response.json()['access_token']}"}
+
+
+def progress(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+async def test_import_users_requires_authentication(client, user_route):
+    response = await client.post(
+        f"{user_route}/import",
+        content=b"",
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 401
+
+
+async def test_import_users_rejects_unknown_content_type(client, user_route, auth_headers):
+    response = await client.post(
+        f"{user_route}/import",
+        content=b"{}",
+        headers={**auth_headers, "Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 415
+
+
+async def test_import_users_from_ndjson(client, user_route, auth_headers, create_user_payload):
+    lines = [
+        {"name": "One", "email": "one@test.com", "password": "password1"},
+        {"name": "Two", "email": "two@test.com", "password": "password2"},
+        {"name": "Taken", "email": create_user_payload["email"], "password": "password3"},
+        {"name": "Again", "email": "one@test.com", "password": "password4"},
+    ]
+    body = "\n".join(json.dumps(line) for line in lines) + "\nnot json\n"
+
+    response = await client.post(
+        f"{user_route}/import",
+        content=body.encode(),
+        headers={**auth_headers, "Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    [report] = progress(response)
+    assert (report["rows"], report["imported"], report["rejected"]) == (5, 2, 3)
+    assert report["errors"] == [
+        {"line": 3, "error": "User already exists"},
+        {"line": 4, "error": "Duplicate of line 1"},
+        {"line": 5, "error": "Invalid JSON"},
+    ]
+    login = await client.post(
+        "/api/v1/auth/token", data={"username": "two@test.com", "password": "password2"}
+    )
+    assert login.status_code == 200
+
+
+async def test_import_users_from_csv(client, user_route, auth_headers):
+    body = (
+        "email,name,password\r\n"
+        'one@test.com,"Multi\nLine",password1\r\n'
+        "invalid,Bad,password2\r\n"
+    )
+
+    response = await client.post(
+        f"{user_route}/import",
+        content=body.encode(),
+        headers={**auth_headers, "Content-Type": "text/csv; charset=utf-8"},
+    )
+
+    [report] = progress(response)
+    assert (report["rows"], report["imported"], report["rejected"]) == (2, 1, 1)
+    assert report["errors"][0]["line"] == 4
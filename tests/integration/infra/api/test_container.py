@@ -0,0 +1,10 @@
+from app.infra.api.dependencies.auth import get_token_provider
+from app.infra.api.dependencies.crypto import get_hasher
+
+
+async def test_if_shares_services_across_requests(client, app):
+    container = app.state.container
+
+    assert get_hasher(container) is get_hasher(container) is container.hasher
+    assert get_token_provider(container) is container.token_provider
+    assert container.token_provider.secret_key == container.settings.JWT_SECRET_KEY
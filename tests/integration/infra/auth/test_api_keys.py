@@ -0,0 +1,67 @@
+from uuid import uuid4
+
+import pytest
+from sqlmodel import SQLModel
+
+from app.infra.auth.api_keys import ApiKeyAuthenticator
+from app.infra.db import async_session, engine
+from app.infra.db.models.api_key import ApiKey
+from app.infra.db.models.user import User
+
+
+@pytest.fixture
+async def user_id():
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    _id = uuid4()
+    async with async_session() as session:
+        session.add(User(id=_id, name="Test", email="test@gmail.com", password_hash="x"))
+        await session.commit()
+
+    yield str(_id)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+    await engine.dispose()
+
+
+async def test_if_stores_only_the_key_digest(user_id):
+    api_keys = ApiKeyAuthenticator(async_session)
+    key_id, key = await api_keys.create(user_id, "ci")
+
+    async with async_session() as session:
+        stored = await session.get(ApiKey, key_id)
+
+    assert stored is not None
+    assert stored.key_digest == ApiKeyAuthenticator.digest(key)
+    assert key not in stored.key_digest
+
+
+async def test_if_caches_resolved_owner(user_id):
+    api_keys = ApiKeyAuthenticator(async_session)
+    _, key = await api_keys.create(user_id, "ci")
+
+    first = await api_keys.authenticate(key)
+    second = await api_keys.authenticate(key)
+
+    assert first is not None and first.id == user_id
+    assert second == first
+    assert api_keys.cache_stats().hits == 1
+
+
+async def test_if_rejects_keys_without_prefix(user_id):
+    api_keys = ApiKeyAuthenticator(async_session)
+
+    assert await api_keys.authenticate("not-a-key") is None
+    assert api_keys.cache_stats().misses == 0
+
+
+async def test_if_revoke_is_scoped_to_owner(user_id):
+    api_keys = ApiKeyAuthenticator(async_session)
+    key_id, key = await api_keys.create(user_id, "ci")
+    await api_keys.authenticate(key)
+
+    assert not await api_keys.revoke(str(uuid4()), key_id)
+    assert await api_keys.revoke(user_id, key_id)
+    assert await api_keys.authenticate(key) is None
@@ -0,0 +1,22 @@
+from uuid import uuid4
+
+from app.infra.auth.bloom import BloomFilter
+
+
+def test_if_contains_every_added_value():
+    bloom = BloomFilter(capacity=1_000, error_rate=0.01)
+    values = [uuid4().bytes for _ in range(1_000)]
+    for value in values:
+        bloom.add(value)
+
+    assert all(value in bloom for value in values)
+    assert bloom.count == 1_000
+
+
+def test_if_false_positive_rate_stays_near_error_rate():
+    bloom = BloomFilter(capacity=1_000, error_rate=0.01)
+    for _ in range(1_000):
+        bloom.add(uuid4().bytes)
+
+    false_positives = sum(uuid4().bytes in bloom for _ in range(10_000))
+    assert false_positives < 300
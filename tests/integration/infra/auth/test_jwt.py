@@ -0,0 +1,107 @@
+import base64
+import time
+
+import pytest
+from jose import jwt
+
+from app.infra.auth.jwt import HSTokenCodec, InvalidToken, JWTProvider
+from app.infra.cache import CacheStats
+
+
+@pytest.fixture
+def provider():
+    return JWTProvider("secret", expire_minutes=30, algorithm="HS256", cache_size=2)
+
+
+def test_if_decodes_created_token(provider):
+    token = provider.create_access_token({"sub": "user_id:123"}).access_token
+
+    assert provider.get_sub(token) == "123"
+
+
+def test_if_raises_for_invalid_token(provider):
+    with pytest.raises(InvalidToken):
+        provider.decode("invalid")
+
+    assert provider.cache_stats() == CacheStats(hits=0, misses=1, size=0, max_size=2)
+
+
+def test_if_serves_repeated_decodes_from_cache(provider):
+    token = provider.create_access_token({"sub": "user_id:123"}).access_token
+
+    first = provider.decode(token)
+    first["sub"] = "tampered"
+    second = provider.decode(token)
+
+    assert second["sub"] == "user_id:123"
+    assert provider.cache_stats() == CacheStats(hits=1, misses=1, size=1, max_size=2)
+
+
+def test_if_cached_claims_do_not_outlive_token_expiration(provider):
+    now = 1000.0
+    provider._claims_cache._clock = lambda: now
+    token = jwt.encode({"sub": "user_id:123", "exp": time.time() + 5}, "secret")
+
+    provider.decode(token)
+    now += 6
+    provider.decode(token)
+
+    assert provider.cache_stats().misses == 2
+
+
+def test_if_does_not_cache_without_cache_size():
+    provider = JWTProvider("secret", expire_minutes=30, algorithm="HS256")
+    token = provider.create_access_token({"sub": "user_id:123"}).access_token
+
+    assert provider.get_sub(token) == "123"
+    assert provider.cache_stats() is None
+
+
+@pytest.fixture
+def codec():
+    return HSTokenCodec("secret", "HS256")
+
+
+def test_if_codec_tokens_are_wire_compatible_with_jose(codec):
+    claims = {"sub": "user_id:123", "exp": int(time.time()) + 60}
+
+    assert jwt.decode(codec.encode(claims), "secret", algorithms=["HS256"]) == claims
+    assert codec.decode(jwt.encode(claims, "secret", algorithm="HS256")) == claims
+    assert codec.encode(claims) == jwt.encode(claims, "secret", algorithm="HS256")
+
+
+@pytest.mark.parametrize(
+    "claims",
+    [
+        {"sub": "user_id:123", "exp": time.time() - 1},
+        {"sub": "user_id:123"},
+        {"sub": 123, "exp": time.time() + 60},
+    ],
+)
+def test_if_codec_rejects_invalid_claims(codec, claims):
+    with pytest.raises(InvalidToken):
+        codec.decode(jwt.encode(claims, "secret", algorithm="HS256"))
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        jwt.encode({"exp": time.time() + 60}, "other", algorithm="HS256"),
+        jwt.encode({"exp": time.time() + 60}, "secret", algorithm="HS512"),
+        "invalid",
+        "a.b.c",
+        "a.b.c.d",
+    ],
+)
+def test_if_codec_rejects_tampered_or_malformed_tokens(codec, token):
+    with pytest.raises(InvalidToken):
+        codec.decode(token)
+
+
+def test_if_codec_rejects_unsigned_tokens(codec):
+    token = jwt.encode({"exp": time.time() + 60}, "secret", algorithm="HS256")
+    header = base64.urlsafe_b64encode(b'{"alg":"none","typ":"JWT"}').rstrip(b"=").decode()
+    _, payload, _ = token.split(".")
+
+    with pytest.raises(InvalidToken):
+        codec.decode(f"{header}.{payload}.")
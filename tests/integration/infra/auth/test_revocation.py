@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlmodel import SQLModel
+
+from app.infra.auth.revocation import RevocationList
+from app.infra.db import async_session, engine
+
+
+@pytest.fixture
+async def revocations():
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+    yield RevocationList(async_session, capacity=100)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+    await engine.dispose()
+
+
+def expires_at() -> datetime:
+    return datetime.now(timezone.utc) + timedelta(hours=1)
+
+
+async def test_if_revoked_token_is_reported_revoked(revocations):
+    await revocations.load()
+    jti = uuid4()
+
+    assert await revocations.revoke(jti, expires_at())
+    assert await revocations.is_revoked(jti)
+    assert not await revocations.is_revoked(uuid4())
+
+
+async def test_if_revoking_twice_reports_already_revoked(revocations):
+    jti = uuid4()
+
+    assert await revocations.revoke(jti, expires_at())
+    assert not await revocations.revoke(jti, expires_at())
+
+
+async def test_if_rebuilds_filter_from_database(revocations):
+    jti = uuid4()
+    await revocations.revoke(jti, expires_at())
+
+    restarted = RevocationList(async_session, capacity=100)
+    assert not await restarted.is_revoked(jti)
+
+    await restarted.load()
+    assert await restarted.is_revoked(jti)
+
+
+async def test_if_sync_picks_up_revocations_from_other_processes(revocations):
+    other = RevocationList(async_session, capacity=100)
+    await revocations.load()
+    jti = uuid4()
+
+    await other.revoke(jti, expires_at())
+    assert not await revocations.is_revoked(jti)
+
+    await revocations.sync()
+    assert await revocations.is_revoked(jti)
+
+
+async def test_if_load_drops_expired_revocations(revocations):
+    jti = uuid4()
+    await revocations.revoke(jti, datetime.now(timezone.utc) - timedelta(seconds=1))
+
+    await revocations.load()
+    assert not await revocations.is_revoked(jti)
@@ -0,0 +1,41 @@
+from app.infra.auth.versions import InMemoryUserVersionStore
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_if_starts_users_at_version_zero():
+    store = InMemoryUserVersionStore(retention_seconds=10)
+    assert store.current("1") == 0
+
+
+def test_if_bump_issues_a_new_version_per_user():
+    store = InMemoryUserVersionStore(retention_seconds=10)
+    store.bump("1")
+    first = store.current("1")
+    store.bump("1")
+
+    assert first != 0
+    assert store.current("1") not in (0, first)
+    assert store.current("2") == 0
+
+
+def test_if_forgets_bumps_after_retention():
+    clock = FakeClock()
+    store = InMemoryUserVersionStore(retention_seconds=10, clock=clock)
+    store.bump("1")
+    store.bump("2")
+    bumped = store.current("1")
+
+    clock.now = 10
+    store.bump("2")
+
+    assert store.current("1") == 0
+    assert store._versions.keys() == {"2"}
+    store.bump("1")
+    assert store.current("1") not in (0, bumped)
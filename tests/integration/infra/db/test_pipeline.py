@@ -0,0 +1,86 @@
+from unittest.mock import patch
+
+import pytest
+from psycopg import AsyncPipeline
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import SQLModel
+
+from app.config import get_settings
+from app.core.entities.user import User
+from app.core.value_objects.email import Email
+from app.core.value_objects.id import ID
+from app.core.value_objects.password import Password
+from app.infra.db import async_session, engine
+from app.infra.db.unit_of_work.user import user_uow_factory
+
+settings = get_settings()
+
+pytestmark = pytest.mark.skipif(
+    make_url(settings.DB_URL).get_driver_name() != "psycopg" or not settings.DB_PIPELINE,
+    reason="Needs DB_URL to use the psycopg driver",
+)
+
+
+@pytest.fixture(autouse=True)
+async def tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    yield
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.drop_all)
+    await engine.dispose()
+
+
+def new_user(email: str = "test@test.com") -> User:
+    return User(
+        id=ID.generate(), name="Test", email=Email(email), password=Password("hashed_password")
+    )
+
+
+def count_syncs():
+    return patch.object(AsyncPipeline, "sync", autospec=True, side_effect=AsyncPipeline.sync)
+
+
+async def test_if_defers_inserts_until_commit():
+    user = new_user()
+    with count_syncs() as sync:
+        async with user_uow_factory(async_session()) as uow:
+            assert await uow.user_repo.get_by_email(user.email) is None
+            await uow.user_repo.save(user)
+
+    # Only the SELECT needed its own round trip; INSERT and COMMIT went out together
+    assert sync.call_count == 1
+    async with async_session() as session:
+        saved = await user_uow_factory(session).user_repo.get_by_id(user.id)
+    assert saved is not None and saved.email == user.email
+
+
+async def test_if_deferred_statement_errors_surface_on_commit():
+    async with user_uow_factory(async_session()) as uow:
+        await uow.user_repo.save(new_user())
+
+    with pytest.raises(IntegrityError):
+        async with user_uow_factory(async_session()) as uow:
+            await uow.user_repo.save(new_user())
+
+
+async def test_if_rollback_discards_pipelined_changes():
+    user = new_user()
+    with pytest.raises(RuntimeError):
+        async with user_uow_factory(async_session()) as uow:
+            await uow.user_repo.save(user)
+            await uow.session.flush()
+            raise RuntimeError
+
+    async with async_session() as session:
+        assert await user_uow_factory(session).user_repo.get_by_id(user.id) is None
+
+
+async def test_if_returns_connections_to_pool_outside_pipeline_mode():
+    async with user_uow_factory(async_session()) as uow:
+        await uow.user_repo.save(new_user())
+
+    async with engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        assert raw.driver_connection.pgconn.pipeline_status == 0
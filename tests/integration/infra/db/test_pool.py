@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.config import Settings
+from app.infra.db import engine_options
+from app.infra.db.pool import InstrumentedAsyncPool, pool_stats
+
+
+def settings(url: str, **overrides) -> Settings:
+    return Settings(**{"DB_URL": url, "DB_TRANSACTION_POOLER": False, **overrides})
+
+
+def test_if_sizes_queue_pool_from_settings():
+    options = engine_options(
+        settings(
+            "postgresql+asyncpg://u:p@localhost/db", DB_POOL_SIZE=20, DB_POOL_PRE_PING=True
+        )
+    )
+
+    assert options["poolclass"] is InstrumentedAsyncPool
+    assert options["pool_size"] == 20
+    assert options["pool_pre_ping"] is True
+
+
+def test_if_passes_asyncpg_connect_args():
+    options = engine_options(
+        settings(
+            "postgresql+asyncpg://u:p@localhost/db",
+            DB_STATEMENT_CACHE_SIZE=0,
+            DB_SERVER_SETTINGS={"application_name": "app"},
+        )
+    )
+
+    assert options["connect_args"] == {
+        "statement_cache_size": 0,
+        "server_settings": {"application_name": "app"},
+    }
+
+
+def test_if_leaves_in_memory_sqlite_pool_alone():
+    options = engine_options(settings("sqlite+aiosqlite://"))
+
+    assert "poolclass" not in options
+    assert "connect_args" not in options
+
+
+@pytest.fixture
+async def tiny_engine(tmp_path):
+    options = engine_options(
+        settings(
+            f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+            DB_POOL_SIZE=1,
+            DB_MAX_OVERFLOW=0,
+            DB_POOL_TIMEOUT=0.2,
+        )
+    )
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", **options)
+    yield engine
+    await engine.dispose()
+
+
+async def test_if_records_checkout_waits(tiny_engine):
+    async def hold(seconds: float) -> None:
+        async with tiny_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            await asyncio.sleep(seconds)
+
+    await asyncio.gather(hold(0.05), hold(0))
+
+    stats = pool_stats(tiny_engine)
+    assert stats is not None
+    assert stats.acquired == 2
+    assert stats.checked_out == 0
+    assert stats.wait_max_ms >= 30
+
+
+async def test_if_counts_checkout_timeouts(tiny_engine):
+    async with tiny_engine.connect():
+        with pytest.raises(exc.TimeoutError):
+            async with tiny_engine.connect():
+                pass
+
+    stats = pool_stats(tiny_engine)
+    assert stats is not None
+    assert stats.timeouts == 1
+
+
+def test_if_configures_asyncpg_for_transaction_poolers():
+    options = engine_options(
+        settings("postgresql+asyncpg://u:p@pgbouncer/db", DB_TRANSACTION_POOLER=True)
+    )
+    connect_args = options["connect_args"]
+    name = connect_args["prepared_statement_name_func"]
+
+    assert options["poolclass"] is NullPool
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    assert name() != name()
+
+
+def test_if_rejects_session_state_with_transaction_poolers():
+    with pytest.raises(ValidationError):
+        settings(
+            "postgresql+asyncpg://u:p@pgbouncer/db",
+            DB_TRANSACTION_POOLER=True,
+            DB_SERVER_SETTINGS={"search_path": "app"},
+        )
+
+    allowed = {"application_name": "app"}
+    assert settings(
+        "sqlite+aiosqlite://", DB_TRANSACTION_POOLER=True, DB_SERVER_SETTINGS=allowed
+    )
@@ -0,0 +1,81 @@
+from types import SimpleNamespace
+
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config import get_settings
+from app.infra.api.dependencies.user import get_read_user_repo
+from app.infra.db import async_session, engine
+from app.infra.db.replicas import ReplicaRouter
+
+
+def router(count: int = 2, **kwargs) -> ReplicaRouter:
+    engines = [create_async_engine(get_settings().DB_URL) for _ in range(count)]
+    return ReplicaRouter(async_session, engines, **kwargs)
+
+
+async def test_if_round_robins_across_replicas():
+    replicas = router(3)
+    await replicas.check()
+
+    picked = [replicas.pick() for _ in range(6)]
+
+    assert picked == replicas.replicas * 2
+    await replicas.stop()
+
+
+async def test_if_picks_replica_with_fewest_sessions_in_use():
+    replicas = router(2, strategy="least_connections")
+    await replicas.check()
+    first, second = replicas.replicas
+
+    async with replicas.session() as session:
+        assert session.bind is first.engine
+        assert first.in_use == 1
+        async with replicas.session() as other:
+            assert other.bind is second.engine
+
+    assert first.in_use == second.in_use == 0
+    await replicas.stop()
+
+
+async def test_if_skips_replicas_lagging_beyond_budget():
+    replicas = router(2, max_lag_seconds=1.0)
+    await replicas.check()
+    lagging, fresh = replicas.replicas
+    lagging.lag_seconds = 30.0
+
+    assert replicas.available() == [fresh]
+    await replicas.stop()
+
+
+async def test_if_skips_replicas_until_lag_is_measured():
+    replicas = router(1, max_lag_seconds=1.0)
+
+    assert replicas.pick() is None
+    await replicas.stop()
+
+
+async def test_if_falls_back_to_primary_when_no_replica_is_available():
+    replicas = ReplicaRouter(
+        async_session,
+        [create_async_engine("sqlite+aiosqlite:////nonexistent/dir/replica.db")],
+    )
+    await replicas.check()
+
+    assert replicas.stats()[0].healthy is False
+    async with replicas.session() as session:
+        assert session.bind is engine
+    await replicas.stop()
+
+
+async def test_if_read_repo_uses_replica_session():
+    replicas = router(1)
+    await replicas.check()
+    container = SimpleNamespace(replicas=replicas, shards=None, users=None)
+
+    repos = get_read_user_repo(container)  # type: ignore[arg-type]
+    repo = await anext(repos)
+
+    assert repo.session.bind is replicas.replicas[0].engine
+    await repos.aclose()
+    await replicas.stop()
@@ -0,0 +1,217 @@
+from collections import Counter
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+
+from app.core.entities.user import User
+from app.core.exceptions import UserAlreadyExistsError
+from app.core.value_objects.email import Email
+from app.core.value_objects.id import ID
+from app.core.value_objects.password import Password
+from app.infra.db import DBSession
+from app.infra.db.models.user import User as DBUser
+from app.infra.db.models.user_shard import UserShard
+from app.infra.db.repositories.sharded_user import ShardedUserRepo
+from app.infra.db.repositories.user import UserRepo
+from app.infra.db.sharding import (
+    CrossShardWriteError,
+    ShardSessions,
+    ShardSet,
+    reshard,
+    shard_for,
+)
+from app.infra.db.unit_of_work.sharded_user import sharded_user_uow_factory
+
+
+async def create_engines(tmp_path, count: int, prefix: str = "shard"):
+    engines = [
+        create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/{prefix}{i}.db")
+        for i in range(count)
+    ]
+    for engine in engines:
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+    return engines
+
+
+@pytest.fixture
+async def directory(tmp_path):
+    (engine,) = await create_engines(tmp_path, 1, prefix="directory")
+    yield async_sessionmaker(engine, class_=DBSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+async def shards(tmp_path, directory):
+    shards = ShardSet(directory, await create_engines(tmp_path, 3))
+    yield shards
+    await shards.dispose()
+
+
+def new_user(email: str = "test@test.com") -> User:
+    return User(
+        id=ID.generate(), name="Test", email=Email(email), password=Password("hashed_password")
+    )
+
+
+async def create(shards: ShardSet, user: User) -> None:
+    async with sharded_user_uow_factory(shards) as uow:
+        await uow.user_repo.create(user)
+
+
+def test_if_spreads_ids_evenly_and_stably():
+    ids = [uuid4() for _ in range(3000)]
+
+    counts = Counter(shard_for(_id, 3) for _id in ids)
+
+    assert set(counts) == {0, 1, 2}
+    assert min(counts.values()) > 800
+    assert [shard_for(_id, 3) for _id in ids] == [shard_for(_id, 3) for _id in ids]
+
+
+def test_if_growing_only_moves_users_onto_the_new_shard():
+    ids = [uuid4() for _ in range(3000)]
+
+    moved = [_id for _id in ids if shard_for(_id, 3) != shard_for(_id, 4)]
+
+    assert all(shard_for(_id, 4) == 3 for _id in moved)
+    assert len(moved) < 1000
+
+
+async def test_if_stores_user_on_its_shard_and_email_in_directory(shards, directory):
+    user = new_user()
+
+    await create(shards, user)
+
+    index = shards.shard_for(user.id.value)
+    async with shards.session(index) as session:
+        assert await UserRepo(session).get_by_id(user.id) == user
+    async with directory() as session:
+        assert (await session.get(UserShard, user.email.value)).shard == index
+
+
+async def test_if_finds_users_by_id_and_email(shards):
+    users = [new_user(f"user{i}@test.com") for i in range(6)]
+    for user in users:
+        await create(shards, user)
+
+    async with ShardSessions(shards) as sessions:
+        repo = ShardedUserRepo(sessions)
+        assert await repo.get_by_id(users[0].id) == users[0]
+        assert await repo.get_by_email(users[1].email) == users[1]
+        assert await repo.get_by_email(Email("missing@test.com")) is None
+        found = await repo.get_many_by_ids([user.id for user in users])
+        responses = await repo.get_many_responses_by_ids([user.id for user in users])
+        assert (await repo.get_response_by_id(users[2].id)).email == users[2].email.value
+
+    assert sorted(found, key=str) == sorted(users, key=str)
+    assert sorted(user.id for user in responses) == sorted(str(user.id) for user in users)
+
+
+async def test_if_rejects_email_taken_on_another_shard(shards):
+    first = new_user()
+    await create(shards, first)
+    second = new_user()
+    while shards.shard_for(second.id.value) == shards.shard_for(first.id.value):
+        second = new_user()
+
+    with pytest.raises(UserAlreadyExistsError):
+        await create(shards, second)
+
+    async with shards.session(shards.shard_for(second.id.value)) as session:
+        assert await session.get(DBUser, second.id.value) is None
+
+
+async def test_if_moves_directory_entry_on_email_change(shards, directory):
+    user = new_user()
+    await create(shards, user)
+    renamed = User(
+        id=user.id, name=user.name, email=Email("new@test.com"), password=user.password
+    )
+
+    async with sharded_user_uow_factory(shards) as uow:
+        await uow.user_repo.update(renamed)
+        assert uow.shard == shards.shard_for(user.id.value)
+
+    async with directory() as session:
+        assert await session.get(UserShard, "test@test.com") is None
+        assert await session.get(UserShard, "new@test.com") is not None
+
+
+async def test_if_profile_update_moves_directory_entry(shards, directory):
+    user = new_user()
+    await create(shards, user)
+
+    async with sharded_user_uow_factory(shards) as uow:
+        updated = await uow.user_repo.update_profile(user.id, email=Email("new@test.com"))
+
+    assert updated is not None and updated.name == user.name
+    async with directory() as session:
+        assert await session.get(UserShard, "test@test.com") is None
+        assert (await session.get(UserShard, "new@test.com")).shard == shards.shard_for(
+            user.id.value
+        )
+
+
+async def test_if_delete_releases_email(shards, directory):
+    user = new_user()
+    await create(shards, user)
+
+    async with sharded_user_uow_factory(shards) as uow:
+        assert await uow.user_repo.delete(user.id) is True
+
+    async with ShardSessions(shards) as sessions:
+        assert await ShardedUserRepo(sessions).get_by_id(user.id) is None
+    async with directory() as session:
+        assert await session.get(UserShard, user.email.value) is None
+
+
+async def test_if_restores_directory_when_shard_commit_fails(shards, directory):
+    user = new_user()
+    async with shards.session(shards.shard_for(user.id.value)) as session:
+        # Same ID already on the shard, unknown to the directory
+        session.add(DBUser(id=user.id.value, name="x", email="x@test.com", password_hash="x"))
+        await session.commit()
+
+    with pytest.raises(IntegrityError):
+        await create(shards, user)
+
+    async with directory() as session:
+        assert await session.get(UserShard, user.email.value) is None
+
+
+async def test_if_refuses_writes_to_two_shards(shards):
+    first = new_user("first@test.com")
+    second = new_user("second@test.com")
+    while shards.shard_for(second.id.value) == shards.shard_for(first.id.value):
+        second = new_user("second@test.com")
+
+    with pytest.raises(CrossShardWriteError):
+        async with sharded_user_uow_factory(shards) as uow:
+            await uow.user_repo.create(first)
+            await uow.user_repo.create(second)
+
+
+async def test_if_reshards_and_backfills_directory(tmp_path, directory):
+    (source,) = await create_engines(tmp_path, 1, prefix="source")
+    users = [new_user(f"user{i}@test.com") for i in range(25)]
+    async with DBSession(source) as session:
+        for user in users:
+            await UserRepo(session).create(user)
+        await session.commit()
+    target = ShardSet(directory, [source, *await create_engines(tmp_path, 2)])
+
+    report = await reshard([source], target, batch_size=10)
+    again = await reshard([source], target, batch_size=10)
+
+    assert report.scanned == 25
+    assert report.moved == sum(1 for user in users if target.shard_for(user.id.value) != 0)
+    assert again.moved == 0
+    async with ShardSessions(target) as sessions:
+        repo = ShardedUserRepo(sessions)
+        for user in users:
+            assert await repo.get_by_email(user.email) == user
+    await target.dispose()
@@ -0,0 +1,89 @@
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.engine import make_url
+from sqlmodel import SQLModel
+
+from app.config import Settings
+from app.core.value_objects.id import ID
+from app.infra.db import DBSession, create_engine, create_read_engine, engine_options
+from app.infra.db.models.user import User as DBUser
+from app.infra.db.sqlite import is_sqlite_file
+
+
+def settings(url: str, **overrides) -> Settings:
+    return Settings(**{"DB_URL": url, "DB_TRANSACTION_POOLER": False, **overrides})
+
+
+@pytest.fixture
+async def engines(tmp_path):
+    config = settings(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}", DB_SQLITE_READERS=3)
+    writer = create_engine(config)
+    reader = create_read_engine(config, writer)
+    async with writer.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    yield writer, reader
+    await reader.dispose()
+    await writer.dispose()
+
+
+def test_if_detects_sqlite_files():
+    assert is_sqlite_file(make_url("sqlite+aiosqlite:////tmp/app.db"))
+    assert not is_sqlite_file(make_url("sqlite+aiosqlite://"))
+    assert not is_sqlite_file(make_url("sqlite+aiosqlite:///file:app?mode=memory&uri=true"))
+    assert not is_sqlite_file(make_url("postgresql+asyncpg://u:p@localhost/db"))
+
+
+def test_if_sizes_single_writer_and_reader_pool():
+    config = settings("sqlite+aiosqlite:////tmp/app.db", DB_POOL_SIZE=20, DB_SQLITE_READERS=8)
+
+    assert engine_options(config)["pool_size"] == 1
+    assert engine_options(config)["max_overflow"] == 0
+    assert engine_options(config, read_only=True)["pool_size"] == 8
+
+
+async def test_if_tunes_connections(engines):
+    writer, _ = engines
+
+    async with writer.connect() as conn:
+        assert await conn.scalar(text("PRAGMA journal_mode")) == "wal"
+        assert await conn.scalar(text("PRAGMA synchronous")) == 1
+        assert await conn.scalar(text("PRAGMA foreign_keys")) == 1
+        assert await conn.scalar(text("PRAGMA mmap_size")) > 0
+
+
+async def test_if_readers_cannot_write(engines):
+    _, reader = engines
+
+    async with reader.connect() as conn:
+        with pytest.raises(exc.OperationalError):
+            await conn.execute(text("DELETE FROM users"))
+
+
+async def test_if_readers_see_commits_while_writer_is_busy(engines):
+    writer, reader = engines
+    _id = ID.generate().value
+
+    async with DBSession(writer) as session:
+        session.add(DBUser(id=_id, name="Test", email="test@test.com", password_hash="x"))
+        await session.commit()
+        await session.execute(text("BEGIN IMMEDIATE"))
+
+        async with DBSession(reader) as other:
+            assert (await other.get(DBUser, _id)) is not None
+        await session.rollback()
+
+
+async def test_if_stores_uuids_as_16_bytes(engines):
+    writer, _ = engines
+    _id = ID.generate().value
+
+    async with DBSession(writer) as session:
+        session.add(DBUser(id=_id, name="Test", email="test@test.com", password_hash="x"))
+        await session.commit()
+        stored = (
+            await session.execute(text("SELECT typeof(id), length(id) FROM users"))
+        ).one()
+        loaded = await session.get(DBUser, _id)
+
+    assert tuple(stored) == ("blob", 16)
+    assert loaded is not None and loaded.id == _id
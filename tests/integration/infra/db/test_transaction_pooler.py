@@ -0,0 +1,32 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+
+from app.config import get_settings
+from app.infra.db import async_session
+
+settings = get_settings()
+
+pytestmark = pytest.mark.skipif(
+    not settings.DB_TRANSACTION_POOLER
+    or make_url(settings.DB_URL).get_driver_name() != "asyncpg",
+    reason="Needs DB_URL to point asyncpg at a transaction pooler such as PgBouncer",
+)
+
+
+async def test_if_prepared_statements_survive_server_connection_swaps():
+    # More clients than server connections forces each transaction to share and
+    # hop between server connections, which breaks per-connection statement names
+    async def query(i: int) -> int:
+        async with async_session() as session:
+            for _ in range(5):
+                result = await session.execute(text("SELECT CAST(:i AS int)"), {"i": i})
+                assert result.scalar_one() == i
+            await session.commit()
+        return i
+
+    results = await asyncio.gather(*(query(i) for i in range(50)))
+
+    assert results == list(range(50))
@@ -0,0 +1,138 @@
+from typing import List
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+
+from app.core.dtos.user import UserResponse
+from app.core.entities.user import User
+from app.core.exceptions import UserAlreadyExistsError
+from app.core.value_objects.email import Email
+from app.core.value_objects.id import ID
+from app.core.value_objects.password import Password
+from app.infra.db import DBSession
+from app.infra.db.repositories.user import UserRepo
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def users(engine) -> List[User]:
+    users = [
+        User(
+            id=ID.generate(),
+            name=f"User {i}",
+            email=Email(f"user{i}@test.com"),
+            password=Password("hashed_password"),
+        )
+        for i in range(3)
+    ]
+    async with DBSession(engine) as session:
+        for user in users:
+            await UserRepo(session).save(user)
+        await session.commit()
+    return users
+
+
+def response(user: User) -> UserResponse:
+    return UserResponse(id=str(user.id), name=user.name, email=user.email.value)
+
+
+def record_statements(engine) -> List[str]:
+    statements: List[str] = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    return statements
+
+
+async def test_if_reads_public_columns_only(engine, users):
+    statements = record_statements(engine)
+
+    async with DBSession(engine) as session:
+        found = await UserRepo(session).get_response_by_id(users[0].id)
+        assert len(session.identity_map) == 0
+
+    assert found == response(users[0])
+    assert "password_hash" not in statements[-1]
+    assert "LIMIT" in statements[-1]
+
+
+async def test_if_returns_none_for_missing_user(engine, users):
+    async with DBSession(engine) as session:
+        assert await UserRepo(session).get_response_by_id(ID.generate()) is None
+
+
+async def test_if_reads_many_users_in_one_query(engine, users):
+    async with DBSession(engine) as session:
+        repo = UserRepo(session)
+        found = await repo.get_many_responses_by_ids([users[0].id, users[2].id, ID.generate()])
+        assert await repo.get_many_responses_by_ids([]) == []
+
+    assert sorted(found, key=lambda user: user.id) == sorted(
+        [response(users[0]), response(users[2])], key=lambda user: user.id
+    )
+
+
+async def test_if_updates_given_fields_in_one_statement(engine, users):
+    async with DBSession(engine) as session:
+        statements = record_statements(engine)
+        updated = await UserRepo(session).update_profile(users[0].id, name="Renamed")
+        await session.commit()
+
+    assert updated == UserResponse(
+        id=str(users[0].id), name="Renamed", email=users[0].email.value
+    )
+    assert [statement.split()[0] for statement in statements] == ["UPDATE"]
+    assert "RETURNING" in statements[0] and "email=" not in statements[0]
+    async with DBSession(engine) as session:
+        saved = await UserRepo(session).get_by_id(users[0].id)
+    assert saved is not None and saved.password == users[0].password
+
+
+async def test_if_signals_missing_user_on_write(engine, users):
+    async with DBSession(engine) as session:
+        repo = UserRepo(session)
+        assert await repo.update_profile(ID.generate(), name="Renamed") is None
+        assert await repo.update_password(ID.generate(), Password("rehashed")) is False
+        assert await repo.delete(ID.generate()) is False
+
+
+async def test_if_deletes_in_one_statement(engine, users):
+    async with DBSession(engine) as session:
+        statements = record_statements(engine)
+        deleted = await UserRepo(session).delete_returning(users[1].id)
+        await session.commit()
+
+    assert deleted == response(users[1])
+    assert [statement.split()[0] for statement in statements] == ["DELETE"]
+    async with DBSession(engine) as session:
+        assert await UserRepo(session).get_by_id(users[1].id) is None
+
+
+async def test_if_create_rejects_taken_email_in_one_statement(engine, users):
+    duplicate = User(
+        id=ID.generate(),
+        name="Other",
+        email=users[0].email,
+        password=Password("hashed_password"),
+    )
+
+    async with DBSession(engine) as session:
+        statements = record_statements(engine)
+        with pytest.raises(UserAlreadyExistsError):
+            await UserRepo(session).create(duplicate)
+
+    assert len(statements) == 1 and "ON CONFLICT" in statements[0]
+    async with DBSession(engine) as session:
+        assert await UserRepo(session).get_by_id(duplicate.id) is None
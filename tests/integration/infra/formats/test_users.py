@@ -0,0 +1,79 @@
+from typing import List
+
+from app.core.dtos.user import ImportRowError, ImportUserRow
+from app.infra.formats.users import MAX_LINE_BYTES, read_user_rows
+
+
+async def chunked(data: bytes, size: int = 7):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def parse(data: bytes, row_format, size: int = 7) -> List:
+    return [row async for row in read_user_rows(chunked(data, size), row_format)]
+
+
+async def test_if_reads_ndjson_across_chunks():
+    data = (
+        b'{"name": "One", "email": "one@test.com", "password": "password1"}\n'
+        b"\n"
+        b'{"name": "Two", "email": "two@test.com", "password": "password2"}'
+    )
+
+    assert await parse(data, "ndjson") == [
+        ImportUserRow(line=1, name="One", email="one@test.com", password="password1"),
+        ImportUserRow(line=3, name="Two", email="two@test.com", password="password2"),
+    ]
+
+
+async def test_if_reports_unreadable_ndjson_lines():
+    data = b'not json\n[1, 2]\n{"name": "One", "email": 3}\n'
+
+    assert await parse(data, "ndjson") == [
+        ImportRowError(line=1, error="Invalid JSON"),
+        ImportRowError(line=2, error="Expected a JSON object"),
+        ImportRowError(line=3, error="Missing or invalid fields: email, password"),
+    ]
+
+
+async def test_if_reads_csv_with_multiline_fields():
+    data = (
+        b"Password,Email,Name,Extra\r\n"
+        b'password1,one@test.com,"One, ""the first""\nof many",x\r\n'
+        b"password2,two@test.com,Two\r\n"
+    )
+
+    assert await parse(data, "csv") == [
+        ImportUserRow(
+            line=2, name='One, "the first"\nof many', email="one@test.com", password="password1"
+        ),
+        ImportRowError(line=4, error="Expected 4 columns"),
+    ]
+
+
+async def test_if_rejects_csv_without_required_columns():
+    data = b"name,email\nOne,one@test.com\n"
+
+    assert await parse(data, "csv") == [
+        ImportRowError(line=1, error="Missing columns: password")
+    ]
+
+
+async def test_if_reports_unterminated_csv_field():
+    data = b'name,email,password\nOne,"one@test.com\n'
+
+    assert await parse(data, "csv") == [
+        ImportRowError(line=2, error="Unterminated quoted field")
+    ]
+
+
+async def test_if_skips_oversized_lines_without_buffering_them():
+    long_line = b'{"name": "' + b"x" * (MAX_LINE_BYTES * 2) + b'"}\n'
+    data = long_line + b'{"name": "Two", "email": "two@test.com", "password": "password2"}\n'
+
+    rows = await parse(data, "ndjson", size=4096)
+
+    assert rows == [
+        ImportRowError(line=1, error=f"Line longer than {MAX_LINE_BYTES} bytes"),
+        ImportUserRow(line=2, name="Two", email="two@test.com", password="password2"),
+    ]
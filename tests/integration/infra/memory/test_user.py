@@ -0,0 +1,156 @@
+import pytest
+
+from app.core.entities.user import User
+from app.core.exceptions import UserAlreadyExistsError, UserNotFoundError
+from app.core.value_objects.email import Email
+from app.core.value_objects.id import ID
+from app.core.value_objects.password import Password
+from app.infra.memory.user import InMemoryUserRepo, InMemoryUserStore, memory_user_uow_factory
+
+
+@pytest.fixture
+def store() -> InMemoryUserStore:
+    return InMemoryUserStore()
+
+
+def new_user(email: str = "test@test.com") -> User:
+    return User(
+        id=ID.generate(), name="Test", email=Email(email), password=Password("hashed_password")
+    )
+
+
+def renamed(user: User, email: str) -> User:
+    return User(id=user.id, name=user.name, email=Email(email), password=user.password)
+
+
+async def create(store: InMemoryUserStore, user: User) -> None:
+    async with memory_user_uow_factory(store) as uow:
+        await uow.user_repo.create(user)
+
+
+async def test_if_commit_publishes_writes(store):
+    user = new_user()
+
+    async with memory_user_uow_factory(store) as uow:
+        await uow.user_repo.create(user)
+        assert await uow.user_repo.get_by_email(user.email) == user
+        assert await InMemoryUserRepo(store).get_by_id(user.id) is None
+
+    repo = InMemoryUserRepo(store)
+    assert await repo.get_by_id(user.id) == user
+    assert await repo.get_by_email(user.email) == user
+
+
+async def test_if_rollback_discards_writes(store):
+    user = new_user()
+    await create(store, user)
+
+    with pytest.raises(RuntimeError):
+        async with memory_user_uow_factory(store) as uow:
+            await uow.user_repo.delete(user.id)
+            await uow.user_repo.create(new_user("other@test.com"))
+            raise RuntimeError
+
+    assert len(store) == 1
+    assert await InMemoryUserRepo(store).get_by_id(user.id) == user
+
+
+async def test_if_reindexes_email_on_update_and_delete(store):
+    user = new_user()
+    await create(store, user)
+
+    async with memory_user_uow_factory(store) as uow:
+        await uow.user_repo.update(renamed(user, "new@test.com"))
+        assert await uow.user_repo.get_by_email(user.email) is None
+
+    repo = InMemoryUserRepo(store)
+    assert await repo.get_by_email(user.email) is None
+    assert await repo.get_by_email(Email("new@test.com")) == renamed(user, "new@test.com")
+
+    async with memory_user_uow_factory(store) as uow:
+        assert await uow.user_repo.delete(user.id) is True
+        assert await uow.user_repo.delete(user.id) is False
+
+    assert store.by_id == {}
+    assert store.by_email == {}
+
+
+async def test_if_users_can_swap_emails(store):
+    first, second = new_user("first@test.com"), new_user("second@test.com")
+    await create(store, first)
+    await create(store, second)
+
+    async with memory_user_uow_factory(store) as uow:
+        await uow.user_repo.update(renamed(first, "second@test.com"))
+        await uow.user_repo.update(renamed(second, "first@test.com"))
+
+    repo = InMemoryUserRepo(store)
+    assert (await repo.get_by_email(Email("first@test.com"))).id == second.id
+    assert (await repo.get_by_email(Email("second@test.com"))).id == first.id
+
+
+async def test_if_rejects_email_taken_by_concurrent_commit(store):
+    first, second = new_user(), new_user()
+
+    async with memory_user_uow_factory(store) as uow:
+        await uow.user_repo.create(first)
+        other = memory_user_uow_factory(store)
+        await other.user_repo.create(second)
+        await other.commit()
+
+        with pytest.raises(UserAlreadyExistsError):
+            await uow.commit()
+
+    assert list(store.by_id) == [second.id.value]
+
+
+async def test_if_rejects_update_of_concurrently_deleted_user(store):
+    user = new_user()
+    await create(store, user)
+
+    uow = memory_user_uow_factory(store)
+    assert await uow.user_repo.update_password(user.id, Password("rehashed_password"))
+    async with memory_user_uow_factory(store) as other:
+        await other.user_repo.delete(user.id)
+
+    with pytest.raises(UserNotFoundError):
+        await uow.commit()
+    assert len(store) == 0
+
+
+async def test_if_gets_many_by_ids(store):
+    users = [new_user(f"user{i}@test.com") for i in range(3)]
+    for user in users:
+        await create(store, user)
+
+    found = await InMemoryUserRepo(store).get_many_by_ids(
+        [users[0].id, users[2].id, users[0].id, ID.generate()]
+    )
+
+    assert found == [users[0], users[2]]
+
+
+async def test_if_reads_responses_with_staged_writes(store):
+    kept, deleted = new_user("kept@test.com"), new_user("deleted@test.com")
+    await create(store, kept)
+    await create(store, deleted)
+
+    async with memory_user_uow_factory(store) as uow:
+        await uow.user_repo.delete(deleted.id)
+        assert await uow.user_repo.get_response_by_id(deleted.id) is None
+        found = await uow.user_repo.get_many_responses_by_ids([kept.id, deleted.id])
+
+    assert [user.email for user in found] == ["kept@test.com"]
+
+
+async def test_if_updates_given_fields_only(store):
+    user = new_user()
+    await create(store, user)
+
+    async with memory_user_uow_factory(store) as uow:
+        updated = await uow.user_repo.update_profile(user.id, email=Email("new@test.com"))
+        assert await uow.user_repo.update_profile(ID.generate(), name="Renamed") is None
+
+    assert updated is not None and updated.name == user.name
+    saved = await InMemoryUserRepo(store).get_by_email(Email("new@test.com"))
+    assert saved is not None and saved.password == user.password
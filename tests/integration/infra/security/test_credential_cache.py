@@ -0,0 +1,45 @@
+from app.core.dtos.user import UserResponse
+from app.infra.security.credential_cache import HMACCredentialCache
+
+
+def make_user(_id: str = "1") -> UserResponse:
+    return UserResponse(id=_id, name="Test", email="test@test.com")
+
+
+def test_if_caches_only_matching_credentials():
+    cache = HMACCredentialCache(ttl_seconds=5, max_size=10)
+    cache.put("test@test.com", "password", make_user())
+
+    assert cache.get("test@test.com", "password") == make_user()
+    assert cache.get("test@test.com", "wrong_password") is None
+    assert cache.get("other@test.com", "password") is None
+
+
+def test_if_never_stores_plain_text_credentials():
+    cache = HMACCredentialCache(ttl_seconds=5, max_size=10)
+    cache.put("test@test.com", "password", make_user())
+
+    (key,) = cache._keys_by_user["1"]
+    assert b"password" not in key
+    assert b"test@test.com" not in key
+
+
+def test_if_invalidates_every_credential_of_a_user():
+    cache = HMACCredentialCache(ttl_seconds=5, max_size=10)
+    cache.put("test@test.com", "password", make_user())
+    cache.put("test@test.com", "other_password", make_user())
+    cache.put("another@test.com", "password", make_user("2"))
+
+    cache.invalidate("1")
+
+    assert cache.get("test@test.com", "password") is None
+    assert cache.get("test@test.com", "other_password") is None
+    assert cache.get("another@test.com", "password") == make_user("2")
+
+
+def test_if_keeps_user_index_bounded_on_eviction():
+    cache = HMACCredentialCache(ttl_seconds=5, max_size=1)
+    cache.put("test@test.com", "password", make_user())
+    cache.put("another@test.com", "password", make_user("2"))
+
+    assert list(cache._keys_by_user) == ["2"]
@@ -1,4 +1,14 @@
-from app.infra.security.crypto import Hasher
+import asyncio
+
+import pytest
+
+from app.core.exceptions import HasherOverloadedError
+from app.infra.security.crypto import (
+    Hasher,
+    HasherStats,
+    PooledHasher,
+    calibrate_bcrypt_rounds,
+)
 
 
 def test_if_hashes_value():
@@ -19,3 +29,53 @@ def test_if_returns_false_when_hashed_value_is_different():
     value = "testing"
     hashed = hasher.hash("different")
     assert not hasher.verify(value, hashed)
+
+
+@pytest.fixture
+def pooled_hasher():
+    hasher = PooledHasher(executor="thread", workers=1, max_queue=1)
+    yield hasher
+    hasher.shutdown()
+
+
+async def test_if_pooled_hasher_hashes_and_verifies_value(pooled_hasher):
+    value = "testing"
+    hashed = await pooled_hasher.hash(value)
+    assert value != hashed
+    assert await pooled_hasher.verify(value, hashed)
+    assert not await pooled_hasher.verify("different", hashed)
+
+
+async def test_if_pooled_hasher_works_with_process_pool():
+    hasher = PooledHasher(executor="process", workers=1)
+    try:
+        hashed = await hasher.hash("testing")
+        assert await hasher.verify("testing", hashed)
+    finally:
+        hasher.shutdown()
+
+
+async def test_if_pooled_hasher_rejects_when_backlog_is_full(pooled_hasher):
+    results = await asyncio.gather(
+        *(pooled_hasher.hash("testing") for _ in range(3)), return_exceptions=True
+    )
+
+    assert isinstance(results[-1], HasherOverloadedError)
+    assert all(isinstance(result, str) for result in results[:2])
+    assert pooled_hasher.stats() == HasherStats(
+        in_flight=0, queued=0, max_in_flight=1, max_queue=1
+    )
+
+
+def test_if_flags_hashes_with_different_cost_for_update():
+    hasher = Hasher(rounds=5)
+
+    assert not hasher.needs_update(hasher.hash("testing"))
+    assert hasher.needs_update(Hasher(rounds=4).hash("testing"))
+    assert hasher.needs_update(Hasher(rounds=6).hash("testing"))
+
+
+def test_if_calibrates_bcrypt_rounds_within_bounds():
+    assert calibrate_bcrypt_rounds(0.001, min_rounds=4, max_rounds=6) == 4
+    assert calibrate_bcrypt_rounds(10_000_000, min_rounds=4, max_rounds=6) == 6
+    assert 4 <= calibrate_bcrypt_rounds(100, min_rounds=4, max_rounds=16) <= 16
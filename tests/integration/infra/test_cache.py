@@ -0,0 +1,54 @@
+from app.infra.cache import CacheStats, TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_if_returns_cached_value_until_it_expires():
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl_seconds=10, clock=clock)
+    cache.set("key", 1)
+
+    clock.now = 9.9
+    assert cache.get("key") == 1
+
+    clock.now = 10
+    assert cache.get("key") is None
+    assert cache.stats() == CacheStats(hits=1, misses=1, size=0, max_size=2)
+
+
+def test_if_caps_entry_ttl_to_the_cache_ttl():
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl_seconds=10, clock=clock)
+    cache.set("short", 1, ttl_seconds=1)
+    cache.set("long", 2, ttl_seconds=100)
+    cache.set("expired", 3, ttl_seconds=0)
+
+    clock.now = 5
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+    assert cache.get("expired") is None
+
+    clock.now = 10
+    assert cache.get("long") is None
+
+
+def test_if_evicts_least_recently_used_entry():
+    evicted = []
+    cache: TTLCache[str, int] = TTLCache(
+        max_size=2, ttl_seconds=10, on_evict=lambda k, v: evicted.append(k)
+    )
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert evicted == ["b"]
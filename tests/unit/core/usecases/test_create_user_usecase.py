@@ -7,15 +7,17 @@ from app.core.dtos.user import CreateUserRequest, UserResponse
 from app.core.entities.user import User
 from app.core.exceptions import InvalidUserError, UserAlreadyExistsError
 from app.core.usecases.user.create_user import CreateUserUsecase
-from app.core.value_objects.email import Email
-from app.core.value_objects.id import ID
-from app.core.value_objects.password import Password
 
 
 @pytest.fixture
 def mock_repo():
     """Create a mock user repository."""
     repo = MagicMock()
+    repo.create = AsyncMock(
+        side_effect=lambda user: UserResponse(
+            id=str(user.id), name=user.name, email=user.email.value
+        )
+    )
     repo.save = AsyncMock()
     repo.get_by_email = AsyncMock(return_value=None)
     return repo
@@ -37,7 +39,7 @@ def mock_uow(mock_repo):
 def mock_hasher():
     """Create a mock hasher."""
     hasher = MagicMock()
-    hasher.hash.return_value = "hashed_password"
+    hasher.hash = AsyncMock(return_value="hashed_password")
     return hasher
 
 
@@ -64,10 +66,10 @@ async def test_create_user_success(use_case, valid_dto, mock_uow, mock_hasher):
     assert uuid.UUID(result.id)  # Verify it's a valid UUID string
 
     mock_hasher.hash.assert_called_once_with("validpassword123")
-    mock_uow.user_repo.save.assert_called_once()
+    mock_uow.user_repo.create.assert_called_once()
 
     # Verify the saved user has correct attributes
-    saved_user = mock_uow.user_repo.save.call_args[0][0]
+    saved_user = mock_uow.user_repo.create.call_args[0][0]
     assert isinstance(saved_user, User)
     assert saved_user.name == "John Doe"
     assert saved_user.email.value == "john@example.com"
@@ -96,14 +98,10 @@ async def test_create_user_invalid_password(use_case):
 
 async def test_create_user_already_exists(use_case, valid_dto, mock_uow):
     """Test user creation when email already exists."""
-    # Mock that a user with this email already exists
-    existing_user = User(
-        id=ID.generate(),
-        name="Existing User",
-        email=Email("john@example.com"),
-        password=Password("hashedpassword"),
+    # The insert itself reports the taken email
+    mock_uow.user_repo.create.side_effect = UserAlreadyExistsError(
+        "User with email john@example.com already exists"
     )
-    mock_uow.user_repo.get_by_email.return_value = existing_user
 
     with pytest.raises(
         UserAlreadyExistsError, match="User with email john@example.com already exists"
@@ -140,14 +138,11 @@ async def test_create_user_repository_called_correctly(
     """Test that repository methods are called with correct parameters."""
     await use_case.execute(valid_dto)
 
-    # Verify repository interactions
-    mock_uow.user_repo.get_by_email.assert_called_once()
-    email_arg = mock_uow.user_repo.get_by_email.call_args[0][0]
-    assert isinstance(email_arg, Email)
-    assert email_arg.value == "john@example.com"
+    # Verify repository interactions: one insert, no lookup by email first
+    mock_uow.user_repo.get_by_email.assert_not_called()
 
-    mock_uow.user_repo.save.assert_called_once()
-    saved_user = mock_uow.user_repo.save.call_args[0][0]
+    mock_uow.user_repo.create.assert_called_once()
+    saved_user = mock_uow.user_repo.create.call_args[0][0]
     assert isinstance(saved_user, User)
     assert saved_user.name == "John Doe"
     assert saved_user.email.value == "john@example.com"
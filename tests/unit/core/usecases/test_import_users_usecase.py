@@ -0,0 +1,106 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.dtos.user import ImportRowError, ImportUserRow
+from app.core.exceptions import HasherOverloadedError
+from app.core.usecases.user.import_users import ImportUsersUsecase
+from app.core.value_objects.email import Email
+
+
+@pytest.fixture
+def mock_repo():
+    """Create a mock user repository that skips no email."""
+    repo = MagicMock()
+    repo.create_many = AsyncMock(return_value=[])
+    return repo
+
+
+@pytest.fixture
+def mock_uow(mock_repo):
+    """Create a mock unit of work."""
+    uow = MagicMock()
+    uow.user_repo = mock_repo
+    uow.__aenter__ = AsyncMock(return_value=uow)
+    uow.__aexit__ = AsyncMock(return_value=None)
+    return uow
+
+
+@pytest.fixture
+def mock_hasher():
+    """Create a mock hasher."""
+    hasher = MagicMock()
+    hasher.hash = AsyncMock(side_effect=lambda password: f"hashed:{password}")
+    return hasher
+
+
+@pytest.fixture
+def use_case(mock_uow, mock_hasher):
+    return ImportUsersUsecase(uow_factory=lambda: mock_uow, hasher=mock_hasher, batch_size=2)
+
+
+def row(line, email, name="User", password="password123"):
+    return ImportUserRow(line=line, name=name, email=email, password=password)
+
+
+async def stream(*rows):
+    for item in rows:
+        yield item
+
+
+async def collect(use_case, *rows):
+    return [progress async for progress in use_case.execute(stream(*rows))]
+
+
+async def test_import_writes_hashed_users_per_batch(use_case, mock_repo):
+    reports = await collect(
+        use_case, row(1, "a@test.com"), row(2, "b@test.com"), row(3, "c@test.com")
+    )
+
+    assert [(r.rows, r.imported, r.rejected) for r in reports] == [(2, 2, 0), (3, 3, 0)]
+    assert mock_repo.create_many.await_count == 2
+    first_batch = mock_repo.create_many.await_args_list[0].args[0]
+    assert [user.email.value for user in first_batch] == ["a@test.com", "b@test.com"]
+    assert first_batch[0].password.value == "hashed:password123"
+
+
+async def test_import_reports_invalid_and_duplicate_rows(use_case, mock_repo, mock_hasher):
+    reports = await collect(
+        use_case,
+        row(1, "a@test.com"),
+        row(2, "a@test.com"),
+        row(3, "not-an-email"),
+        ImportRowError(line=4, error="Invalid JSON"),
+        row(5, "b@test.com", password="short"),
+    )
+
+    errors = [(error.line, error.error) for report in reports for error in report.errors]
+    assert [line for line, _ in errors] == [2, 3, 4, 5]
+    assert errors[0][1] == "Duplicate of line 1"
+    assert reports[-1].imported == 1 and reports[-1].rejected == 4
+    assert mock_hasher.hash.await_count == 1
+
+
+async def test_import_reports_taken_emails(use_case, mock_repo):
+    mock_repo.create_many.return_value = [Email("b@test.com")]
+
+    [report] = await collect(use_case, row(1, "a@test.com"), row(2, "b@test.com"))
+
+    assert (report.imported, report.rejected) == (1, 1)
+    assert report.errors == [ImportRowError(line=2, error="User already exists")]
+
+
+async def test_import_of_nothing_reports_once(use_case, mock_repo):
+    reports = await collect(use_case)
+
+    assert [(r.rows, r.imported, r.rejected) for r in reports] == [(0, 0, 0)]
+    mock_repo.create_many.assert_not_awaited()
+
+
+async def test_import_stops_when_hasher_is_overloaded(use_case, mock_repo, mock_hasher):
+    mock_hasher.hash.side_effect = HasherOverloadedError("Overloaded")
+
+    with pytest.raises(HasherOverloadedError):
+        await collect(use_case, row(1, "a@test.com"))
+
+    mock_repo.create_many.assert_not_awaited()
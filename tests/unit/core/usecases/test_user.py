@@ -3,7 +3,7 @@ from uuid import uuid4
 
 import pytest
 
-from app.core.dtos.user import CreateUserRequest, UpdateUser
+from app.core.dtos.user import CreateUserRequest, UpdateUser, UserResponse
 from app.core.entities.user import User
 from app.core.exceptions import (
     AuthenticationFailedError,
@@ -16,10 +16,12 @@ from app.core.usecases.user import (
     CreateUserUsecase,
     DeleteUserUsecase,
     GetUserUsecase,
+    GetUsersUsecase,
+    RehashPasswordUsecase,
     UpdateUserUsecase,
 )
 from app.core.value_objects.email import Email
-from app.core.value_objects.id import ID
+from app.core.value_objects.id import ID, InvalidIDError
 from app.core.value_objects.password import Password
 
 
@@ -43,8 +45,8 @@ def mock_user():
 def mock_hasher():
     """Create a mock hasher."""
     hasher = MagicMock()
-    hasher.hash.return_value = "hashed_password"
-    hasher.verify.return_value = True
+    hasher.hash = AsyncMock(return_value="hashed_password")
+    hasher.verify = AsyncMock(return_value=True)
     return hasher
 
 
@@ -52,11 +54,16 @@ def mock_hasher():
 def mock_user_repo():
     """Create a mock user repository."""
     repo = MagicMock()
+    repo.create = AsyncMock()
     repo.save = AsyncMock()
     repo.get_by_id = AsyncMock()
+    repo.get_many_by_ids = AsyncMock()
+    repo.get_response_by_id = AsyncMock()
+    repo.get_many_responses_by_ids = AsyncMock()
     repo.get_by_email = AsyncMock()
     repo.delete = AsyncMock()
     repo.update = AsyncMock()
+    repo.update_profile = AsyncMock()
     return repo
 
 
@@ -73,7 +80,9 @@ def mock_user_uow(mock_user_repo):
 
 
 async def test_if_creates_user(mock_user_uow, mock_hasher, create_user_dto):
-    mock_user_uow.user_repo.get_by_email.return_value = None
+    mock_user_uow.user_repo.create.side_effect = lambda user: UserResponse(
+        id=str(user.id), name=user.name, email=user.email.value
+    )
 
     use_case = CreateUserUsecase(uow=mock_user_uow, hasher=mock_hasher)
     result = await use_case.execute(create_user_dto)
@@ -83,8 +92,10 @@ async def test_if_creates_user(mock_user_uow, mock_hasher, create_user_dto):
     assert isinstance(result.id, str)
 
     mock_hasher.hash.assert_called_once_with("password")
-    mock_user_uow.user_repo.save.assert_called_once()
-    mock_user_uow.user_repo.get_by_email.assert_called_once()
+    (created,), _ = mock_user_uow.user_repo.create.call_args
+    assert created.password.value == "hashed_password"
+    # The insert alone detects duplicates, no lookup first
+    mock_user_uow.user_repo.get_by_email.assert_not_called()
 
 
 async def test_if_validates_password_before_hashing(mock_user_uow, mock_hasher):
@@ -108,7 +119,9 @@ async def test_if_validates_password_before_hashing(mock_user_uow, mock_hasher):
 async def test_if_raises_when_creating_duplicated_user(
     mock_user_uow, mock_hasher, create_user_dto, mock_user
 ):
-    mock_user_uow.user_repo.get_by_email.return_value = mock_user
+    mock_user_uow.user_repo.create.side_effect = UserAlreadyExistsError(
+        f"User with email {create_user_dto.email} already exists"
+    )
 
     use_case = CreateUserUsecase(uow=mock_user_uow, hasher=mock_hasher)
 
@@ -117,11 +130,14 @@ async def test_if_raises_when_creating_duplicated_user(
     ):
         await use_case.execute(create_user_dto)
 
-    mock_user_uow.user_repo.save.assert_not_called()
+    mock_user_uow.__aexit__.assert_called_once()
+    assert mock_user_uow.__aexit__.call_args.args[0] is UserAlreadyExistsError
 
 
 async def test_if_get_user_by_id(mock_user_repo, mock_user):
-    mock_user_repo.get_by_id.return_value = mock_user
+    mock_user_repo.get_response_by_id.return_value = UserResponse(
+        id=str(mock_user.id), name=mock_user.name, email=mock_user.email.value
+    )
 
     use_case = GetUserUsecase(user_repo=mock_user_repo)
     result = await use_case.execute(str(mock_user.id))
@@ -129,51 +145,75 @@ async def test_if_get_user_by_id(mock_user_repo, mock_user):
     assert result.id == str(mock_user.id)
     assert result.name == mock_user.name
     assert result.email == mock_user.email.value
-    mock_user_repo.get_by_id.assert_called_once()
+    mock_user_repo.get_response_by_id.assert_called_once()
+    mock_user_repo.get_by_id.assert_not_called()
 
 
 async def test_if_returns_none_when_getting_nonexisting_user(mock_user_repo):
-    mock_user_repo.get_by_id.return_value = None
+    mock_user_repo.get_response_by_id.return_value = None
 
     use_case = GetUserUsecase(user_repo=mock_user_repo)
 
     with pytest.raises(UserNotFoundError):
         await use_case.execute(str(uuid4()))
 
-    mock_user_repo.get_by_id.assert_called_once()
+    mock_user_repo.get_response_by_id.assert_called_once()
+
+
+async def test_if_gets_users_by_ids_in_one_lookup(mock_user_repo, mock_user):
+    mock_user_repo.get_many_responses_by_ids.return_value = [
+        UserResponse(id=str(mock_user.id), name=mock_user.name, email=mock_user.email.value)
+    ]
+
+    use_case = GetUsersUsecase(user_repo=mock_user_repo)
+    result = await use_case.execute([str(mock_user.id), str(mock_user.id), str(uuid4())])
+
+    assert list(result) == [str(mock_user.id)]
+    assert result[str(mock_user.id)].email == mock_user.email.value
+    (ids,), _ = mock_user_repo.get_many_responses_by_ids.call_args
+    assert len(ids) == 2
 
 
-async def test_if_returns_false_when_deleting_nonexisting_user(mock_user_repo):
-    mock_user_repo.delete.return_value = False
+async def test_if_raises_when_getting_users_with_invalid_id(mock_user_repo):
+    use_case = GetUsersUsecase(user_repo=mock_user_repo)
 
-    use_case = DeleteUserUsecase(user_repo=mock_user_repo)
+    with pytest.raises(InvalidIDError):
+        await use_case.execute(["invalid"])
+
+    mock_user_repo.get_many_responses_by_ids.assert_not_called()
+
+
+async def test_if_returns_false_when_deleting_nonexisting_user(mock_user_uow):
+    mock_user_uow.user_repo.delete.return_value = False
+
+    use_case = DeleteUserUsecase(uow=mock_user_uow)
     result = await use_case.execute(str(uuid4()))
 
     assert result is False
-    mock_user_repo.delete.assert_called_once()
+    mock_user_uow.user_repo.delete.assert_called_once()
 
 
-async def test_if_returns_true_when_deleting_existing_user(mock_user_repo):
-    mock_user_repo.delete.return_value = True
+async def test_if_returns_true_when_deleting_existing_user(mock_user_uow):
+    mock_user_uow.user_repo.delete.return_value = True
 
-    use_case = DeleteUserUsecase(user_repo=mock_user_repo)
+    use_case = DeleteUserUsecase(uow=mock_user_uow)
     result = await use_case.execute(str(uuid4()))
 
     assert result is True
-    mock_user_repo.delete.assert_called_once()
+    mock_user_uow.user_repo.delete.assert_called_once()
+    mock_user_uow.__aexit__.assert_called_once()
+
+
+def user_response(user: User, **changes: str) -> UserResponse:
+    fields = {"id": str(user.id), "name": user.name, "email": user.email.value}
+    return UserResponse(**{**fields, **changes})
 
 
 async def test_if_updates_user_name(mock_user_uow, mock_user):
-    updated_user = User(
-        id=mock_user.id,
-        name="changed",
-        email=mock_user.email,
-        password=mock_user.password,
+    mock_user_uow.user_repo.update_profile.return_value = user_response(
+        mock_user, name="changed"
     )
 
-    mock_user_uow.user_repo.get_by_id.return_value = mock_user
-    mock_user_uow.user_repo.update.return_value = updated_user
-
     use_case = UpdateUserUsecase(uow=mock_user_uow)
     to_update = UpdateUser("changed")
     result = await use_case.execute(str(mock_user.id), to_update)
@@ -181,20 +221,16 @@ async def test_if_updates_user_name(mock_user_uow, mock_user):
     assert result.name == "changed"
     assert result.id == str(mock_user.id)
     assert result.email == mock_user.email.value
-    mock_user_uow.user_repo.update.assert_called_once()
+    mock_user_uow.user_repo.update_profile.assert_called_once_with(
+        mock_user.id, name="changed", email=None
+    )
 
 
 async def test_if_updates_user_email(mock_user_uow, mock_user):
-    updated_user = User(
-        id=mock_user.id,
-        name=mock_user.name,
-        email=Email("changed@mail.com"),
-        password=mock_user.password,
+    mock_user_uow.user_repo.update_profile.return_value = user_response(
+        mock_user, email="changed@mail.com"
     )
 
-    mock_user_uow.user_repo.get_by_id.return_value = mock_user
-    mock_user_uow.user_repo.update.return_value = updated_user
-
     use_case = UpdateUserUsecase(uow=mock_user_uow)
     to_update = UpdateUser(email="changed@mail.com")
     result = await use_case.execute(str(mock_user.id), to_update)
@@ -202,20 +238,16 @@ async def test_if_updates_user_email(mock_user_uow, mock_user):
     assert result.email == "changed@mail.com"
     assert result.id == str(mock_user.id)
     assert result.name == mock_user.name
-    mock_user_uow.user_repo.update.assert_called_once()
+    mock_user_uow.user_repo.update_profile.assert_called_once_with(
+        mock_user.id, name=None, email=Email("changed@mail.com")
+    )
 
 
 async def test_if_fully_updates_user(mock_user_uow, mock_user):
-    updated_user = User(
-        id=mock_user.id,
-        name="changed",
-        email=Email("changed@mail.com"),
-        password=mock_user.password,
+    mock_user_uow.user_repo.update_profile.return_value = user_response(
+        mock_user, name="changed", email="changed@mail.com"
     )
 
-    mock_user_uow.user_repo.get_by_id.return_value = mock_user
-    mock_user_uow.user_repo.update.return_value = updated_user
-
     use_case = UpdateUserUsecase(uow=mock_user_uow)
     to_update = UpdateUser("changed", email="changed@mail.com")
     result = await use_case.execute(str(mock_user.id), to_update)
@@ -223,30 +255,32 @@ async def test_if_fully_updates_user(mock_user_uow, mock_user):
     assert result.name == "changed"
     assert result.email == "changed@mail.com"
     assert result.id == str(mock_user.id)
-    mock_user_uow.user_repo.update.assert_called_once()
+    mock_user_uow.user_repo.update_profile.assert_called_once()
 
 
-async def test_if_keeps_password_unchanged_when_updating(mock_user_uow, mock_user):
-    updated_user = User(
-        id=mock_user.id,
-        name="changed",
-        email=mock_user.email,
-        password=mock_user.password,
+async def test_if_updates_without_reading_user_first(mock_user_uow, mock_user):
+    mock_user_uow.user_repo.update_profile.return_value = user_response(
+        mock_user, name="changed"
     )
 
-    mock_user_uow.user_repo.get_by_id.return_value = mock_user
-    mock_user_uow.user_repo.update.return_value = updated_user
-
     use_case = UpdateUserUsecase(uow=mock_user_uow)
     await use_case.execute(str(mock_user.id), UpdateUser("changed"))
 
-    # Verify the update was called with the same password
-    called_user = mock_user_uow.user_repo.update.call_args[0][0]
-    assert called_user.password == mock_user.password
+    mock_user_uow.user_repo.get_by_id.assert_not_called()
+    mock_user_uow.user_repo.update.assert_not_called()
+
+
+async def test_if_rejects_blank_name_when_updating(mock_user_uow, mock_user):
+    use_case = UpdateUserUsecase(uow=mock_user_uow)
+
+    with pytest.raises(InvalidUserError):
+        await use_case.execute(str(mock_user.id), UpdateUser("   "))
+
+    mock_user_uow.user_repo.update_profile.assert_not_called()
 
 
 async def test_if_returns_none_when_updating_nonexisting_user(mock_user_uow):
-    mock_user_uow.user_repo.get_by_id.return_value = None
+    mock_user_uow.user_repo.update_profile.return_value = None
 
     to_update = UpdateUser("changed", email="changed@mail.com")
     use_case = UpdateUserUsecase(uow=mock_user_uow)
@@ -254,8 +288,6 @@ async def test_if_returns_none_when_updating_nonexisting_user(mock_user_uow):
     with pytest.raises(UserNotFoundError):
         await use_case.execute(str(uuid4()), to_update)
 
-    mock_user_uow.user_repo.update.assert_not_called()
-
 
 async def test_if_authenticates_user(mock_user_repo, mock_hasher, mock_user):
     mock_user_repo.get_by_email.return_value = mock_user
@@ -295,3 +327,154 @@ async def test_if_returns_none_when_authenticating_with_invalid_password(
         await use_case.execute("test@test.com", "invalid_password")
 
     mock_hasher.verify.assert_called_once_with("invalid_password", mock_user.password.value)
+
+
+async def test_if_schedules_rehash_when_hash_is_outdated(
+    mock_user_repo, mock_hasher, mock_user
+):
+    mock_user_repo.get_by_email.return_value = mock_user
+    mock_hasher.needs_update = MagicMock(return_value=True)
+    scheduler, rehash_password = MagicMock(), MagicMock()
+
+    use_case = AuthenticateUserUsecase(
+        user_repo=mock_user_repo,
+        hasher=mock_hasher,
+        scheduler=scheduler,
+        rehash_password=rehash_password,
+    )
+    await use_case.execute("test@test.com", "password")
+
+    scheduler.schedule.assert_called_once_with(
+        rehash_password.execute, str(mock_user.id), "password", mock_user.password.value
+    )
+
+
+async def test_if_does_not_schedule_rehash_when_hash_is_current(
+    mock_user_repo, mock_hasher, mock_user
+):
+    mock_user_repo.get_by_email.return_value = mock_user
+    mock_hasher.needs_update = MagicMock(return_value=False)
+    scheduler = MagicMock()
+
+    use_case = AuthenticateUserUsecase(
+        user_repo=mock_user_repo,
+        hasher=mock_hasher,
+        scheduler=scheduler,
+        rehash_password=MagicMock(),
+    )
+    await use_case.execute("test@test.com", "password")
+
+    scheduler.schedule.assert_not_called()
+
+
+async def test_if_rehashes_password(mock_user_uow, mock_hasher, mock_user):
+    mock_user_uow.user_repo.get_by_id.return_value = mock_user
+    mock_user_uow.user_repo.update_password = AsyncMock(return_value=True)
+    mock_hasher.hash.return_value = "new_hashed_password"
+
+    use_case = RehashPasswordUsecase(uow=mock_user_uow, hasher=mock_hasher)
+    result = await use_case.execute(str(mock_user.id), "password", mock_user.password.value)
+
+    assert result is True
+    mock_user_uow.user_repo.update_password.assert_called_once_with(
+        mock_user.id, Password("new_hashed_password")
+    )
+
+
+async def test_if_skips_rehash_when_password_changed_meanwhile(
+    mock_user_uow, mock_hasher, mock_user
+):
+    mock_user_uow.user_repo.get_by_id.return_value = mock_user
+    mock_user_uow.user_repo.update_password = AsyncMock()
+
+    use_case = RehashPasswordUsecase(uow=mock_user_uow, hasher=mock_hasher)
+    result = await use_case.execute(str(mock_user.id), "password", "stale_hashed_password")
+
+    assert result is False
+    mock_user_uow.user_repo.update_password.assert_not_called()
+
+
+async def test_if_authenticates_from_credential_cache(mock_user_repo, mock_hasher):
+    cached_user = UserResponse(id=str(uuid4()), name="Test", email="test@test.com")
+    credential_cache = MagicMock()
+    credential_cache.get.return_value = cached_user
+
+    use_case = AuthenticateUserUsecase(
+        user_repo=mock_user_repo, hasher=mock_hasher, credential_cache=credential_cache
+    )
+    result = await use_case.execute("test@test.com", "password")
+
+    assert result == cached_user
+    mock_user_repo.get_by_email.assert_not_called()
+    mock_hasher.verify.assert_not_called()
+
+
+async def test_if_caches_verified_credentials(mock_user_repo, mock_hasher, mock_user):
+    mock_user_repo.get_by_email.return_value = mock_user
+    credential_cache = MagicMock()
+    credential_cache.get.return_value = None
+
+    use_case = AuthenticateUserUsecase(
+        user_repo=mock_user_repo, hasher=mock_hasher, credential_cache=credential_cache
+    )
+    result = await use_case.execute("test@test.com", "password")
+
+    credential_cache.put.assert_called_once_with("test@test.com", "password", result)
+
+
+async def test_if_does_not_cache_rejected_credentials(mock_user_repo, mock_hasher, mock_user):
+    mock_user_repo.get_by_email.return_value = mock_user
+    mock_hasher.verify.return_value = False
+    credential_cache = MagicMock()
+    credential_cache.get.return_value = None
+
+    use_case = AuthenticateUserUsecase(
+        user_repo=mock_user_repo, hasher=mock_hasher, credential_cache=credential_cache
+    )
+
+    with pytest.raises(AuthenticationFailedError):
+        await use_case.execute("test@test.com", "password")
+
+    credential_cache.put.assert_not_called()
+
+
+async def test_if_invalidates_cached_credentials_on_update(mock_user_uow, mock_user):
+    mock_user_uow.user_repo.update_profile.return_value = user_response(mock_user)
+    credential_cache = MagicMock()
+
+    use_case = UpdateUserUsecase(uow=mock_user_uow, credential_cache=credential_cache)
+    await use_case.execute(str(mock_user.id), UpdateUser("changed"))
+
+    credential_cache.invalidate.assert_called_once_with(str(mock_user.id))
+
+
+async def test_if_invalidates_cached_credentials_on_delete(mock_user_uow):
+    mock_user_uow.user_repo.delete.return_value = True
+    credential_cache = MagicMock()
+    user_id = str(uuid4())
+
+    use_case = DeleteUserUsecase(uow=mock_user_uow, credential_cache=credential_cache)
+    await use_case.execute(user_id)
+
+    credential_cache.invalidate.assert_called_once_with(user_id)
+
+
+async def test_if_marks_user_version_stale_on_update(mock_user_uow, mock_user):
+    mock_user_uow.user_repo.update_profile.return_value = user_response(mock_user)
+    user_versions = MagicMock()
+
+    use_case = UpdateUserUsecase(uow=mock_user_uow, user_versions=user_versions)
+    await use_case.execute(str(mock_user.id), UpdateUser("changed"))
+
+    user_versions.bump.assert_called_once_with(str(mock_user.id))
+
+
+async def test_if_marks_user_version_stale_on_delete(mock_user_uow):
+    mock_user_uow.user_repo.delete.return_value = True
+    user_versions = MagicMock()
+    user_id = str(uuid4())
+
+    use_case = DeleteUserUsecase(uow=mock_user_uow, user_versions=user_versions)
+    await use_case.execute(user_id)
+
+    user_versions.bump.assert_called_once_with(user_id)